@@ -0,0 +1,209 @@
+from timeit import timeit
+from re import search
+import sys
+
+from lxml import html
+
+from src.infrastructure.parsers.personal import (
+    REGISTRY_ENCODING,
+    PersonalNaksCertificationExtractor, 
+    PersonalNaksCertificationMainPage, 
+    PersonalNaksCertificationMainPageData, 
+    PersonalNaksCertificationAdditionalPageData
+)
+
+
+def make_main_page_row(index: int) -> str:
+    return (
+        '<tr bgcolor="#ffffff">'
+        f'<td>Иванов Иван Иванович {index}</td><td><span>{index:04X}</span></td><td>ООО Компания {index % 7}, г. Москва</td><td>РД</td>'
+        f'<td>АЦСТ-{index}-{index:05}</td><td>{"В1" if index % 2 else " "}</td><td>I</td><td>НГДО</td>'
+        f'<td>01.02.2023</td><td>01.02.2026</td><td>{" " if index % 3 else "01.03.2025"}</td><td>РД</td>'
+        f"""<td><a href="#" onclick='open_modal("/registry/personal/detail.php?ID={index + 1000}","w");'>Подробно</a></td>"""
+        '</tr>'
+    )
+
+
+def make_main_page(rows: int) -> str:
+    return (
+        '<html><body><table class="tabl"><tr><th>ФИО</th></tr>'
+        + "".join(make_main_page_row(index) for index in range(rows))
+        + '</table><div class="modern-page-navigation"><a href="?PAGEN_1=2">2</a><a href="?PAGEN_1=40">40</a></div></body></html>'
+    )
+
+
+def make_additional_page() -> str:
+    return (
+        '<html><body><table>'
+        '<tr><td>Группы технических устройств опасных производственных объектов:</td><td>Котельное оборудование (1, 2, 3); Строительные конструкции (2)</td></tr>'
+        '<tr><td>Вид деталей</td><td>Т, Л [трубы, листы]</td></tr>'
+        '<tr><td>Типы швов</td><td>СШ, УШ</td></tr>'
+        '<tr><td>Группа свариваемого материала</td><td>M01, M03+M11</td></tr>'
+        '<tr><td>Толщина деталей, мм</td><td>от 2 до 10</td></tr>'
+        '<tr><td>Наружный диаметр, мм</td><td>свыше 25,5 до 100</td></tr>'
+        '</table><div class="modal-body"><p>Котельное оборудование</p></div></body></html>'
+    )
+
+
+class LegacyPersonalNaksCertificationExtractor(PersonalNaksCertificationExtractor):
+    def parse_main_page(self, main_page: str, encoding: str | None = None) -> PersonalNaksCertificationMainPage:
+        tree = self._get_tree(main_page)
+        result = []
+
+        trs: list[html.HtmlElement] = tree.xpath("//table[@class='tabl']//tr[@bgcolor]")
+
+        for tr in trs:
+            tr_tree = self._get_tree(self._to_string(tr))
+            result.append(
+                PersonalNaksCertificationMainPageData(
+                    kleymo=self._get_kleymo(tr_tree),
+                    name=self._get_name(tr_tree),
+                    company=self._get_company(tr_tree),
+                    certification_number=self._get_certification_number(tr_tree),
+                    insert=self._get_insert(tr_tree),
+                    certification_date=self._get_certification_date(tr_tree),
+                    expiration_date=self._get_expiration_date(tr_tree),
+                    expiration_date_fact=self._get_expiration_date_fact(tr_tree),
+                    method=self._get_method(tr_tree),
+                    additional_page_id=self._get_additional_page_id(tr_tree)
+                )
+            )
+        
+        return PersonalNaksCertificationMainPage(
+            rows=result,
+            pages_count=self._get_pages_count(tree)
+        )
+
+
+    def parse_additional_page(self, additional_page: str, encoding: str | None = None) -> PersonalNaksCertificationAdditionalPageData:
+        tree = self._get_tree(additional_page)
+        result = {}
+
+        for tr in tree.xpath("//tr"):
+            tr_tree = self._get_tree(self._to_string(tr))
+
+            tds = tr_tree.xpath("//td")
+
+            if len(tds) < 2:
+                continue
+
+            key = tds[0].text.strip()
+            value = " | ".join(td.text_content().strip() for td in tds[1:])
+
+            result[key] = value
+        
+
+        gtd = result.get("Группы технических устройств опасных производственных объектов:", "")
+
+        if gtd == "":
+            html = ""
+        else:
+            html = self._to_string(tree.xpath("//div[@class='modal-body']")[0]).replace(b"\n", b"").replace(b"\r", b"").replace(b"\t", b"").replace(b"\"", b"'")
+
+
+        return PersonalNaksCertificationAdditionalPageData(
+            gtd=gtd,
+            detail_types=result.get("Вид деталей"),
+            joint_types=result.get("Типы швов"),
+            materials=result.get("Группа свариваемого материала"),
+            detail_thikness_string=result.get("Толщина деталей, мм"),
+            outer_diameter_string=result.get("Наружный диаметр, мм"),
+            rod_diameter_string=result.get("Диаметр стержня, мм"),
+            detail_diameter_string=result.get("Диаметр деталей, мм"),
+            html=html
+        )
+
+
+    def _get_additional_page_id(self, tr_tree: html.HtmlElement) -> str:
+        result = tr_tree.xpath("//td[13]/a/@onclick")[0]
+
+        ident = search(r"\?ID=[\W\w]+\"", result).group()
+
+        return ident.split("ID=")[1].replace("\"", "").split(",")[0]
+
+
+    def _get_name(self, tr_tree: html.HtmlElement) -> str:
+
+        return tr_tree.xpath("//td[1]/text()")[0].strip()
+    
+
+    def _get_kleymo(self, tr_tree: html.HtmlElement) -> str:
+
+        return tr_tree.xpath("//td[2]/span/text()")[0].strip()
+    
+
+    def _get_company(self, tr_tree: html.HtmlElement) -> str:
+
+        return tr_tree.xpath("//td[3]/text()")[0].split(",")[0].strip()
+    
+
+    def _get_certification_number(self, tr_tree: html.HtmlElement) -> str:
+
+        return tr_tree.xpath("//td[5]/text()")[0].strip()
+    
+
+    def _get_insert(self, tr_tree: html.HtmlElement) -> str | None:
+
+        result = tr_tree.xpath("//td[6]/text()")[0].strip()
+
+        if not result:
+            return None
+        
+        return result
+    
+
+    def _get_certification_date(self, tr_tree: html.HtmlElement) -> str:
+
+        return tr_tree.xpath("//td[9]/text()")[0].strip()
+    
+
+    def _get_expiration_date(self, tr_tree: html.HtmlElement) -> str:
+
+        return tr_tree.xpath("//td[10]/text()")[0].strip()
+    
+
+    def _get_expiration_date_fact(self, tr_tree: html.HtmlElement) -> str:
+
+        exp_fact = tr_tree.xpath("//td[11]/text()")[0].strip()
+
+        if exp_fact:
+            return exp_fact
+        
+        return self._get_expiration_date(tr_tree)
+    
+
+    def _get_method(self, tr_tree: html.HtmlElement) -> str:
+
+        return tr_tree.xpath("//td[12]/text()")[0].strip()
+
+
+def main(rows: int = 200, repeat: int = 20) -> None:
+    main_page = make_main_page(rows)
+    additional_page = make_additional_page()
+
+    raw_main_page = main_page.encode(REGISTRY_ENCODING)
+    raw_additional_page = additional_page.encode(REGISTRY_ENCODING)
+
+    extractor = PersonalNaksCertificationExtractor()
+    legacy_extractor = LegacyPersonalNaksCertificationExtractor()
+
+    assert extractor.parse_main_page(raw_main_page) == legacy_extractor.parse_main_page(main_page)
+    assert extractor.parse_additional_page(raw_additional_page) == legacy_extractor.parse_additional_page(additional_page)
+
+    cases = [
+        ("legacy", lambda: legacy_extractor.parse_main_page(main_page), lambda: legacy_extractor.parse_additional_page(additional_page)),
+        ("single pass", lambda: extractor.parse_main_page(raw_main_page), lambda: extractor.parse_additional_page(raw_additional_page))
+    ]
+
+    for name, parse_main_page, parse_additional_page in cases:
+        main_seconds = timeit(parse_main_page, number=repeat)
+        additional_seconds = timeit(parse_additional_page, number=repeat * 10)
+
+        print(
+            f"{name:>12}: {rows * repeat / main_seconds:10.0f} main page rows/s, "
+            f"{repeat * 10 / additional_seconds:8.0f} additional pages/s"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
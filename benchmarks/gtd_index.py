@@ -0,0 +1,92 @@
+from functools import lru_cache
+from timeit import timeit
+from typing import Iterator
+import sys
+import re
+
+from src.utils.gtd_index import GtdIndex
+from src.utils.parse_utils import NORMALIZATION_CACHE_SIZE
+
+
+GTD_DATA = {
+    "КО": {"description": "Котельное оборудование"},
+    "ГО": {"description": "Газовое оборудование"},
+    "НГДО": {"description": "Нефтегазодобывающее оборудование"},
+    "ОХНВП": {"description": "Оборудование химических, нефтехимических, нефтеперерабатывающих и взрывопожароопасных производств"},
+    "ПТО": {"description": "Подъемно-транспортное оборудование"},
+    "СК": {"description": "Строительные конструкции"},
+    "МО": {"description": "Металлургическое оборудование"},
+    "ГДО": {"description": "Оборудование горнодобывающей промышленности"},
+    "ОТОГ": {"description": "Оборудование для транспортировки опасных грузов"},
+    "КСМ": {"description": "Конструкции стальных мостов"}
+}
+
+
+def legacy_gtd_description_short_dict(gtd_data: dict[str, dict]) -> dict[str, str]:
+    return {value["description"]: key  for key, value in gtd_data.items()}
+
+
+def legacy_parse_gtds(string: str, gtd_data: dict[str, dict]) -> Iterator[list[str] | None]:
+    strings = re.split(r"\),|\);", string)
+
+    gtd_short_data = legacy_gtd_description_short_dict(gtd_data)
+
+    for el in strings:
+        description, subgroups = el.split(" (")
+        gtd_short = gtd_short_data.get(description.strip())
+
+        if not gtd_short:
+            yield None
+
+        subgroups: list[int] = [int(el.strip()) for el in re.findall(r"[0-9]+", subgroups)]
+
+        yield [f"{gtd_short}({el})" for el in subgroups]
+
+
+def legacy_parse_gtd(string: str) -> list[str]:
+    result = []
+
+    for el in legacy_parse_gtds(string, GTD_DATA):
+        if not el:
+            continue
+
+        result += el
+
+    return result
+
+
+def make_gtd_strings(count: int) -> list[str]:
+    descriptions = [value["description"] for value in GTD_DATA.values()]
+
+    return [
+        "; ".join(
+            f"{descriptions[(index + shift) % len(descriptions)]} ({', '.join(str(subgroup) for subgroup in range(1, 2 + (index + shift) % 4))})"
+            for shift in range(1 + index % 3)
+        )
+        for index in range(count)
+    ]
+
+
+def main(records: int = 10000) -> None:
+    gtd_strings = make_gtd_strings(records)
+    index = GtdIndex.from_gtd_data(GTD_DATA)
+
+    assert [index.parse(el) for el in gtd_strings] == [legacy_parse_gtd(el) for el in gtd_strings]
+
+    cases = [
+        ("legacy", legacy_parse_gtd),
+        ("gtd index", index.parse),
+        ("memoized", lru_cache(maxsize=NORMALIZATION_CACHE_SIZE)(index.parse))
+    ]
+
+    # the memoized case only measures repeated values, the speedup depends on how often real records repeat them
+    print(f"{records} records, {len(set(gtd_strings))} distinct gtd strings")
+
+    for name, parse in cases:
+        seconds = timeit(lambda: [parse(el) for el in gtd_strings], number=1)
+
+        print(f"{name:>10}: {seconds / records * 1e6:6.2f} us per record, {records / seconds:8.0f} records/s")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -1,10 +1,12 @@
 from src.main.app import cli
 from src.presentation.commands.auth import auth_group
 from src.presentation.commands.parse_naks import parse_group
+from src.presentation.commands.query import query_group
 
 
 cli.add_command(auth_group)
 cli.add_command(parse_group)
+cli.add_command(query_group)
 
 
 if __name__ == "__main__":
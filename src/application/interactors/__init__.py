@@ -1,2 +1,9 @@
 from src.application.interactors.auth import LoginInteractor
-from src.application.interactors.parse_naks import ParsePersonalNaksCertificationsInteractor
\ No newline at end of file
+from src.application.interactors.parse_naks import (
+    ParsePersonalNaksCertificationsInteractor, 
+    AsyncParsePersonalNaksCertificationsInteractor, 
+    PipelineParsePersonalNaksCertificationsInteractor
+)
+from src.application.interactors.mirror import SyncPersonalNaksCertificationsMirrorInteractor
+from src.application.interactors.expiring import ParseExpiringPersonalNaksCertificationsInteractor
+from src.application.interactors.planned import PlannedParsePersonalNaksCertificationsInteractor
\ No newline at end of file
@@ -0,0 +1,48 @@
+from dataclasses import replace
+from datetime import date
+
+from click import echo
+
+from src.application.interactors.parse_naks import ParsePersonalNaksCertificationsInteractor
+from src.infrastructure.dto import SearchNaksCertificationItem, PersonalNaksCertificationData
+from src.infrastructure.parsers.base import ParseContext
+from src.infrastructure.parsers.personal import REGISTRY_DATE_FORMAT, PersonalNaksCertificationMainPageData
+
+
+class CompanyRowFilter:
+    def __init__(self, company: str) -> None:
+        self.company = company.lower()
+
+
+    def __call__(self, search_item: SearchNaksCertificationItem, row: PersonalNaksCertificationMainPageData) -> bool:
+        return self.company in row.company.lower()
+
+
+class ParseExpiringPersonalNaksCertificationsInteractor:
+    def __init__(self, parse: ParsePersonalNaksCertificationsInteractor) -> None:
+        self.parse = parse
+
+
+    def __call__(
+        self, 
+        search_item: SearchNaksCertificationItem, 
+        date_from: date, 
+        date_before: date, 
+        context: ParseContext, 
+        company: str = ""
+    ) -> list[PersonalNaksCertificationData]:
+        search_item = replace(
+            search_item,
+            date_active_to_from=date_from.strftime(REGISTRY_DATE_FORMAT),
+            date_active_to_before=date_before.strftime(REGISTRY_DATE_FORMAT)
+        )
+
+        if company:
+            # registry search form has no company field, rows are filtered before detail pages are requested
+            context.row_filter = CompanyRowFilter(company)
+
+        result = self.parse([search_item], context)
+
+        echo(f"{len(result)} certifications expire between {date_from.isoformat()} and {date_before.isoformat()}")
+
+        return result
@@ -0,0 +1,100 @@
+from datetime import date, datetime, timedelta
+from threading import Lock
+
+from click import echo
+
+from src.application.interactors.parse_naks import ParsePersonalNaksCertificationsInteractor
+from src.application.interfaces.certification_store import IPersonalNaksCertificationStore
+from src.infrastructure.dto import PersonalNaksCertificationData, SearchNaksCertificationItem
+from src.infrastructure.parsers.base import ParseContext
+from src.infrastructure.parsers.personal import PersonalNaksCertificationMainPageData, REGISTRY_DATE_FORMAT
+
+
+class MirrorPageWriter:
+
+    def __init__(self, store: IPersonalNaksCertificationStore) -> None:
+        self.store = store
+        self.changed = 0
+
+        self._lock = Lock()
+
+
+    def __call__(self, certifications: list[PersonalNaksCertificationData]) -> None:
+        with self._lock:
+            self.changed += self.store.upsert(certifications)
+
+
+class SyncPersonalNaksCertificationsMirrorInteractor:
+    def __init__(self, parse: ParsePersonalNaksCertificationsInteractor) -> None:
+        self.parse = parse
+
+
+    def __call__(self, store: IPersonalNaksCertificationStore, context: ParseContext, k: int = 1, full: bool = False) -> int:
+        sync_date = date.today()
+        watermark = store.get_watermark()
+
+        if full or watermark is None:
+            search_items = [SearchNaksCertificationItem()]
+        else:
+            search_items = self._get_incremental_search_items(watermark)
+
+        writer = MirrorPageWriter(store)
+        context.contain_failures = True
+        context.on_page = writer
+
+        certifications = self.parse(search_items, context, k)
+
+        for search_item, page, error in context.failed_pages:
+            echo(f"page {page} failed: {search_item} ({error})", err=True)
+
+        for row, error in context.failed_rows:
+            echo(f"detail page failed: {row.certification_number} ({error})", err=True)
+
+        fetched = f"{len(certifications)} fetched, {writer.changed} created or updated"
+
+        if not (context.failed_items or context.failed_pages or context.failed_rows):
+            store.set_watermark(sync_date)
+            store.commit()
+            echo(f"mirror synced: {fetched}, watermark {sync_date.isoformat()}")
+
+            return writer.changed
+
+        held_back = None
+
+        if not (context.failed_items or context.failed_pages):
+            held_back = self._get_held_back_watermark([row for row, _ in context.failed_rows], watermark, sync_date)
+
+        if held_back:
+            store.set_watermark(held_back)
+            echo(f"mirror partially synced: {fetched}, {len(context.failed_rows)} detail pages failed, watermark {held_back.isoformat()} to request them again")
+        else:
+            echo(f"mirror partially synced: {fetched}, watermark is kept because of failed requests")
+
+        store.commit()
+
+        return writer.changed
+
+
+    def _get_incremental_search_items(self, watermark: date) -> list[SearchNaksCertificationItem]:
+        # registry date filters are day precise, one more day is requested to not miss records added around the last sync
+        since = (watermark - timedelta(days=1)).strftime(REGISTRY_DATE_FORMAT)
+
+        return [
+            SearchNaksCertificationItem(date_create_from=since),
+            SearchNaksCertificationItem(date_active_from_from=since)
+        ]
+
+
+    def _get_held_back_watermark(
+        self,
+        failed_rows: list[PersonalNaksCertificationMainPageData],
+        watermark: date | None,
+        sync_date: date
+    ) -> date | None:
+        try:
+            dates = [datetime.strptime(row.certification_date, REGISTRY_DATE_FORMAT).date() for row in failed_rows]
+        except ValueError:
+            return None
+
+        # a failed row is found again either by the old watermark searches or by its certification date
+        return min(sync_date, *(max(el, watermark) if watermark else el for el in dates))
@@ -1,5 +1,7 @@
-from threading import Thread, active_count
-from time import sleep
+from threading import Lock, active_count
+from functools import partial
+from typing import Any, Callable, Hashable, Iterable
+from asyncio import run
 
 from rich.progress import (
     Progress, 
@@ -14,28 +16,47 @@ from rich.progress import (
 )
 from rich.text import Text
 from rich.table import Column
+from click import echo
 
-from src.application.interfaces.naks_parser import INaksParser
+from src.application.interfaces.naks_parser import INaksParser, IAsyncNaksParser
+from src.application.interfaces.parse_journal import IParseJournal
+from src.application.interfaces.result_sink import IResultSink
 from src.infrastructure.dto import SearchNaksCertificationItem, PersonalNaksCertificationData
-from src.infrastructure.parsers.personal import PersonalNaksCertificationParser
-from src.utils.queue import ProgressQueue, StoreQueue
+from src.infrastructure.parsers.base import ParseContext
+from src.infrastructure.parsers.personal import (
+    PersonalNaksCertificationParser, 
+    AsyncPersonalNaksCertificationParser, 
+    PersonalNaksCertificationPipelineParser
+)
+from src.utils.concurrency import AIMDConcurrencyController
+from src.utils.scheduler import AsyncWorkScheduler, WorkFailure, WorkScheduler
+from src.utils.pipeline import Pipeline, Stage
 from src.config import ApplicationConfig
 
 
+def active_threads_count() -> int:
+    return active_count() - 2
+
+
 class ThreadsMountColumn(ProgressColumn):
-    def __init__(self, total_threads: int, table_column: Column | None = None) -> None:
+    def __init__(self, total_threads: int, active_workers: Callable[[], int] = active_threads_count, table_column: Column | None = None) -> None:
         self.total_threads = total_threads
+        self.active_workers = active_workers
         super().__init__(table_column)
 
     
     def render(self, task: Task) -> Text:
         return Text(
-            f"{active_count() - 2}/{self.total_threads}",
+            f"{self.active_workers()}/{self.total_threads}",
             style="progress.download",
         )
 
 
-def dump_progress_and_task_id(total: int, total_threads: int) -> tuple[Progress | None, TaskID | None]:
+def dump_progress_and_task_id(
+    total: int, 
+    total_threads: int, 
+    active_workers: Callable[[], int] = active_threads_count
+) -> tuple[Progress | None, TaskID | None]:
     if ApplicationConfig.MODE() == "TEST":
         return None, None
 
@@ -48,7 +69,7 @@ def dump_progress_and_task_id(total: int, total_threads: int) -> tuple[Progress
         TimeElapsedColumn(),
         "/",
         TimeRemainingColumn(),
-        ThreadsMountColumn(total_threads)
+        ThreadsMountColumn(total_threads, active_workers)
     )
     progress = Progress(*progress_columns)
     progress.start()
@@ -57,58 +78,272 @@ def dump_progress_and_task_id(total: int, total_threads: int) -> tuple[Progress
     return progress, task
 
 
+def advance_progress(progress: Progress | None, task_id: TaskID | None) -> None:
+    if progress:
+        progress.update(task_id=task_id, advance=1)
+
+
+def echo_failures[T](failures: list[WorkFailure[T]], worker_errors: list[Exception], resumable: bool = False) -> None:
+    for error in worker_errors:
+        echo(f"worker failed to start: {error}", err=True)
+
+    if not failures:
+        return
+
+    for failure in failures:
+        echo(f"search item failed: {failure.item} ({failure.error})", err=True)
+
+    if resumable:
+        echo(f"{len(failures)} search items failed, they are not marked completed and are retried by --resume", err=True)
+    else:
+        echo(f"{len(failures)} search items failed", err=True)
+
+
+class ResultCollector[K]:
+
+    def __init__(self, key: Callable[[K], Hashable], sink: IResultSink[K] | None = None) -> None:
+        self.key = key
+        self.sink = sink
+        self.results: list[K] = []
+
+        self._seen: set[Hashable] = set()
+        self._lock = Lock()
+
+
+    def add(self, results: Iterable[K]) -> None:
+        with self._lock:
+            for result in results:
+                result_key = self.key(result)
+
+                if result_key in self._seen:
+                    continue
+
+                self._seen.add(result_key)
+
+                if self.sink:
+                    self.sink.write(result)
+                else:
+                    self.results.append(result)
+
+
 class BaseParseInteractor[T, K]:
 
-    def __call__(self, search_items: list[T], k: int = 1) -> list[K]:
-        progress, task_id = dump_progress_and_task_id(total=len(search_items), total_threads=k)
+    def __call__(
+        self, 
+        search_items: list[T], 
+        context: ParseContext, 
+        k: int = 1, 
+        controller: AIMDConcurrencyController | None = None,
+        journal: IParseJournal[T, K] | None = None,
+        sink: IResultSink[K] | None = None
+    ) -> list[K]:
+        collector = ResultCollector(self._get_result_key, sink)
+
+        if journal:
+            search_items = [search_item for search_item in search_items if not journal.is_completed(search_item)]
+            collector.add(journal.get_completed_results())
 
-        src_queue: ProgressQueue[T] = ProgressQueue(
-            progress=progress,
-            task=task_id
+        if controller:
+            k = controller.max_limit
+
+        scheduler: WorkScheduler[T] = WorkScheduler(k, on_result=partial(self.save, collector=collector, journal=journal))
+
+        progress, task_id = dump_progress_and_task_id(
+            total=len(search_items), 
+            total_threads=k, 
+            active_workers=(lambda: controller.active) if controller else (lambda: scheduler.active)
         )
-        result_queue: StoreQueue[K] = StoreQueue()
+        scheduler.on_completed = lambda _: advance_progress(progress, task_id)
+
+        scheduler.run(search_items, lambda: partial(self.execute, self._init_parser(context)))
+
+        if progress:
+            progress.stop()
+
+        context.failed_items += len(scheduler.failures)
+        echo_failures(scheduler.failures, scheduler.worker_errors, journal is not None)
+
+        if controller:
+            echo(f"concurrency settled at {controller.limit} (pass --threads {controller.limit} to start the next run from it)")
+
+        return collector.results
+    
+
+    def execute(self, parser: INaksParser[T, K], search_item: T) -> list[K]: 
+        return parser.parse(search_item)
+
+
+    def save(self, search_item: T, parse_result: list[K], collector: ResultCollector[K], journal: IParseJournal[T, K] | None = None) -> None:
+        if journal:
+            journal.append(search_item, parse_result)
+
+        collector.add(parse_result)
+
+
+    def _init_parser(self, context: ParseContext) -> INaksParser[T, K]: ...
+
+
+    def _get_result_key(self, result: K) -> Hashable: ...
+
+
+class BaseAsyncParseInteractor[T, K]:
 
-        for search_item in search_items:
-            src_queue.put(search_item)
+    def __call__(
+        self, 
+        search_items: list[T], 
+        context: ParseContext, 
+        k: int = 1, 
+        max_in_flight: int = 100, 
+        journal: IParseJournal[T, K] | None = None,
+        sink: IResultSink[K] | None = None
+    ) -> list[K]:
+        return run(self._run(search_items, context, k, max_in_flight, journal, sink))
 
-        threads: list[Thread] = []
 
-        for _ in range(k):
-            thread = Thread(target=self.execute, args=(src_queue, result_queue,))
-            thread.start()
+    async def _run(
+        self, 
+        search_items: list[T], 
+        context: ParseContext, 
+        k: int, 
+        max_in_flight: int, 
+        journal: IParseJournal[T, K] | None,
+        sink: IResultSink[K] | None
+    ) -> list[K]:
+        collector = ResultCollector(self._get_result_key, sink)
 
-            threads.append(thread)
+        if journal:
+            search_items = [search_item for search_item in search_items if not journal.is_completed(search_item)]
+            collector.add(journal.get_completed_results())
 
-        for thread in threads:
-            thread.join()
-        
-        sleep(.1)
+        scheduler: AsyncWorkScheduler[T] = AsyncWorkScheduler(k, on_result=partial(self.save, collector=collector, journal=journal))
+
+        progress, task_id = dump_progress_and_task_id(
+            total=len(search_items), 
+            total_threads=k, 
+            active_workers=lambda: scheduler.active
+        )
+        scheduler.on_completed = lambda _: advance_progress(progress, task_id)
+
+        async with self._init_parser(context, max_in_flight) as parser:
+            await scheduler.run(search_items, partial(self.execute, parser))
 
         if progress:
             progress.stop()
 
-        result: list[K] = []
+        context.failed_items += len(scheduler.failures)
+        echo_failures(scheduler.failures, scheduler.worker_errors, journal is not None)
 
-        for _ in range(result_queue.qsize()):
-            result += result_queue.get_nowait()
+        return collector.results
 
-        return result
-    
 
-    def execute(self, src_queue: ProgressQueue[T], store_queue: StoreQueue[K]): 
-        parser = self._init_parser()
+    async def execute(self, parser: IAsyncNaksParser[T, K], search_item: T) -> list[K]:
+        return await parser.parse(search_item)
+
+
+    def save(self, search_item: T, parse_result: list[K], collector: ResultCollector[K], journal: IParseJournal[T, K] | None = None) -> None:
+        if journal:
+            journal.append(search_item, parse_result)
+
+        collector.add(parse_result)
+
+
+    def _init_parser(self, context: ParseContext, max_in_flight: int) -> IAsyncNaksParser[T, K]: ...
+
+
+    def _get_result_key(self, result: K) -> Hashable: ...
+
+
+class BasePipelineParseInteractor[T, K]:
+    default_stage_workers: dict[str, int] = {}
+
+    def __call__(
+        self, 
+        search_items: list[T], 
+        context: ParseContext, 
+        stage_workers: dict[str, int] | None = None, 
+        queue_size: int = 100,
+        sink: IResultSink[K] | None = None
+    ) -> list[K]:
+        collector = ResultCollector(self._get_result_key, sink)
+        workers = self.default_stage_workers | (stage_workers or {})
+
+        handlers = [*self._get_stage_handlers(self._init_parser(context)), ("sink", partial(self._collect, collector))]
+        pipeline = Pipeline([Stage(name, handle, workers[name], queue_size) for name, handle in handlers])
+
+        pipeline.run(search_items)
+
+        for line in pipeline.summary():
+            echo(line)
+
+        failures = pipeline.get_failures()
+        context.failed_items += len(failures)
+
+        for stage_name, _, error in failures:
+            echo(f"{stage_name} stage failed: {error}", err=True)
+
+        return collector.results
 
-        while not src_queue.empty():
-            value = src_queue.get_nowait()
 
-            parse_result = parser.parse(value)
+    def _collect(self, collector: ResultCollector[K], result: K) -> tuple[()]:
+        collector.add([result])
 
-            store_queue.put(parse_result)
+        return ()
 
-    def _init_parser(self) -> INaksParser[T, K]: ...
+
+    def _init_parser(self, context: ParseContext) -> Any: ...
+
+
+    def _get_stage_handlers(self, parser: Any) -> list[tuple[str, Callable[[Any], Iterable[Any]]]]: ...
+
+
+    def _get_result_key(self, result: K) -> Hashable: ...
 
 
 class ParsePersonalNaksCertificationsInteractor(BaseParseInteractor[SearchNaksCertificationItem, PersonalNaksCertificationData]):
 
-    def _init_parser(self) -> PersonalNaksCertificationParser:
-        return PersonalNaksCertificationParser()
+    def _init_parser(self, context: ParseContext) -> PersonalNaksCertificationParser:
+        return PersonalNaksCertificationParser(context)
+
+
+    def _get_result_key(self, result: PersonalNaksCertificationData) -> str:
+        return result.certification_number
+
+
+class AsyncParsePersonalNaksCertificationsInteractor(BaseAsyncParseInteractor[SearchNaksCertificationItem, PersonalNaksCertificationData]):
+
+    def _init_parser(self, context: ParseContext, max_in_flight: int) -> AsyncPersonalNaksCertificationParser:
+        return AsyncPersonalNaksCertificationParser(context, max_in_flight)
+
+
+    def _get_result_key(self, result: PersonalNaksCertificationData) -> str:
+        return result.certification_number
+
+
+class PipelineParsePersonalNaksCertificationsInteractor(BasePipelineParseInteractor[SearchNaksCertificationItem, PersonalNaksCertificationData]):
+    default_stage_workers = {
+        "search": 1,
+        "main_fetch": 4,
+        "row_extract": 1,
+        "detail_fetch": 8,
+        "detail_extract": 2,
+        "validate": 1,
+        "sink": 1
+    }
+
+    def _init_parser(self, context: ParseContext) -> PersonalNaksCertificationPipelineParser:
+        return PersonalNaksCertificationPipelineParser(context)
+
+
+    def _get_stage_handlers(self, parser: PersonalNaksCertificationPipelineParser) -> list[tuple[str, Callable[[Any], Iterable[Any]]]]:
+        return [
+            ("search", parser.search),
+            ("main_fetch", parser.fetch_main_page),
+            ("row_extract", parser.extract_rows),
+            ("detail_fetch", parser.fetch_detail),
+            ("detail_extract", parser.extract_detail),
+            ("validate", parser.validate)
+        ]
+
+
+    def _get_result_key(self, result: PersonalNaksCertificationData) -> str:
+        return result.certification_number
@@ -0,0 +1,52 @@
+from operator import attrgetter
+
+from click import echo
+
+from src.application.interactors.parse_naks import ParsePersonalNaksCertificationsInteractor
+from src.application.planners import PersonalNaksSearchPlanner, PlannedSearchRowFilter
+from src.infrastructure.dto import SearchNaksCertificationItem, PersonalNaksCertificationData
+from src.infrastructure.parsers.base import ParseContext
+from src.utils.concurrency import AIMDConcurrencyController
+from src.utils.funcs import iter_unique
+
+
+class PlannedParsePersonalNaksCertificationsInteractor:
+    def __init__(self, parse: ParsePersonalNaksCertificationsInteractor, planner: PersonalNaksSearchPlanner) -> None:
+        self.parse = parse
+        self.planner = planner
+
+
+    def __call__(
+        self, 
+        search_items: list[SearchNaksCertificationItem], 
+        context: ParseContext, 
+        k: int = 1, 
+        controller: AIMDConcurrencyController | None = None
+    ) -> list[PersonalNaksCertificationData]:
+        plan = self.planner.plan(search_items)
+        row_filter = PlannedSearchRowFilter()
+
+        context.row_filter = row_filter
+        context.page_limit = row_filter.limit_pages
+
+        result = self.parse([*plan.queries, *plan.narrow], context, k, controller)
+
+        unresolved = row_filter.get_unresolved(plan.queries)
+
+        context.row_filter = None
+        context.page_limit = None
+
+        if unresolved:
+            result = list(iter_unique(result + self.parse(unresolved, context, k, controller), attrgetter("certification_number")))
+
+        main_requests = context.requests_count["main"]
+        saved = len(search_items) - main_requests
+
+        echo(
+            f"planner: {len(search_items)} search items -> {len(plan.queries)} broad and {len(plan.narrow)} narrow queries, "
+            f"{len(row_filter.abandoned)} broad queries abandoned after the first page, {len(unresolved)} fallback queries, "
+            f"{main_requests} main page requests "
+            + (f"({saved} saved)" if saved >= 0 else f"({-saved} more than one per search item because of paginated results)")
+        )
+
+        return result
@@ -0,0 +1,21 @@
+from datetime import date
+from typing import Iterable, Protocol
+
+from src.infrastructure.dto import PersonalNaksCertificationData
+
+
+class IPersonalNaksCertificationStore(Protocol):
+
+    def get(self, certification_number: str) -> PersonalNaksCertificationData | None: ...
+
+
+    def upsert(self, certifications: Iterable[PersonalNaksCertificationData]) -> int: ...
+
+
+    def get_watermark(self) -> date | None: ...
+
+
+    def set_watermark(self, value: date) -> None: ...
+
+
+    def commit(self) -> None: ...
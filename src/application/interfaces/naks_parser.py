@@ -4,3 +4,14 @@ from typing import Protocol
 class INaksParser[T, K](Protocol):
 
     def parse(self, search_items: list[T]) -> list[K]: ...
+
+
+class IAsyncNaksParser[T, K](Protocol):
+
+    async def __aenter__(self) -> "IAsyncNaksParser[T, K]": ...
+
+
+    async def __aexit__(self, *args) -> None: ...
+
+
+    async def parse(self, search_item: T) -> list[K]: ...
@@ -0,0 +1,12 @@
+from typing import Protocol
+
+
+class IParseJournal[T, K](Protocol):
+
+    def is_completed(self, search_item: T) -> bool: ...
+
+
+    def get_completed_results(self) -> list[K]: ...
+
+
+    def append(self, search_item: T, result: list[K]) -> None: ...
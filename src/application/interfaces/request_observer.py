@@ -0,0 +1,9 @@
+from typing import ContextManager, Protocol
+
+
+class IRequestObserver(Protocol):
+
+    def slot(self) -> ContextManager[None]: ...
+
+
+    def observe(self, latency: float, ok: bool) -> None: ...
@@ -0,0 +1,12 @@
+from pathlib import Path
+from typing import Protocol
+
+
+class IResultSink[K](Protocol):
+    path: Path
+    written: int
+
+    def write(self, result: K) -> None: ...
+
+
+    def close(self) -> None: ...
@@ -0,0 +1 @@
+from src.application.planners.search_items import PersonalNaksSearchPlanner, PlannedSearchRowFilter, PlannedSearchNaksCertificationItem, SearchPlan
@@ -0,0 +1,145 @@
+from dataclasses import dataclass, field
+from threading import Lock
+
+from src.infrastructure.dto import SearchNaksCertificationItem
+from src.infrastructure.parsers.personal import PersonalNaksCertificationMainPageData
+
+
+__all__ = [
+    "PersonalNaksSearchPlanner",
+    "PlannedSearchRowFilter",
+    "PlannedSearchNaksCertificationItem",
+    "SearchPlan"
+]
+
+
+@dataclass
+class PlannedSearchNaksCertificationItem(SearchNaksCertificationItem):
+    targets: list[SearchNaksCertificationItem] = field(default_factory=list)
+
+
+@dataclass
+class SearchPlan:
+    queries: list[PlannedSearchNaksCertificationItem]
+    narrow: list[SearchNaksCertificationItem]
+
+
+def is_row_matching(search_item: SearchNaksCertificationItem, row: PersonalNaksCertificationMainPageData) -> bool:
+    if search_item.kleymo and search_item.kleymo.lower() != (row.kleymo or "").lower():
+        return False
+
+    if search_item.name and search_item.name.lower() not in row.name.lower():
+        return False
+
+    if search_item.cert_number and search_item.cert_number.lower() not in row.certification_number.lower():
+        return False
+
+    return True
+
+
+class PlannedSearchRowFilter:
+    def __init__(self) -> None:
+        self.resolved: set[int] = set()
+        self.abandoned: set[int] = set()
+        self._lock = Lock()
+
+
+    def __call__(self, search_item: SearchNaksCertificationItem, row: PersonalNaksCertificationMainPageData) -> bool:
+        if not isinstance(search_item, PlannedSearchNaksCertificationItem):
+            return True
+
+        matched = [id(target) for target in search_item.targets if is_row_matching(target, row)]
+
+        if not matched:
+            return False
+
+        with self._lock:
+            self.resolved.update(matched)
+
+        return True
+
+
+    def limit_pages(self, search_item: SearchNaksCertificationItem, pages_count: int) -> int:
+        if not isinstance(search_item, PlannedSearchNaksCertificationItem):
+            return pages_count
+
+        # the rest of a broad query costs more than a narrow query per target, targets are searched narrowly instead
+        if pages_count - 1 > len(search_item.targets):
+            with self._lock:
+                self.abandoned.add(id(search_item))
+
+            return 1
+
+        return pages_count
+
+
+    def get_unresolved(self, queries: list[PlannedSearchNaksCertificationItem]) -> list[SearchNaksCertificationItem]:
+        return [
+            target 
+            for query in queries 
+            for target in query.targets 
+            if id(query) in self.abandoned or id(target) not in self.resolved
+        ]
+
+
+class PersonalNaksSearchPlanner:
+    def __init__(self, kleymo_prefix_length: int = 3, min_group_size: int = 2) -> None:
+        self.kleymo_prefix_length = kleymo_prefix_length
+        self.min_group_size = min_group_size
+
+
+    def plan(self, search_items: list[SearchNaksCertificationItem]) -> SearchPlan:
+        groups: dict[tuple[str, str, str, str], list[SearchNaksCertificationItem]] = {}
+        narrow: list[SearchNaksCertificationItem] = []
+
+        for search_item in search_items:
+            key = self._get_group_key(search_item)
+
+            if key is None:
+                narrow.append(search_item)
+            else:
+                groups.setdefault(key, []).append(search_item)
+
+        queries: list[PlannedSearchNaksCertificationItem] = []
+
+        for (field_name, value, cert_abbr, cert_lvl), targets in groups.items():
+            if len(targets) < self.min_group_size:
+                narrow += targets
+                continue
+
+            queries.append(
+                PlannedSearchNaksCertificationItem(
+                    **{field_name: value},
+                    cert_abbr=cert_abbr,
+                    cert_lvl=cert_lvl,
+                    targets=targets
+                )
+            )
+
+        return SearchPlan(queries=queries, narrow=narrow)
+
+
+    def _get_group_key(self, search_item: SearchNaksCertificationItem) -> tuple[str, str, str, str] | None:
+        if search_item.cert_number or self._has_date_filters(search_item):
+            return None
+
+        if search_item.kleymo and not search_item.name and len(search_item.kleymo) > self.kleymo_prefix_length:
+            return ("kleymo", search_item.kleymo[:self.kleymo_prefix_length].upper(), search_item.cert_abbr, search_item.cert_lvl)
+
+        if search_item.name and not search_item.kleymo:
+            return ("name", search_item.name.split()[0], search_item.cert_abbr, search_item.cert_lvl)
+
+        return None
+
+
+    def _has_date_filters(self, search_item: SearchNaksCertificationItem) -> bool:
+        return any(
+            [
+                search_item.date_create_from,
+                search_item.date_create_before,
+                search_item.date_active_from_from,
+                search_item.date_active_from_before,
+                search_item.date_active_to_from,
+                search_item.date_active_to_before
+            ]
+        )
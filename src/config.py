@@ -48,3 +48,23 @@ class ApplicationConfig:
     @classmethod
     def WELDER_REGISTRY_PATH(cls) -> Path:
         return Path(f"{cls.STATIC_DIR()}/welder_registry.xlsx")
+
+
+    @classmethod
+    def PERSONAL_NAKS_MIRROR_PATH(cls) -> Path:
+        return Path(f"{cls.STATIC_DIR()}/mirror/personal_naks_certifications.json")
+
+
+    @classmethod
+    def PERSONAL_NAKS_STORE_PATH(cls) -> Path:
+        return Path(f"{cls.STATIC_DIR()}/store/personal_naks_certifications.sqlite3")
+
+
+    @classmethod
+    def GTD_DATA_PATH(cls) -> Path:
+        return Path(f"{cls.STATIC_DIR()}/data/gtd_data.json")
+
+
+    @classmethod
+    def HTTP_CACHE_PATH(cls) -> Path:
+        return Path(f"{cls.STATIC_DIR()}/cache/http_cache.sqlite3")
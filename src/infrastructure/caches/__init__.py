@@ -0,0 +1 @@
+from src.infrastructure.caches.page_cache import SqlitePageCache
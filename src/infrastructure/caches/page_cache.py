@@ -0,0 +1,155 @@
+from collections import Counter
+from datetime import timedelta
+from threading import Lock
+from pathlib import Path
+from time import time
+import sqlite3
+
+from src.infrastructure.parsers.base import NaksPage
+
+
+__all__ = [
+    "SqlitePageCache"
+]
+
+
+SCHEMA_VERSION = 2
+
+SCHEMA = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+
+CREATE TABLE IF NOT EXISTS pages (
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    content BLOB NOT NULL,
+    encoding TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (kind, key)
+);
+
+CREATE INDEX IF NOT EXISTS pages_accessed_at ON pages (accessed_at);
+"""
+
+
+class SqlitePageCache:
+
+    def __init__(self, path: Path, ttls: dict[str, timedelta], max_size: int) -> None:
+        self.path = path
+        self.ttls = ttls
+        self.max_size = max_size
+
+        self.hits: Counter[str] = Counter()
+        self.misses: Counter[str] = Counter()
+        self.revalidated: Counter[str] = Counter()
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._migrate()
+        self._size: int = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM pages").fetchone()[0]
+
+
+    def get(self, kind: str, key: str) -> NaksPage | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT content, encoding, etag, last_modified, stored_at FROM pages WHERE kind = ? AND key = ?", 
+                (kind, key)
+            ).fetchone()
+
+            if row is None or self._is_expired(kind, row[4]):
+                self.misses[kind] += 1
+                return None
+
+            self._connection.execute("UPDATE pages SET accessed_at = ? WHERE kind = ? AND key = ?", (time(), kind, key))
+            self.hits[kind] += 1
+
+            return NaksPage(content=row[0], encoding=row[1], etag=row[2], last_modified=row[3])
+
+
+    def get_stale(self, kind: str, key: str) -> NaksPage | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT content, encoding, etag, last_modified FROM pages WHERE kind = ? AND key = ? AND (etag IS NOT NULL OR last_modified IS NOT NULL)", 
+                (kind, key)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        return NaksPage(content=row[0], encoding=row[1], etag=row[2], last_modified=row[3])
+
+
+    def set(self, kind: str, key: str, page: NaksPage) -> None:
+        now = time()
+
+        with self._lock:
+            old_row = self._connection.execute("SELECT size FROM pages WHERE kind = ? AND key = ?", (kind, key)).fetchone()
+
+            self._connection.execute(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (kind, key, page.content, page.encoding, page.etag, page.last_modified, len(page.content), now, now)
+            )
+
+            self._size += len(page.content) - (old_row[0] if old_row else 0)
+
+            if self._size > self.max_size:
+                self._evict()
+
+
+    def refresh(self, kind: str, key: str) -> None:
+        now = time()
+
+        with self._lock:
+            self._connection.execute("UPDATE pages SET stored_at = ?, accessed_at = ? WHERE kind = ? AND key = ?", (now, now, kind, key))
+            self.revalidated[kind] += 1
+
+
+    def summary(self) -> str:
+        kinds = sorted(set(self.hits) | set(self.misses))
+
+        if not kinds:
+            return "http cache: not used"
+
+        parts = []
+
+        for kind in kinds:
+            total = self.hits[kind] + self.misses[kind]
+            parts.append(f"{kind} {self.hits[kind]}/{total} hits ({self.hits[kind] / total:.0%}), {self.revalidated[kind]} revalidated")
+
+        return f"http cache: {', '.join(parts)}; {self._size / 2 ** 20:.1f} MB on disk"
+
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+    def _migrate(self) -> None:
+        if self._connection.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            self._connection.execute("DROP TABLE IF EXISTS pages")
+
+        self._connection.executescript(SCHEMA)
+        self._connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+
+    def _is_expired(self, kind: str, stored_at: float) -> bool:
+        return stored_at + self.ttls[kind].total_seconds() < time()
+
+
+    def _evict(self) -> None:
+        evicted: list[tuple[str, str]] = []
+
+        for kind, key, size in self._connection.execute("SELECT kind, key, size FROM pages ORDER BY accessed_at"):
+            if self._size <= self.max_size:
+                break
+
+            evicted.append((kind, key))
+            self._size -= size
+
+        self._connection.executemany("DELETE FROM pages WHERE kind = ? AND key = ?", evicted)
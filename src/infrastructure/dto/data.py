@@ -1,7 +1,6 @@
 from datetime import datetime, timedelta, date
 from dataclasses import dataclass
 import typing as t
-import re
 
 from pydantic import BaseModel, Field, model_validator, computed_field, field_validator
 from naks_library.utils.validators import (
@@ -11,7 +10,7 @@ from naks_library.utils.validators import (
     before_date_validator
 )
 
-from src.utils.parse_utils import parse_gtds, parse_list_data, get_from_value_or_none, get_before_value_or_none
+from src.utils.parse_utils import parse_gtd, parse_list_data, parse_materials, get_from_value_or_none, get_before_value_or_none
 
 
 class TokenShema(BaseModel):
@@ -69,6 +68,12 @@ class SearchNaksCertificationItem:
     cert_abbr: str = ""
     cert_lvl: str = ""
     cert_number: str = ""
+    date_create_from: str = ""
+    date_create_before: str = ""
+    date_active_from_from: str = ""
+    date_active_from_before: str = ""
+    date_active_to_from: str = ""
+    date_active_to_before: str = ""
 
 
 class PersonalNaksCertificationData(BaseModel):
@@ -98,42 +103,32 @@ class PersonalNaksCertificationData(BaseModel):
 
     @field_validator("gtd", mode="before")
     @classmethod
-    def parse_gtd(cls, value: str) -> list[str]:
-        result = []
+    def parse_gtd(cls, value: str | list[str]) -> list[str]:
+        if isinstance(value, list):
+            return value
 
         if value == "":
             return []
 
-        for el in parse_gtds(value):
-            if not el:
-                continue
-
-            result += el
-
-        return result
+        return parse_gtd(value)
 
 
     @field_validator("materials", mode="before")
     @classmethod
-    def parse_materials(cls, value: str | None) -> list[str] | None:
-
-        if value is None:
-            return None
-
-        value = value.replace("M", "М")
-        material_pattern = re.compile(r"(М[0-9]+)(\+М[0-9]+)?")
+    def parse_materials(cls, value: str | list[str] | None) -> list[str] | None:
 
-        res = material_pattern.findall(value)
+        if value is None or isinstance(value, list):
+            return value
 
-        return ["".join(el) for el in res]
+        return parse_materials(value)
 
 
     @field_validator("detail_types", "joint_types", mode="before")
     @classmethod
-    def parse_list_values(cls, value: str | None) -> list[str] | None:
+    def parse_list_values(cls, value: str | list[str] | None) -> list[str] | None:
 
-        if value is None:
-            return None
+        if value is None or isinstance(value, list):
+            return value
 
         result = parse_list_data(value)
 
@@ -147,6 +142,9 @@ class PersonalNaksCertificationData(BaseModel):
     @classmethod
     def parse_from_before_values(cls, data: dict) -> dict: 
 
+        if "detail_thikness_string" not in data:
+            return data
+
         data["detail_thikness_from"] = get_from_value_or_none(data["detail_thikness_string"])
 
         data["detail_thikness_before"] = get_before_value_or_none(data["detail_thikness_string"])
@@ -1,29 +1,274 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import get_context
 from abc import ABC, abstractmethod
+from collections import Counter
+from threading import Lock, local
+from dataclasses import dataclass, field
 from re import search
+import typing as t
 
-from lxml import html
+from lxml import etree, html
+from requests import Session
+
+from src.application.interfaces.certification_store import IPersonalNaksCertificationStore
+from src.application.interfaces.request_observer import IRequestObserver
+from src.utils.rate_limiter import TokenBucketRateLimiter
+from src.utils.single_flight import AsyncSingleFlight, SingleFlight
+
+
+ADDITIONAL_PAGE_LINK_XPATH = etree.XPath("./td[13]/a/@onclick")
+PAGE_LINKS_XPATH = etree.XPath("//a[contains(@href, 'PAGEN_1=')]/@href")
+
+
+@dataclass
+class NaksPage:
+    content: bytes
+    encoding: str
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+@dataclass
+class NaksPageStream:
+    chunks: t.Iterable[bytes] | t.AsyncIterable[bytes]
+    encoding: str
+
+
+class IPageCache(t.Protocol):
+
+    def get(self, kind: str, key: str) -> NaksPage | None: ...
+
+
+    def get_stale(self, kind: str, key: str) -> NaksPage | None: ...
+
+
+    def set(self, kind: str, key: str, page: NaksPage) -> None: ...
+
+
+    def refresh(self, kind: str, key: str) -> None: ...
+
+
+    def summary(self) -> str: ...
+
+
+    def close(self) -> None: ...
+
+
+@dataclass
+class TransferStats:
+    downloaded: int = 0
+    revalidated: int = 0
+    _lock: Lock = field(default_factory=Lock, repr=False)
+
+
+    def count_downloaded(self, size: int) -> None:
+        with self._lock:
+            self.downloaded += size
+
+
+    def count_revalidated(self, size: int) -> None:
+        with self._lock:
+            self.revalidated += size
+
+
+    def summary(self) -> str:
+        return f"transfer: {self.downloaded / 2 ** 20:.2f} MB downloaded, {self.revalidated / 2 ** 20:.2f} MB reused after revalidation"
+
+
+class ThreadSessions:
+
+    def __init__(self) -> None:
+        self._local = local()
+        self._sessions: list[Session] = []
+        self._lock = Lock()
+
+
+    def get(self, headers: t.Mapping[str, str]) -> Session:
+        session: Session | None = getattr(self._local, "session", None)
+
+        if session is None:
+            session = self._local.session = Session()
+            session.headers = dict(headers)
+
+            with self._lock:
+                self._sessions.append(session)
+
+        return session
+
+
+    def close(self) -> None:
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+            self._local = local()
+
+        for session in sessions:
+            session.close()
+
+
+def get_declared_encoding(content_type: str | None) -> str | None:
+    if not content_type:
+        return None
+
+    charset = search(r"charset=[\"']?([\w-]+)", content_type)
+
+    if not charset:
+        return None
+
+    return charset.group(1)
+
+
+@dataclass
+class ParseContext:
+    rate_limiter: TokenBucketRateLimiter
+    request_observer: IRequestObserver | None = None
+    row_filter: t.Callable[[t.Any, t.Any], bool] | None = None
+    page_limit: t.Callable[[t.Any, int], int] | None = None
+    page_workers: int = 4
+    detail_workers: int = 8
+    parse_processes: int = 0
+    stream_main_pages: bool = False
+    page_cache: IPageCache | None = None
+    known_certifications: IPersonalNaksCertificationStore | None = None
+    contain_failures: bool = False
+    on_page: t.Callable[[list[t.Any]], None] | None = None
+    pages_executor: ThreadPoolExecutor | None = field(default=None, init=False)
+    detail_executor: ThreadPoolExecutor | None = field(default=None, init=False)
+    process_executor: ProcessPoolExecutor | None = field(default=None, init=False)
+    requests_count: Counter[str] = field(default_factory=Counter, init=False)
+    failed_items: int = field(default=0, init=False)
+    failed_pages: list[tuple[t.Any, int, Exception]] = field(default_factory=list, init=False)
+    failed_rows: list[tuple[t.Any, Exception]] = field(default_factory=list, init=False)
+    transfer_stats: TransferStats = field(default_factory=TransferStats, init=False)
+    sessions: ThreadSessions = field(default_factory=ThreadSessions, init=False)
+    detail_flights: SingleFlight[str, t.Any] = field(default_factory=SingleFlight, init=False)
+    async_detail_flights: AsyncSingleFlight[str, t.Any] = field(default_factory=AsyncSingleFlight, init=False)
+    _lock: Lock = field(default_factory=Lock, init=False, repr=False)
+
+
+    def __enter__(self) -> t.Self:
+        if self.page_workers > 0:
+            self.pages_executor = ThreadPoolExecutor(max_workers=self.page_workers, thread_name_prefix="naks-page")
+
+        if self.detail_workers > 0:
+            self.detail_executor = ThreadPoolExecutor(max_workers=self.detail_workers, thread_name_prefix="naks-detail")
+
+        if self.parse_processes > 0:
+            self.process_executor = ProcessPoolExecutor(max_workers=self.parse_processes, mp_context=get_context("spawn"))
+
+        return self
+
+
+    def __exit__(self, *args) -> None:
+        if self.pages_executor:
+            self.pages_executor.shutdown()
+            self.pages_executor = None
+
+        if self.detail_executor:
+            self.detail_executor.shutdown()
+            self.detail_executor = None
+
+        if self.process_executor:
+            self.process_executor.shutdown()
+            self.process_executor = None
+
+        self.sessions.close()
+
+        if self.page_cache:
+            self.page_cache.close()
+
+
+    def count_request(self, kind: str) -> None:
+        with self._lock:
+            self.requests_count[kind] += 1
+
+
+    def add_failed_page(self, search_item: t.Any, page: int, error: Exception) -> None:
+        with self._lock:
+            self.failed_pages.append((search_item, page, error))
+
+
+    def add_failed_row(self, row: t.Any, error: Exception) -> None:
+        with self._lock:
+            self.failed_rows.append((row, error))
+
+
+    def get_coalesced_count(self) -> int:
+        return self.detail_flights.coalesced + self.async_detail_flights.coalesced
+
+
+    def filter_rows[T, R](self, search_item: T, rows: list[R]) -> list[R]:
+        if not self.row_filter:
+            return rows
+
+        return [row for row in rows if self.row_filter(search_item, row)]
+
+
+    def limit_pages[T](self, search_item: T, pages_count: int) -> int:
+        if not self.page_limit:
+            return pages_count
+
+        return self.page_limit(search_item, pages_count)
 
 
 class BaseNaksExtractor(ABC):
+    _html_parsers = local()
 
     @abstractmethod
-    def parse_main_page(self, main_page: str): ...
+    def parse_main_page(self, main_page: bytes, encoding: str): ...
 
 
     @abstractmethod
-    def parse_additional_page(self, additional_page: str): ...
+    def parse_additional_page(self, additional_page: bytes, encoding: str): ...
 
 
-    def _get_additional_page_id(self, tr_tree: html.HtmlElement) -> str:
-        result = tr_tree.xpath("//td[13]/a/@onclick")[0]
+    def _get_additional_page_id(self, tr: html.HtmlElement) -> str:
+        result = ADDITIONAL_PAGE_LINK_XPATH(tr)[0]
 
         ident = search(r"\?ID=[\W\w]+\"", result).group()
 
         return ident.split("ID=")[1].replace("\"", "").split(",")[0]
 
 
-    def _get_tree(self, page_content: str) -> html.HtmlElement:
-        return html.fromstring(page_content)
+    def _get_pages_count(self, tree: html.HtmlElement) -> int:
+        pages = [1]
+
+        for href in PAGE_LINKS_XPATH(tree):
+            page = self._get_page_number(href)
+
+            if page:
+                pages.append(page)
+
+        return max(pages)
+
+
+    def get_pages_count(self, page_content: bytes, encoding: str) -> int:
+        return self._get_pages_count(self._get_tree(page_content, encoding))
+
+
+    def _get_page_number(self, href: str) -> int | None:
+        page = search(r"PAGEN_1=([0-9]+)", href)
+
+        if not page:
+            return None
+
+        return int(page.group(1))
+
+
+    def _get_tree(self, page_content: str | bytes, encoding: str | None = None) -> html.HtmlElement:
+        if encoding is None:
+            return html.fromstring(page_content)
+
+        return html.fromstring(page_content, parser=self._get_html_parser(encoding))
+
+
+    def _get_html_parser(self, encoding: str) -> html.HTMLParser:
+        if not hasattr(self._html_parsers, "by_encoding"):
+            self._html_parsers.by_encoding = {}
+
+        if encoding not in self._html_parsers.by_encoding:
+            self._html_parsers.by_encoding[encoding] = html.HTMLParser(encoding=encoding)
+
+        return self._html_parsers.by_encoding[encoding]
 
 
     def _to_string(self, html_obj: html.HtmlElement) -> str:
@@ -1,13 +1,39 @@
+from asyncio import Semaphore, Task, create_task, gather, get_running_loop
+from concurrent.futures import Future
+from contextlib import asynccontextmanager, contextmanager, nullcontext
 from dataclasses import dataclass
-from time import sleep
+from functools import partial
+from hashlib import sha256
+from importlib.util import find_spec
+from urllib.parse import quote_plus
+from time import perf_counter
+import typing as t
 
-from requests import Response, Session
+from httpx import AsyncClient, Limits, Response as HttpxResponse, TimeoutException
+from requests import ConnectionError as RequestConnectionError, RequestException, Response, Session, Timeout
 from pydantic import ValidationError
-from lxml import html
+from lxml import etree, html
 
 from src.application.common.exc import BadResponseError
-from src.infrastructure.parsers.base import BaseNaksExtractor
+from src.application.interfaces.certification_store import IPersonalNaksCertificationStore
+from src.application.interfaces.request_observer import IRequestObserver
+from src.infrastructure.parsers.base import (
+    BaseNaksExtractor, 
+    IPageCache, 
+    NaksPage, 
+    NaksPageStream, 
+    ParseContext, 
+    ThreadSessions,
+    TransferStats, 
+    get_declared_encoding
+)
 from src.infrastructure.dto import PersonalNaksCertificationData, SearchNaksCertificationItem
+from src.utils.rate_limiter import TokenBucketRateLimiter, parse_retry_after
+
+
+REGISTRY_ENCODING = "cp1251"
+REGISTRY_DATE_FORMAT = "%d.%m.%Y"
+ACCEPT_ENCODING = "gzip, deflate, br" if find_spec("brotli") or find_spec("brotlicffi") else "gzip, deflate"
 
 
 @dataclass
@@ -24,6 +50,12 @@ class PersonalNaksCertificationMainPageData:
     method: str | None = None
 
 
+@dataclass
+class PersonalNaksCertificationMainPage:
+    rows: list[PersonalNaksCertificationMainPageData]
+    pages_count: int = 1
+
+
 @dataclass
 class PersonalNaksCertificationAdditionalPageData:
     gtd: str
@@ -37,46 +69,162 @@ class PersonalNaksCertificationAdditionalPageData:
     detail_diameter_string: str | None = None
 
 
-class PersonalNaksCertificationHttpWorker:
-    def __init__(self) -> None:
-        self.base_url = "https://naks.ru/registry/personal/"
+@dataclass
+class PersonalNaksCertificationMainPageTask:
+    search_item: SearchNaksCertificationItem
+    page: int
+    raw_page: NaksPage | None = None
+
 
-        self.session = Session()
+@dataclass
+class PersonalNaksCertificationRowTask:
+    main_cert_data: PersonalNaksCertificationMainPageData
+    raw_additional_page: NaksPage | None = None
+    additional_page_data: PersonalNaksCertificationAdditionalPageData | None = None
+    certification: PersonalNaksCertificationData | None = None
 
-        self.session.headers = {
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-            'Cache-Control': 'max-age=0',
-            'Connection': 'keep-alive',
-            'Content-Type': 'application/x-www-form-urlencoded',
-            'Origin': 'https://naks.ru',
-            'Referer': 'https://naks.ru/registry/personal/',
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/130.0.0.0 Safari/537.36'
-        }
 
+async def aiter_chunks(chunks: t.Iterable[bytes]) -> t.AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
 
-    def get_main_page(self, search_item: SearchNaksCertificationItem) -> Response:
-        data = self._get_request_data(search_item)
 
-        with self.session.post(self.base_url, data=data, timeout=5) as response:
-            if response.status_code in [200, 201]:
-                return response
-            else:
-                raise BadResponseError(f"bad status code: {response.status_code} ({response.content})")
+class BasePersonalNaksCertificationHttpWorker:
+    base_url = "https://naks.ru/registry/personal/"
+    ok_statuses = [200, 201, 304]
+    not_modified_status = 304
+    retry_statuses = [429, 503]
+    max_retries = 5
+    stream_chunk_size = 16 * 1024
 
+    rate_limiter: TokenBucketRateLimiter
+    request_observer: IRequestObserver | None = None
+    page_cache: IPageCache | None = None
+    transfer_stats: TransferStats | None = None
 
-    def get_additional_page(self, key: str) -> Response: 
-        url = f"{self.base_url}/detail.php?ID={key}"
+    headers = {
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
+        'Accept-Encoding': ACCEPT_ENCODING,
+        'Cache-Control': 'max-age=0',
+        'Connection': 'keep-alive',
+        'Content-Type': 'application/x-www-form-urlencoded',
+        'Origin': 'https://naks.ru',
+        'Referer': 'https://naks.ru/registry/personal/',
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/130.0.0.0 Safari/537.36'
+    }
 
-        with self.session.get(url, timeout=5) as response:
 
-            if response.status_code in [200, 201]:
-                return response
-            else:
-                raise BadResponseError(f"bad status code: {response.status_code} ({response.content})")
+    def _get_additional_page_url(self, key: str) -> str:
+        return f"{self.base_url}/detail.php?ID={key}"
+
+
+    def _check_status(self, status_code: int, content: bytes) -> None:
+        if status_code not in self.ok_statuses:
+            raise BadResponseError(f"bad status code: {status_code} ({content})")
+
+
+    def _is_throttled(self, status_code: int, headers: t.Mapping[str, str]) -> bool:
+        if status_code in self.retry_statuses:
+            self.rate_limiter.throttle(parse_retry_after(headers.get("Retry-After")))
+
+            return True
+
+        self.rate_limiter.recover()
+
+        return False
+
+
+    def _to_page(self, content: bytes, headers: t.Mapping[str, str]) -> NaksPage:
+        return NaksPage(
+            content=content, 
+            encoding=self._get_encoding(headers),
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified")
+        )
+
+
+    def _get_encoding(self, headers: t.Mapping[str, str]) -> str:
+        return get_declared_encoding(headers.get("Content-Type")) or REGISTRY_ENCODING
+
+
+    def _observe(self, started_at: float, ok: bool) -> None:
+        if self.request_observer:
+            self.request_observer.observe(perf_counter() - started_at, ok)
+
+
+    def _get_main_page_cache_key(self, data: str) -> str:
+        return sha256("&".join(sorted(data.split("&"))).encode()).hexdigest()
+
+
+    def _get_cached(self, kind: str, key: str) -> NaksPage | None:
+        if not self.page_cache:
+            return None
+
+        return self.page_cache.get(kind, key)
+
+
+    def _get_stale(self, kind: str, key: str) -> NaksPage | None:
+        if not self.page_cache:
+            return None
+
+        return self.page_cache.get_stale(kind, key)
+
+
+    def _set_cached(self, kind: str, key: str, page: NaksPage) -> NaksPage:
+        if self.page_cache:
+            self.page_cache.set(kind, key, page)
+
+        return page
+
+
+    def _refresh_cached(self, kind: str, key: str, page: NaksPage) -> NaksPage:
+        self.page_cache.refresh(kind, key)
+
+        if self.transfer_stats:
+            self.transfer_stats.count_revalidated(len(page.content))
+
+        return page
+
+
+    def _get_conditional_headers(self, page: NaksPage | None) -> dict[str, str]:
+        headers: dict[str, str] = {}
+
+        if page and page.etag:
+            headers["If-None-Match"] = page.etag
+
+        if page and page.last_modified:
+            headers["If-Modified-Since"] = page.last_modified
+
+        return headers
+
+
+    def _count_downloaded(self, size: int) -> None:
+        if self.transfer_stats:
+            self.transfer_stats.count_downloaded(size)
+
+
+    def _cache_chunks(self, kind: str, key: str, chunks: t.Iterable[bytes], headers: t.Mapping[str, str]) -> t.Iterator[bytes]:
+        received: list[bytes] = []
+
+        for chunk in chunks:
+            received.append(chunk)
+            yield chunk
+
+        self._set_cached(kind, key, self._to_page(b"".join(received), headers))
+
+
+    async def _acache_chunks(self, kind: str, key: str, chunks: t.AsyncIterable[bytes], headers: t.Mapping[str, str]) -> t.AsyncIterator[bytes]:
+        received: list[bytes] = []
+
+        async for chunk in chunks:
+            received.append(chunk)
+            yield chunk
+
+        self._set_cached(kind, key, self._to_page(b"".join(received), headers))
 
     
     def _get_request_data(self, search_settings: SearchNaksCertificationItem, page: int = 1) -> str:
-        base_data = "PAGEN_1={page}&arrFilter_pf%5Bap%5D=&arrFilter_ff%5BNAME%5D={name}&arrFilter_pf%5Bshifr_ac%5D={cert_abbr}&arrFilter_pf%5Buroven_ac%5D={cert_lvl}&arrFilter_pf%5Bnum_ac%5D={cert_number}&arrFilter_ff%5BCODE%5D={kleymo}&arrFilter_DATE_CREATE_1=&arrFilter_DATE_CREATE_2=&arrFilter_DATE_ACTIVE_TO_1=&arrFilter_DATE_ACTIVE_TO_2=&arrFilter_DATE_ACTIVE_FROM_1=&arrFilter_DATE_ACTIVE_FROM_2=&g-recaptcha-response=&set_filter=%D4%E8%EB%FC%F2%F0&set_filter=Y"
+        base_data = "PAGEN_1={page}&arrFilter_pf%5Bap%5D=&arrFilter_ff%5BNAME%5D={name}&arrFilter_pf%5Bshifr_ac%5D={cert_abbr}&arrFilter_pf%5Buroven_ac%5D={cert_lvl}&arrFilter_pf%5Bnum_ac%5D={cert_number}&arrFilter_ff%5BCODE%5D={kleymo}&arrFilter_DATE_CREATE_1={date_create_from}&arrFilter_DATE_CREATE_2={date_create_before}&arrFilter_DATE_ACTIVE_TO_1={date_active_to_from}&arrFilter_DATE_ACTIVE_TO_2={date_active_to_before}&arrFilter_DATE_ACTIVE_FROM_1={date_active_from_from}&arrFilter_DATE_ACTIVE_FROM_2={date_active_from_before}&g-recaptcha-response=&set_filter=%D4%E8%EB%FC%F2%F0&set_filter=Y"
         
         data_options = {
             "page": page,
@@ -84,47 +232,360 @@ class PersonalNaksCertificationHttpWorker:
             "kleymo": search_settings.kleymo,
             "cert_abbr": search_settings.cert_abbr,
             "cert_lvl": search_settings.cert_lvl,
-            "cert_number": search_settings.cert_number
+            "cert_number": search_settings.cert_number,
+            "date_create_from": search_settings.date_create_from,
+            "date_create_before": search_settings.date_create_before,
+            "date_active_to_from": search_settings.date_active_to_from,
+            "date_active_to_before": search_settings.date_active_to_before,
+            "date_active_from_from": search_settings.date_active_from_from,
+            "date_active_from_before": search_settings.date_active_from_before
         }
+
+        data_options = {key: quote_plus(str(value), encoding=REGISTRY_ENCODING) for key, value in data_options.items()}
         
         return base_data.format(**data_options).strip()
 
 
+class PersonalNaksCertificationHttpWorker(BasePersonalNaksCertificationHttpWorker):
+    def __init__(
+        self, 
+        rate_limiter: TokenBucketRateLimiter, 
+        request_observer: IRequestObserver | None = None, 
+        page_cache: IPageCache | None = None,
+        transfer_stats: TransferStats | None = None,
+        sessions: ThreadSessions | None = None
+    ) -> None:
+        self.rate_limiter = rate_limiter
+        self.request_observer = request_observer
+        self.page_cache = page_cache
+        self.transfer_stats = transfer_stats
+        self.sessions = sessions or ThreadSessions()
+
+
+    @property
+    def session(self) -> Session:
+        return self.sessions.get(self.headers)
+
+
+    def get_main_page(self, search_item: SearchNaksCertificationItem, page: int = 1) -> NaksPage:
+        data = self._get_request_data(search_item, page)
+        cache_key = self._get_main_page_cache_key(data)
+
+        if cached_page := self._get_cached("main", cache_key):
+            return cached_page
+
+        response = self._send("POST", self.base_url, data=data)
+
+        return self._set_cached("main", cache_key, self._to_page(response.content, response.headers))
+
+
+    @contextmanager
+    def stream_main_page(self, search_item: SearchNaksCertificationItem, page: int = 1) -> t.Iterator[NaksPageStream]:
+        data = self._get_request_data(search_item, page)
+        cache_key = self._get_main_page_cache_key(data)
+
+        if cached_page := self._get_cached("main", cache_key):
+            yield NaksPageStream(chunks=[cached_page.content], encoding=cached_page.encoding)
+            return
+
+        response = self._send("POST", self.base_url, data=data, stream=True)
+        chunks = response.iter_content(chunk_size=self.stream_chunk_size)
+
+        if self.page_cache:
+            chunks = self._cache_chunks("main", cache_key, chunks, response.headers)
+
+        try:
+            yield NaksPageStream(chunks=chunks, encoding=self._get_encoding(response.headers))
+        finally:
+            self._count_downloaded(response.raw.tell())
+            response.close()
+
+
+    def get_additional_page(self, key: str) -> NaksPage: 
+        if cached_page := self._get_cached("additional", key):
+            return cached_page
+
+        stale_page = self._get_stale("additional", key)
+        url = self._get_additional_page_url(key)
+        response = self._send("GET", url, headers=self._get_conditional_headers(stale_page))
+
+        if stale_page and response.status_code == self.not_modified_status:
+            return self._refresh_cached("additional", key, stale_page)
+
+        return self._set_cached("additional", key, self._to_page(response.content, response.headers))
+
+
+    def _send(
+        self, 
+        method: str, 
+        url: str, 
+        data: str | None = None, 
+        headers: dict[str, str] | None = None, 
+        stream: bool = False
+    ) -> Response:
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.acquire()
+            started_at = perf_counter()
+
+            try:
+                with self.request_observer.slot() if self.request_observer else nullcontext():
+                    response = self.session.request(method, url, data=data, headers=headers, timeout=5, stream=stream)
+            except (Timeout, RequestConnectionError):
+                self._observe(started_at, False)
+
+                if attempt == self.max_retries:
+                    raise
+
+                self.rate_limiter.throttle()
+                continue
+            except RequestException:
+                self._observe(started_at, False)
+                raise
+
+            self._observe(started_at, response.status_code in self.ok_statuses)
+
+            if not stream:
+                self._count_downloaded(response.raw.tell())
+
+            if self._is_throttled(response.status_code, response.headers):
+                response.close()
+                continue
+
+            if response.status_code not in self.ok_statuses:
+                self._check_status(response.status_code, response.content)
+
+            return response
+
+        raise BadResponseError(f"bad status code: {response.status_code} (retries exhausted)")
+
+
+class AsyncPersonalNaksCertificationHttpWorker(BasePersonalNaksCertificationHttpWorker):
+    def __init__(
+        self, 
+        rate_limiter: TokenBucketRateLimiter, 
+        max_in_flight: int = 100, 
+        page_cache: IPageCache | None = None,
+        transfer_stats: TransferStats | None = None
+    ) -> None:
+        self.rate_limiter = rate_limiter
+        self.page_cache = page_cache
+        self.transfer_stats = transfer_stats
+        self.semaphore = Semaphore(max_in_flight)
+
+        self.client = AsyncClient(
+            headers=self.headers,
+            timeout=5,
+            limits=Limits(max_connections=max_in_flight, max_keepalive_connections=max_in_flight)
+        )
+
+
+    async def get_main_page(self, search_item: SearchNaksCertificationItem, page: int = 1) -> NaksPage:
+        data = self._get_request_data(search_item, page)
+        cache_key = self._get_main_page_cache_key(data)
+
+        if cached_page := self._get_cached("main", cache_key):
+            return cached_page
+
+        response = await self._send("POST", self.base_url, data=data)
+
+        return self._set_cached("main", cache_key, self._to_page(response.content, response.headers))
+
+
+    @asynccontextmanager
+    async def stream_main_page(self, search_item: SearchNaksCertificationItem, page: int = 1) -> t.AsyncIterator[NaksPageStream]:
+        data = self._get_request_data(search_item, page)
+        cache_key = self._get_main_page_cache_key(data)
+
+        if cached_page := self._get_cached("main", cache_key):
+            yield NaksPageStream(chunks=aiter_chunks([cached_page.content]), encoding=cached_page.encoding)
+            return
+
+        for _ in range(self.max_retries + 1):
+            await self.rate_limiter.acquire_async()
+
+            async with self.semaphore:
+                request = self.client.build_request("POST", self.base_url, content=data)
+                response = await self.client.send(request, stream=True)
+
+                try:
+                    if self._is_throttled(response.status_code, response.headers):
+                        continue
+
+                    if response.status_code not in self.ok_statuses:
+                        self._check_status(response.status_code, await response.aread())
+
+                    chunks = response.aiter_bytes(self.stream_chunk_size)
+
+                    if self.page_cache:
+                        chunks = self._acache_chunks("main", cache_key, chunks, response.headers)
+
+                    yield NaksPageStream(chunks=chunks, encoding=self._get_encoding(response.headers))
+
+                    return
+                finally:
+                    self._count_downloaded(response.num_bytes_downloaded)
+                    await response.aclose()
+
+        raise BadResponseError(f"bad status code: {response.status_code} (retries exhausted)")
+
+
+    async def get_additional_page(self, key: str) -> NaksPage:
+        if cached_page := self._get_cached("additional", key):
+            return cached_page
+
+        stale_page = self._get_stale("additional", key)
+        url = self._get_additional_page_url(key)
+        response = await self._send("GET", url, headers=self._get_conditional_headers(stale_page))
+
+        if stale_page and response.status_code == self.not_modified_status:
+            return self._refresh_cached("additional", key, stale_page)
+
+        return self._set_cached("additional", key, self._to_page(response.content, response.headers))
+
+
+    async def _send(self, method: str, url: str, data: str | None = None, headers: dict[str, str] | None = None) -> HttpxResponse:
+        for attempt in range(self.max_retries + 1):
+            await self.rate_limiter.acquire_async()
+
+            try:
+                async with self.semaphore:
+                    response = await self.client.request(method, url, content=data, headers=headers)
+            except TimeoutException:
+                if attempt == self.max_retries:
+                    raise
+
+                self.rate_limiter.throttle()
+                continue
+
+            self._count_downloaded(response.num_bytes_downloaded)
+
+            if self._is_throttled(response.status_code, response.headers):
+                continue
+
+            self._check_status(response.status_code, response.content)
+
+            return response
+
+        raise BadResponseError(f"bad status code: {response.status_code} (retries exhausted)")
+
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+
+MAIN_PAGE_ROWS_XPATH = etree.XPath("//table[@class='tabl']//tr[@bgcolor]")
+ADDITIONAL_PAGE_ROWS_XPATH = etree.XPath("//tr")
+ADDITIONAL_PAGE_CELLS_XPATH = etree.XPath(".//td")
+MODAL_BODY_XPATH = etree.XPath("//div[@class='modal-body']")
+
+NAME_XPATH = etree.XPath("./td[1]/text()")
+KLEYMO_XPATH = etree.XPath("./td[2]/span/text()")
+COMPANY_XPATH = etree.XPath("./td[3]/text()")
+CERTIFICATION_NUMBER_XPATH = etree.XPath("./td[5]/text()")
+INSERT_XPATH = etree.XPath("./td[6]/text()")
+CERTIFICATION_DATE_XPATH = etree.XPath("./td[9]/text()")
+EXPIRATION_DATE_XPATH = etree.XPath("./td[10]/text()")
+EXPIRATION_DATE_FACT_XPATH = etree.XPath("./td[11]/text()")
+METHOD_XPATH = etree.XPath("./td[12]/text()")
+
+
+class PersonalNaksCertificationMainPageFeed:
+
+    def __init__(
+        self,
+        encoding: str,
+        parse_row: t.Callable[[etree._Element], PersonalNaksCertificationMainPageData],
+        get_page_number: t.Callable[[str], int | None]
+    ) -> None:
+        self.parse_row = parse_row
+        self.get_page_number = get_page_number
+        self.pages_count = 1
+
+        self._parser = etree.HTMLPullParser(events=("end",), tag=("tr", "a"), encoding=encoding)
+
+
+    def feed(self, chunk: bytes) -> list[PersonalNaksCertificationMainPageData]:
+        self._parser.feed(chunk)
+
+        return self._read_rows()
+
+
+    def close(self) -> list[PersonalNaksCertificationMainPageData]:
+        self._parser.close()
+
+        return self._read_rows()
+
+
+    def _read_rows(self) -> list[PersonalNaksCertificationMainPageData]:
+        rows: list[PersonalNaksCertificationMainPageData] = []
+
+        for _, element in self._parser.read_events():
+            if element.tag == "a":
+                self._read_page_link(element)
+            elif self._is_main_page_row(element):
+                rows.append(self.parse_row(element))
+                self._release(element)
+
+        return rows
+
+
+    def _read_page_link(self, a: etree._Element) -> None:
+        page = self.get_page_number(a.get("href", ""))
+
+        if page:
+            self.pages_count = max(self.pages_count, page)
+
+
+    def _is_main_page_row(self, tr: etree._Element) -> bool:
+        if tr.get("bgcolor") is None:
+            return False
+
+        return any(table.get("class") == "tabl" for table in tr.iterancestors("table"))
+
+
+    def _release(self, tr: etree._Element) -> None:
+        tr.clear(keep_tail=True)
+        parent = tr.getparent()
+
+        while tr.getprevious() is not None:
+            del parent[0]
+
+
 class PersonalNaksCertificationExtractor(BaseNaksExtractor):
-    def parse_main_page(self, main_page: str) -> list[PersonalNaksCertificationMainPageData]:
-        tree = self._get_tree(main_page)
-        result = []
-
-        trs: list[html.HtmlElement] = tree.xpath("//table[@class='tabl']//tr[@bgcolor]")
-
-        for tr in trs:
-            tr_tree = self._get_tree(self._to_string(tr))
-            result.append(
-                PersonalNaksCertificationMainPageData(
-                    kleymo=self._get_kleymo(tr_tree),
-                    name=self._get_name(tr_tree),
-                    company=self._get_company(tr_tree),
-                    certification_number=self._get_certification_number(tr_tree),
-                    insert=self._get_insert(tr_tree),
-                    certification_date=self._get_certification_date(tr_tree),
-                    expiration_date=self._get_expiration_date(tr_tree),
-                    expiration_date_fact=self._get_expiration_date_fact(tr_tree),
-                    method=self._get_method(tr_tree),
-                    additional_page_id=self._get_additional_page_id(tr_tree)
-                )
-            )
-        
-        return result
+    def parse_main_page(self, main_page: bytes, encoding: str = REGISTRY_ENCODING) -> PersonalNaksCertificationMainPage:
+        tree = self._get_tree(main_page, encoding)
 
+        return PersonalNaksCertificationMainPage(
+            rows=[self.parse_main_page_row(tr) for tr in MAIN_PAGE_ROWS_XPATH(tree)],
+            pages_count=self._get_pages_count(tree)
+        )
 
-    def parse_additional_page(self, additional_page: str) -> PersonalNaksCertificationAdditionalPageData:
-        tree = self._get_tree(additional_page)
-        result = {}
 
-        for tr in tree.xpath("//tr"):
-            tr_tree = self._get_tree(self._to_string(tr))
+    def feed_main_page(self, encoding: str = REGISTRY_ENCODING) -> PersonalNaksCertificationMainPageFeed:
+        return PersonalNaksCertificationMainPageFeed(encoding, self.parse_main_page_row, self._get_page_number)
+
+
+    def parse_main_page_row(self, tr: html.HtmlElement) -> PersonalNaksCertificationMainPageData:
+        return PersonalNaksCertificationMainPageData(
+            kleymo=self._get_kleymo(tr),
+            name=self._get_name(tr),
+            company=self._get_company(tr),
+            certification_number=self._get_certification_number(tr),
+            insert=self._get_insert(tr),
+            certification_date=self._get_certification_date(tr),
+            expiration_date=self._get_expiration_date(tr),
+            expiration_date_fact=self._get_expiration_date_fact(tr),
+            method=self._get_method(tr),
+            additional_page_id=self._get_additional_page_id(tr)
+        )
 
-            tds = tr_tree.xpath("//td")
+
+    def parse_additional_page(self, additional_page: bytes, encoding: str = REGISTRY_ENCODING) -> PersonalNaksCertificationAdditionalPageData:
+        tree = self._get_tree(additional_page, encoding)
+        result = {}
+
+        for tr in ADDITIONAL_PAGE_ROWS_XPATH(tree):
+            tds = ADDITIONAL_PAGE_CELLS_XPATH(tr)
 
             if len(tds) < 2:
                 continue
@@ -140,7 +601,7 @@ class PersonalNaksCertificationExtractor(BaseNaksExtractor):
         if gtd == "":
             html = ""
         else:
-            html = self._to_string(tree.xpath("//div[@class='modal-body']")[0]).replace(b"\n", b"").replace(b"\r", b"").replace(b"\t", b"").replace(b"\"", b"'")
+            html = self._to_string(MODAL_BODY_XPATH(tree)[0]).replace(b"\n", b"").replace(b"\r", b"").replace(b"\t", b"").replace(b"\"", b"'")
 
 
         return PersonalNaksCertificationAdditionalPageData(
@@ -156,29 +617,29 @@ class PersonalNaksCertificationExtractor(BaseNaksExtractor):
         )
 
 
-    def _get_name(self, tr_tree: html.HtmlElement) -> str:
+    def _get_name(self, tr: html.HtmlElement) -> str:
 
-        return tr_tree.xpath("//td[1]/text()")[0].strip()
+        return NAME_XPATH(tr)[0].strip()
     
 
-    def _get_kleymo(self, tr_tree: html.HtmlElement) -> str:
+    def _get_kleymo(self, tr: html.HtmlElement) -> str:
 
-        return tr_tree.xpath("//td[2]/span/text()")[0].strip()
+        return KLEYMO_XPATH(tr)[0].strip()
     
 
-    def _get_company(self, tr_tree: html.HtmlElement) -> str:
+    def _get_company(self, tr: html.HtmlElement) -> str:
 
-        return tr_tree.xpath("//td[3]/text()")[0].split(",")[0].strip()
+        return COMPANY_XPATH(tr)[0].split(",")[0].strip()
     
 
-    def _get_certification_number(self, tr_tree: html.HtmlElement) -> str:
+    def _get_certification_number(self, tr: html.HtmlElement) -> str:
 
-        return tr_tree.xpath("//td[5]/text()")[0].strip()
+        return CERTIFICATION_NUMBER_XPATH(tr)[0].strip()
     
 
-    def _get_insert(self, tr_tree: html.HtmlElement) -> str | None:
+    def _get_insert(self, tr: html.HtmlElement) -> str | None:
 
-        result = tr_tree.xpath("//td[6]/text()")[0].strip()
+        result = INSERT_XPATH(tr)[0].strip()
 
         if not result:
             return None
@@ -186,54 +647,565 @@ class PersonalNaksCertificationExtractor(BaseNaksExtractor):
         return result
     
 
-    def _get_certification_date(self, tr_tree: html.HtmlElement) -> str:
+    def _get_certification_date(self, tr: html.HtmlElement) -> str:
 
-        return tr_tree.xpath("//td[9]/text()")[0].strip()
+        return CERTIFICATION_DATE_XPATH(tr)[0].strip()
     
 
-    def _get_expiration_date(self, tr_tree: html.HtmlElement) -> str:
+    def _get_expiration_date(self, tr: html.HtmlElement) -> str:
 
-        return tr_tree.xpath("//td[10]/text()")[0].strip()
+        return EXPIRATION_DATE_XPATH(tr)[0].strip()
     
 
-    def _get_expiration_date_fact(self, tr_tree: html.HtmlElement) -> str:
+    def _get_expiration_date_fact(self, tr: html.HtmlElement) -> str:
 
-        exp_fact = tr_tree.xpath("//td[11]/text()")[0].strip()
+        exp_fact = EXPIRATION_DATE_FACT_XPATH(tr)[0].strip()
 
         if exp_fact:
             return exp_fact
         
-        return self._get_expiration_date(tr_tree)
+        return self._get_expiration_date(tr)
     
 
-    def _get_method(self, tr_tree: html.HtmlElement) -> str:
+    def _get_method(self, tr: html.HtmlElement) -> str:
+
+        return METHOD_XPATH(tr)[0].strip()
+
 
-        return tr_tree.xpath("//td[12]/text()")[0].strip()
+def build_certification_data(
+    main_cert_data: PersonalNaksCertificationMainPageData, 
+    additional_page_data: PersonalNaksCertificationAdditionalPageData
+) -> PersonalNaksCertificationData | None:
+    try:
+        return PersonalNaksCertificationData.model_validate(main_cert_data.__dict__ | additional_page_data.__dict__)
+    except ValidationError as e:
+        print(e)
+        return None
+
+
+def extract_main_page(content: bytes, encoding: str) -> PersonalNaksCertificationMainPage:
+    return PersonalNaksCertificationExtractor().parse_main_page(content, encoding)
+
+
+def extract_certifications(
+    pages: list[tuple[PersonalNaksCertificationMainPageData, bytes, str]]
+) -> list[PersonalNaksCertificationData | None]:
+    extractor = PersonalNaksCertificationExtractor()
+
+    return [
+        build_certification_data(main_cert_data, extractor.parse_additional_page(content, encoding))
+        for main_cert_data, content, encoding in pages
+    ]
+
+
+def get_reusable_certification_data(
+    main_cert_data: PersonalNaksCertificationMainPageData,
+    known_certifications: IPersonalNaksCertificationStore | None
+) -> PersonalNaksCertificationData | None:
+    if not known_certifications:
+        return None
+
+    known = known_certifications.get(main_cert_data.certification_number)
+
+    if not known:
+        return None
+
+    known_state = (
+        known.certification_date.strftime(REGISTRY_DATE_FORMAT),
+        known.expiration_date.strftime(REGISTRY_DATE_FORMAT),
+        known.expiration_date_fact.strftime(REGISTRY_DATE_FORMAT),
+        known.method
+    )
+    state = (
+        main_cert_data.certification_date,
+        main_cert_data.expiration_date,
+        main_cert_data.expiration_date_fact,
+        main_cert_data.method
+    )
+
+    if known_state != state:
+        return None
+
+    return known.model_copy(
+        update={
+            "name": main_cert_data.name,
+            "kleymo": main_cert_data.kleymo,
+            "company": main_cert_data.company,
+            "insert": main_cert_data.insert
+        }
+    )
 
 
 class PersonalNaksCertificationParser:
+    failure_attempts = 2
 
-    def __init__(self) -> None:
-        self.http_worker = PersonalNaksCertificationHttpWorker()
+    def __init__(self, context: ParseContext) -> None:
+        self.context = context
+        self.http_worker = PersonalNaksCertificationHttpWorker(
+            context.rate_limiter, 
+            context.request_observer, 
+            context.page_cache, 
+            context.transfer_stats,
+            context.sessions
+        )
         self.extractor = PersonalNaksCertificationExtractor()
 
 
     def parse(self, search_item: SearchNaksCertificationItem) -> list[PersonalNaksCertificationData]:
-        result: list[PersonalNaksCertificationData] = []
-        main_page_response = self.http_worker.get_main_page(search_item)
-        sleep(3)
+        if self.context.stream_main_pages:
+            pages_count, result = self._parse_streamed_page(search_item)
+            next_pages = self._iter_next_pages(search_item, self.context.limit_pages(search_item, pages_count))
+        else:
+            main_page = self._get_main_page(search_item)
+            next_pages = self._iter_next_pages(search_item, self.context.limit_pages(search_item, main_page.pages_count))
+            result = self._parse_rows(main_page.rows)
+
+        self._complete_page(result)
+
+        for next_page_result in next_pages:
+            self._complete_page(next_page_result)
+            result += next_page_result
+
+        return result
+
+
+    def _iter_next_pages(self, search_item: SearchNaksCertificationItem, pages_count: int) -> t.Iterator[list[PersonalNaksCertificationData]]:
+        pages = range(2, pages_count + 1)
+
+        if not self.context.pages_executor:
+            return (self._parse_page(search_item, page) for page in pages)
 
-        for main_cert_data in self.extractor.parse_main_page(main_page_response.text):
-            sleep(1)
-            additional_page_response = self.http_worker.get_additional_page(main_cert_data.additional_page_id)
-            additional_page_data = self.extractor.parse_additional_page(additional_page_response.text)
+        futures = [self.context.pages_executor.submit(self._parse_page, search_item, page) for page in pages]
 
+        return (future.result() for future in futures)
+
+
+    def _complete_page(self, page_result: list[PersonalNaksCertificationData]) -> None:
+        if self.context.on_page:
+            self.context.on_page(page_result)
+
+
+    def _contain[R](self, func: t.Callable[[], R], on_failure: t.Callable[[Exception], None]) -> R | None:
+        if not self.context.contain_failures:
+            return func()
+
+        for _ in range(self.failure_attempts):
             try:
-                result.append(
-                    PersonalNaksCertificationData.model_validate(main_cert_data.__dict__ | additional_page_data.__dict__)
-                )
-            except ValidationError as e:
-                print(e)
-                continue
+                return func()
+            except Exception as e:
+                error = e
+
+        on_failure(error)
+
+        return None
+
+
+    def _parse_page(self, search_item: SearchNaksCertificationItem, page: int) -> list[PersonalNaksCertificationData]:
+        return self._contain(
+            lambda: self._parse_page_rows(search_item, page), 
+            partial(self.context.add_failed_page, search_item, page)
+        ) or []
+
+
+    def _parse_page_rows(self, search_item: SearchNaksCertificationItem, page: int) -> list[PersonalNaksCertificationData]:
+        if self.context.stream_main_pages:
+            return self._parse_streamed_page(search_item, page)[1]
+
+        main_page = self._get_main_page(search_item, page)
+
+        return self._parse_rows(main_page.rows)
+
+
+    def _parse_streamed_page(self, search_item: SearchNaksCertificationItem, page: int = 1) -> tuple[int, list[PersonalNaksCertificationData]]:
+        self.context.count_request("main")
+        futures: list[Future[t.Any]] = []
+
+        try:
+            with self.http_worker.stream_main_page(search_item, page) as stream:
+                feed = self.extractor.feed_main_page(stream.encoding)
+
+                for chunk in stream.chunks:
+                    futures += self._schedule_rows(self.context.filter_rows(search_item, feed.feed(chunk)))
+
+                futures += self._schedule_rows(self.context.filter_rows(search_item, feed.close()))
+        except BaseException:
+            for future in futures:
+                future.cancel()
+
+            raise
+
+        return feed.pages_count, self._collect_rows(futures)
+
+
+    def _get_main_page(self, search_item: SearchNaksCertificationItem, page: int = 1) -> PersonalNaksCertificationMainPage:
+        self.context.count_request("main")
+        raw_main_page = self.http_worker.get_main_page(search_item, page)
+
+        if self.context.process_executor:
+            main_page = self.context.process_executor.submit(extract_main_page, raw_main_page.content, raw_main_page.encoding).result()
+        else:
+            main_page = self.extractor.parse_main_page(raw_main_page.content, raw_main_page.encoding)
+
+        main_page.rows = self.context.filter_rows(search_item, main_page.rows)
+
+        return main_page
+
+
+    def _parse_rows(self, main_certs_data: list[PersonalNaksCertificationMainPageData]) -> list[PersonalNaksCertificationData]:
+        return self._collect_rows(self._schedule_rows(main_certs_data))
+
+
+    def _schedule_rows(self, main_certs_data: list[PersonalNaksCertificationMainPageData]) -> list[Future[t.Any]]:
+        handle = self._prefetch_row if self.context.process_executor else self._parse_row
+
+        return [self._submit_detail(handle, main_cert_data) for main_cert_data in main_certs_data]
+
+
+    def _submit_detail[R](self, func: t.Callable[[PersonalNaksCertificationMainPageData], R], main_cert_data: PersonalNaksCertificationMainPageData) -> Future[R]:
+        if self.context.detail_executor:
+            return self.context.detail_executor.submit(func, main_cert_data)
+
+        future: Future[R] = Future()
+
+        try:
+            future.set_result(func(main_cert_data))
+        except Exception as e:
+            future.set_exception(e)
+
+        return future
+
+
+    def _collect_rows(self, futures: list[Future[t.Any]]) -> list[PersonalNaksCertificationData]:
+        rows = [future.result() for future in futures]
+
+        if self.context.process_executor:
+            return self._extract_rows_in_processes(rows)
+
+        return [certification for certification in rows if certification]
+
+
+    def _extract_rows_in_processes(
+        self, 
+        rows: list[PersonalNaksCertificationData | tuple[PersonalNaksCertificationMainPageData, NaksPage] | None]
+    ) -> list[PersonalNaksCertificationData]:
+        pages = [(main_cert_data, page.content, page.encoding) for main_cert_data, page in (row for row in rows if isinstance(row, tuple))]
+        extracted = iter(self.context.process_executor.submit(extract_certifications, pages).result() if pages else [])
+        result: list[PersonalNaksCertificationData] = []
+
+        for row in rows:
+            certification = next(extracted) if isinstance(row, tuple) else row
+
+            if certification:
+                result.append(certification)
+
+        return result
+
+
+    def _prefetch_row(
+        self, 
+        main_cert_data: PersonalNaksCertificationMainPageData
+    ) -> PersonalNaksCertificationData | tuple[PersonalNaksCertificationMainPageData, NaksPage] | None:
+        if certification := get_reusable_certification_data(main_cert_data, self.context.known_certifications):
+            self.context.count_request("reused")
+            return certification
+
+        raw_additional_page = self._contain(
+            lambda: self.context.detail_flights.do(
+                main_cert_data.additional_page_id, 
+                lambda: self._get_additional_page(main_cert_data.additional_page_id)
+            ),
+            partial(self.context.add_failed_row, main_cert_data)
+        )
+
+        return (main_cert_data, raw_additional_page) if raw_additional_page else None
+
+
+    def _parse_row(self, main_cert_data: PersonalNaksCertificationMainPageData) -> PersonalNaksCertificationData | None:
+        if certification := get_reusable_certification_data(main_cert_data, self.context.known_certifications):
+            self.context.count_request("reused")
+            return certification
+
+        return self._contain(
+            lambda: self.context.detail_flights.do(main_cert_data.additional_page_id, lambda: self._fetch_row(main_cert_data)),
+            partial(self.context.add_failed_row, main_cert_data)
+        )
+
+
+    def _get_additional_page(self, key: str) -> NaksPage:
+        self.context.count_request("additional")
+
+        return self.http_worker.get_additional_page(key)
+
+
+    def _fetch_row(self, main_cert_data: PersonalNaksCertificationMainPageData) -> PersonalNaksCertificationData | None:
+        raw_additional_page = self._get_additional_page(main_cert_data.additional_page_id)
+        additional_page_data = self.extractor.parse_additional_page(raw_additional_page.content, raw_additional_page.encoding)
+
+        return build_certification_data(main_cert_data, additional_page_data)
+
+
+class AsyncPersonalNaksCertificationParser:
+
+    def __init__(self, context: ParseContext, max_in_flight: int = 100) -> None:
+        self.context = context
+        self.http_worker = AsyncPersonalNaksCertificationHttpWorker(
+            context.rate_limiter, 
+            max_in_flight, 
+            context.page_cache, 
+            context.transfer_stats
+        )
+        self.extractor = PersonalNaksCertificationExtractor()
+
+
+    async def __aenter__(self) -> t.Self:
+        return self
+
+
+    async def __aexit__(self, *args) -> None:
+        await self.http_worker.close()
+
+
+    async def parse(self, search_item: SearchNaksCertificationItem) -> list[PersonalNaksCertificationData]:
+        if self.context.stream_main_pages:
+            pages_count, first_page_result = await self._parse_streamed_page(search_item)
+            pages_count = self.context.limit_pages(search_item, pages_count)
+
+            pages_results = [
+                first_page_result,
+                *await gather(*(self._parse_page(search_item, page) for page in range(2, pages_count + 1)))
+            ]
+        else:
+            main_page = await self._get_main_page(search_item)
+            pages_count = self.context.limit_pages(search_item, main_page.pages_count)
+
+            pages_results = await gather(
+                self._parse_rows(main_page.rows),
+                *(self._parse_page(search_item, page) for page in range(2, pages_count + 1))
+            )
+
+        result: list[PersonalNaksCertificationData] = []
+
+        for page_result in pages_results:
+            result += page_result
+
+        return result
+
+
+    async def _get_main_page(self, search_item: SearchNaksCertificationItem, page: int = 1) -> PersonalNaksCertificationMainPage:
+        self.context.count_request("main")
+        raw_main_page = await self.http_worker.get_main_page(search_item, page)
+
+        if self.context.process_executor:
+            main_page = await get_running_loop().run_in_executor(
+                self.context.process_executor, 
+                extract_main_page, 
+                raw_main_page.content, 
+                raw_main_page.encoding
+            )
+        else:
+            main_page = self.extractor.parse_main_page(raw_main_page.content, raw_main_page.encoding)
+
+        main_page.rows = self.context.filter_rows(search_item, main_page.rows)
+
+        return main_page
+
+
+    async def _parse_page(self, search_item: SearchNaksCertificationItem, page: int) -> list[PersonalNaksCertificationData]:
+        if self.context.stream_main_pages:
+            return (await self._parse_streamed_page(search_item, page))[1]
+
+        main_page = await self._get_main_page(search_item, page)
+
+        return await self._parse_rows(main_page.rows)
+
+
+    async def _parse_streamed_page(self, search_item: SearchNaksCertificationItem, page: int = 1) -> tuple[int, list[PersonalNaksCertificationData]]:
+        self.context.count_request("main")
+        tasks: list[Task[list[PersonalNaksCertificationData]]] = []
+
+        try:
+            async with self.http_worker.stream_main_page(search_item, page) as stream:
+                feed = self.extractor.feed_main_page(stream.encoding)
+
+                async for chunk in stream.chunks:
+                    tasks.append(self._schedule_rows(search_item, feed.feed(chunk)))
+
+                tasks.append(self._schedule_rows(search_item, feed.close()))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+
+            raise
+
+        result: list[PersonalNaksCertificationData] = []
+
+        for chunk_result in await gather(*tasks):
+            result += chunk_result
+
+        return feed.pages_count, result
+
+
+    def _schedule_rows(
+        self,
+        search_item: SearchNaksCertificationItem,
+        main_certs_data: list[PersonalNaksCertificationMainPageData]
+    ) -> Task[list[PersonalNaksCertificationData]]:
+        return create_task(self._parse_rows(self.context.filter_rows(search_item, main_certs_data)))
+
+
+    async def _get_additional_page(self, key: str) -> NaksPage:
+        self.context.count_request("additional")
+
+        return await self.http_worker.get_additional_page(key)
+
+
+    async def _parse_rows(self, main_certs_data: list[PersonalNaksCertificationMainPageData]) -> list[PersonalNaksCertificationData]:
+        if self.context.process_executor:
+            return await self._parse_rows_in_processes(main_certs_data)
+
+        certifications = await gather(*(self._parse_row(main_cert_data) for main_cert_data in main_certs_data))
+
+        return [certification for certification in certifications if certification]
+
+
+    async def _parse_rows_in_processes(self, main_certs_data: list[PersonalNaksCertificationMainPageData]) -> list[PersonalNaksCertificationData]:
+        result: list[PersonalNaksCertificationData] = []
+        fetched_rows: list[PersonalNaksCertificationMainPageData] = []
+
+        for main_cert_data in main_certs_data:
+            if certification := get_reusable_certification_data(main_cert_data, self.context.known_certifications):
+                self.context.count_request("reused")
+                result.append(certification)
+            else:
+                fetched_rows.append(main_cert_data)
+
+        raw_additional_pages = await gather(*(
+            self.context.async_detail_flights.do(
+                main_cert_data.additional_page_id, 
+                lambda key=main_cert_data.additional_page_id: self._get_additional_page(key)
+            )
+            for main_cert_data in fetched_rows
+        ))
+
+        if fetched_rows:
+            certifications = await get_running_loop().run_in_executor(
+                self.context.process_executor,
+                extract_certifications,
+                [(main_cert_data, page.content, page.encoding) for main_cert_data, page in zip(fetched_rows, raw_additional_pages)]
+            )
+            result += [certification for certification in certifications if certification]
+
+        return result
+
+
+    async def _parse_row(self, main_cert_data: PersonalNaksCertificationMainPageData) -> PersonalNaksCertificationData | None:
+        if certification := get_reusable_certification_data(main_cert_data, self.context.known_certifications):
+            self.context.count_request("reused")
+            return certification
+
+        return await self.context.async_detail_flights.do(main_cert_data.additional_page_id, lambda: self._fetch_row(main_cert_data))
+
+
+    async def _fetch_row(self, main_cert_data: PersonalNaksCertificationMainPageData) -> PersonalNaksCertificationData | None:
+        raw_additional_page = await self._get_additional_page(main_cert_data.additional_page_id)
+        additional_page_data = self.extractor.parse_additional_page(raw_additional_page.content, raw_additional_page.encoding)
+
+        return build_certification_data(main_cert_data, additional_page_data)
+
+
+class PersonalNaksCertificationPipelineParser:
+
+    def __init__(self, context: ParseContext) -> None:
+        self.context = context
+        self.http_worker = PersonalNaksCertificationHttpWorker(
+            context.rate_limiter, 
+            context.request_observer, 
+            context.page_cache, 
+            context.transfer_stats,
+            context.sessions
+        )
+        self.extractor = PersonalNaksCertificationExtractor()
+
+
+    def search(self, search_item: SearchNaksCertificationItem) -> t.Iterator[PersonalNaksCertificationMainPageTask]:
+        yield PersonalNaksCertificationMainPageTask(search_item, 1)
+
+
+    def fetch_main_page(self, task: PersonalNaksCertificationMainPageTask) -> t.Iterator[PersonalNaksCertificationMainPageTask]:
+        task.raw_page = self._get_main_page(task.search_item, task.page)
+
+        yield task
+
+        yield from self._iter_next_pages(task.search_item, self.extractor.get_pages_count(task.raw_page.content, task.raw_page.encoding))
+
+
+    def extract_rows(self, task: PersonalNaksCertificationMainPageTask) -> t.Iterator[PersonalNaksCertificationRowTask]:
+        if self.context.process_executor:
+            main_page = self.context.process_executor.submit(extract_main_page, task.raw_page.content, task.raw_page.encoding).result()
+        else:
+            main_page = self.extractor.parse_main_page(task.raw_page.content, task.raw_page.encoding)
+
+        for main_cert_data in self.context.filter_rows(task.search_item, main_page.rows):
+            certification = get_reusable_certification_data(main_cert_data, self.context.known_certifications)
+
+            if certification:
+                self.context.count_request("reused")
+
+            yield PersonalNaksCertificationRowTask(main_cert_data, certification=certification)
+
+
+    def fetch_detail(self, task: PersonalNaksCertificationRowTask) -> t.Iterator[PersonalNaksCertificationRowTask]:
+        if task.certification is None:
+            task.raw_additional_page = self.context.detail_flights.do(
+                task.main_cert_data.additional_page_id, 
+                lambda: self._get_additional_page(task.main_cert_data.additional_page_id)
+            )
+
+        yield task
+
+
+    def extract_detail(self, task: PersonalNaksCertificationRowTask) -> t.Iterator[PersonalNaksCertificationRowTask]:
+        if task.certification is None and self.context.process_executor:
+            task.certification = self.context.process_executor.submit(
+                extract_certifications, 
+                [(task.main_cert_data, task.raw_additional_page.content, task.raw_additional_page.encoding)]
+            ).result()[0]
+
+            if task.certification is None:
+                return
+        elif task.certification is None:
+            task.additional_page_data = self.extractor.parse_additional_page(task.raw_additional_page.content, task.raw_additional_page.encoding)
+
+        task.raw_additional_page = None
+
+        yield task
+
+
+    def validate(self, task: PersonalNaksCertificationRowTask) -> t.Iterator[PersonalNaksCertificationData]:
+        certification = task.certification or build_certification_data(task.main_cert_data, task.additional_page_data)
+
+        if certification:
+            yield certification
+
+
+    def _iter_next_pages(self, search_item: SearchNaksCertificationItem, pages_count: int) -> t.Iterator[PersonalNaksCertificationMainPageTask]:
+        pages = range(2, pages_count + 1)
+
+        if not self.context.pages_executor:
+            return (PersonalNaksCertificationMainPageTask(search_item, page, self._get_main_page(search_item, page)) for page in pages)
+
+        futures = [self.context.pages_executor.submit(self._get_main_page, search_item, page) for page in pages]
+
+        return (PersonalNaksCertificationMainPageTask(search_item, page, future.result()) for page, future in zip(pages, futures))
+
+
+    def _get_main_page(self, search_item: SearchNaksCertificationItem, page: int) -> NaksPage:
+        self.context.count_request("main")
+
+        return self.http_worker.get_main_page(search_item, page)
+
+
+    def _get_additional_page(self, key: str) -> NaksPage:
+        self.context.count_request("additional")
 
-        return result     
+        return self.http_worker.get_additional_page(key)
@@ -0,0 +1,2 @@
+from src.infrastructure.sinks.result_sinks import NdjsonResultSink, JsonResultSink
+from src.infrastructure.sinks.arrow_sink import ArrowResultSink
@@ -0,0 +1,84 @@
+from pathlib import Path
+
+from pydantic import BaseModel
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+
+__all__ = [
+    "ArrowResultSink",
+    "personal_naks_certification_schema"
+]
+
+
+def personal_naks_certification_schema() -> "pa.Schema":
+    return pa.schema([
+        ("name", pa.string()),
+        ("kleymo", pa.string()),
+        ("certification_number", pa.string()),
+        ("certification_date", pa.date32()),
+        ("expiration_date", pa.date32()),
+        ("expiration_date_fact", pa.date32()),
+        ("insert", pa.string()),
+        ("company", pa.string()),
+        ("gtd", pa.list_(pa.string())),
+        ("method", pa.string()),
+        ("detail_types", pa.list_(pa.string())),
+        ("joint_types", pa.list_(pa.string())),
+        ("materials", pa.list_(pa.string())),
+        ("detail_thikness_from", pa.float64()),
+        ("detail_thikness_before", pa.float64()),
+        ("outer_diameter_from", pa.float64()),
+        ("outer_diameter_before", pa.float64()),
+        ("rod_diameter_from", pa.float64()),
+        ("rod_diameter_before", pa.float64()),
+        ("detail_diameter_from", pa.float64()),
+        ("detail_diameter_before", pa.float64()),
+        ("html", pa.string())
+    ])
+
+
+class ArrowResultSink:
+
+    def __init__(self, path: Path, file_format: str = "parquet", batch_size: int = 10000) -> None:
+        if pa is None:
+            raise ImportError("pyarrow is required for arrow and parquet output, install the arrow extra")
+
+        self.path = path
+        self.batch_size = batch_size
+        self.schema = personal_naks_certification_schema()
+        self.written = 0
+
+        self._rows: list[dict] = []
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        if file_format == "parquet":
+            self._writer = pq.ParquetWriter(path, self.schema)
+        else:
+            self._writer = pa.ipc.new_file(path, self.schema)
+
+
+    def write(self, result: BaseModel) -> None:
+        self._rows.append({name: getattr(result, name) for name in self.schema.names})
+        self.written += 1
+
+        if len(self._rows) >= self.batch_size:
+            self._flush()
+
+
+    def close(self) -> None:
+        self._flush()
+        self._writer.close()
+
+
+    def _flush(self) -> None:
+        if not self._rows:
+            return
+
+        self._writer.write_batch(pa.RecordBatch.from_pylist(self._rows, schema=self.schema))
+        self._rows.clear()
@@ -0,0 +1,57 @@
+from pathlib import Path
+import gzip
+import typing as t
+
+from pydantic import BaseModel
+
+from src.utils.funcs import save_json
+
+
+__all__ = [
+    "NdjsonResultSink",
+    "JsonResultSink"
+]
+
+
+class NdjsonResultSink:
+
+    def __init__(self, path: Path, compress: bool = True) -> None:
+        self.path = path
+        self.written = 0
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        if compress:
+            self._file: t.TextIO = gzip.open(path, "wt", encoding="utf-8")
+        else:
+            self._file = open(path, "w", encoding="utf-8")
+
+
+    def write(self, result: BaseModel) -> None:
+        self._file.write(result.model_dump_json())
+        self._file.write("\n")
+        self.written += 1
+
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class JsonResultSink:
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.written = 0
+
+        self._results: list[dict] = []
+
+
+    def write(self, result: BaseModel) -> None:
+        self._results.append(result.model_dump(mode="json"))
+        self.written += 1
+
+
+    def close(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        save_json(self._results, self.path)
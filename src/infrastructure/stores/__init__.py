@@ -0,0 +1,3 @@
+from src.infrastructure.stores.json_store import JsonPersonalNaksCertificationStore
+from src.infrastructure.stores.parse_journal import NdjsonPersonalNaksParseJournal
+from src.infrastructure.stores.sqlite_store import SqlitePersonalNaksCertificationReader, SqlitePersonalNaksCertificationStore
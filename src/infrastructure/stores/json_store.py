@@ -0,0 +1,76 @@
+from datetime import date
+from pathlib import Path
+from typing import Iterable
+
+from src.infrastructure.dto import PersonalNaksCertificationData
+from src.utils.funcs import read_json, read_ndjson, save_json
+
+
+__all__ = [
+    "JsonPersonalNaksCertificationStore"
+]
+
+
+class JsonPersonalNaksCertificationStore:
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.watermark: date | None = None
+        self.certifications: dict[str, PersonalNaksCertificationData] = {}
+
+        if path.exists():
+            self._load()
+
+
+    def get(self, certification_number: str) -> PersonalNaksCertificationData | None:
+        return self.certifications.get(certification_number)
+
+
+    def upsert(self, certifications: Iterable[PersonalNaksCertificationData]) -> int:
+        changed = 0
+
+        for certification in certifications:
+            if self.certifications.get(certification.certification_number) == certification:
+                continue
+
+            self.certifications[certification.certification_number] = certification
+            changed += 1
+
+        return changed
+
+
+    def get_watermark(self) -> date | None:
+        return self.watermark
+
+
+    def set_watermark(self, value: date) -> None:
+        self.watermark = value
+
+
+    def commit(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        save_json(
+            {
+                "watermark": self.watermark.isoformat() if self.watermark else None,
+                "certifications": [el.model_dump(mode="json") for el in self.certifications.values()]
+            },
+            self.path
+        )
+
+
+    def _load(self) -> None:
+        if self.path.name.endswith((".ndjson", ".ndjson.gz")):
+            content: dict | list[dict] = list(read_ndjson(self.path))
+        else:
+            content = read_json(self.path)
+
+        if isinstance(content, list):
+            content = {"watermark": None, "certifications": content}
+
+        if content["watermark"]:
+            self.watermark = date.fromisoformat(content["watermark"])
+
+        for el in content["certifications"]:
+            certification = PersonalNaksCertificationData.model_validate(el)
+            self.certifications[certification.certification_number] = certification
@@ -0,0 +1,83 @@
+from dataclasses import asdict, astuple
+from json import JSONDecodeError, dumps, loads
+from threading import Lock
+from pathlib import Path
+import os
+
+from src.infrastructure.dto import PersonalNaksCertificationData, SearchNaksCertificationItem
+
+
+__all__ = [
+    "NdjsonPersonalNaksParseJournal"
+]
+
+
+class NdjsonPersonalNaksParseJournal:
+
+    def __init__(self, path: Path, resume: bool = False) -> None:
+        self.path = path
+        self.completed_results: list[PersonalNaksCertificationData] = []
+
+        self._completed_items: set[tuple] = set()
+        self._lock = Lock()
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        if resume and path.exists():
+            self._load()
+        else:
+            path.write_bytes(b"")
+
+        self._file = open(path, "a", encoding="utf-8")
+
+
+    def is_completed(self, search_item: SearchNaksCertificationItem) -> bool:
+        return astuple(search_item) in self._completed_items
+
+
+    def get_completed_results(self) -> list[PersonalNaksCertificationData]:
+        return self.completed_results
+
+
+    def append(self, search_item: SearchNaksCertificationItem, result: list[PersonalNaksCertificationData]) -> None:
+        line = dumps(
+            {"search_item": asdict(search_item), "result": [el.model_dump(mode="json") for el in result]}, 
+            ensure_ascii=False
+        )
+
+        with self._lock:
+            self._file.write(f"{line}\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+
+    def close(self) -> None:
+        self._file.close()
+
+
+    def discard(self) -> None:
+        self.close()
+        self.path.unlink(missing_ok=True)
+
+
+    def _load(self) -> None:
+        valid_size = 0
+
+        with open(self.path, "rb") as file:
+            for line in file:
+                # the last line is cut when the run was killed in the middle of a write
+                if not line.endswith(b"\n"):
+                    break
+
+                try:
+                    entry = loads(line)
+                except JSONDecodeError:
+                    break
+
+                self._completed_items.add(astuple(SearchNaksCertificationItem(**entry["search_item"])))
+                self.completed_results += [PersonalNaksCertificationData.model_validate(el) for el in entry["result"]]
+
+                valid_size += len(line)
+
+        with open(self.path, "r+b") as file:
+            file.truncate(valid_size)
@@ -0,0 +1,353 @@
+from datetime import date, datetime
+from hashlib import sha256
+from queue import Empty, Queue
+from threading import Lock, Thread
+from typing import Iterable
+from pathlib import Path
+import sqlite3
+
+from src.infrastructure.dto import PersonalNaksCertificationData
+
+
+__all__ = [
+    "SqlitePersonalNaksCertificationReader",
+    "SqlitePersonalNaksCertificationStore"
+]
+
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA foreign_keys=ON;
+
+CREATE TABLE IF NOT EXISTS certifications (
+    certification_number TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    kleymo TEXT,
+    company TEXT NOT NULL,
+    certification_date TEXT NOT NULL,
+    expiration_date TEXT NOT NULL,
+    expiration_date_fact TEXT NOT NULL,
+    method TEXT,
+    detail_thikness_from REAL,
+    detail_thikness_before REAL,
+    outer_diameter_from REAL,
+    outer_diameter_before REAL,
+    data TEXT NOT NULL,
+    data_hash TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS certifications_kleymo ON certifications (kleymo);
+CREATE INDEX IF NOT EXISTS certifications_company ON certifications (company);
+CREATE INDEX IF NOT EXISTS certifications_expiration_date_fact ON certifications (expiration_date_fact);
+CREATE INDEX IF NOT EXISTS certifications_detail_thikness ON certifications (detail_thikness_from, detail_thikness_before);
+
+CREATE TABLE IF NOT EXISTS certification_gtds (
+    gtd TEXT NOT NULL,
+    certification_number TEXT NOT NULL REFERENCES certifications ON DELETE CASCADE,
+    PRIMARY KEY (gtd, certification_number)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS certification_gtds_certification_number ON certification_gtds (certification_number);
+
+CREATE TABLE IF NOT EXISTS certification_materials (
+    material TEXT NOT NULL,
+    certification_number TEXT NOT NULL REFERENCES certifications ON DELETE CASCADE,
+    PRIMARY KEY (material, certification_number)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS certification_materials_certification_number ON certification_materials (certification_number);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+UPSERT = """
+INSERT INTO certifications VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (certification_number) DO UPDATE SET
+    name = excluded.name,
+    kleymo = excluded.kleymo,
+    company = excluded.company,
+    certification_date = excluded.certification_date,
+    expiration_date = excluded.expiration_date,
+    expiration_date_fact = excluded.expiration_date_fact,
+    method = excluded.method,
+    detail_thikness_from = excluded.detail_thikness_from,
+    detail_thikness_before = excluded.detail_thikness_before,
+    outer_diameter_from = excluded.outer_diameter_from,
+    outer_diameter_before = excluded.outer_diameter_before,
+    data = excluded.data,
+    data_hash = excluded.data_hash,
+    updated_at = excluded.updated_at
+"""
+
+
+class SqlitePersonalNaksCertificationReader:
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+        self._read_connection = self._connect_reader()
+        self._read_connection.create_function("casefold", 1, str.casefold, deterministic=True)
+        self._read_lock = Lock()
+
+
+    def get(self, certification_number: str) -> PersonalNaksCertificationData | None:
+        with self._read_lock:
+            row = self._read_connection.execute(
+                "SELECT data FROM certifications WHERE certification_number = ?",
+                (certification_number,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        return PersonalNaksCertificationData.model_validate_json(row[0])
+
+
+    def find(
+        self,
+        kleymo: str | None = None,
+        company: str | None = None,
+        company_prefix: str | None = None,
+        active_on: date | None = None,
+        expiring_before: date | None = None,
+        gtd: str | None = None,
+        material: str | None = None,
+        detail_thikness: float | None = None,
+        outer_diameter: float | None = None
+    ) -> list[PersonalNaksCertificationData]:
+        conditions: list[str] = []
+        params: list[str | float] = []
+
+        if kleymo is not None:
+            conditions.append("kleymo = ?")
+            params.append(kleymo)
+
+        if company is not None:
+            conditions.append("instr(casefold(company), ?) > 0")
+            params.append(company.casefold())
+
+        if company_prefix:
+            conditions.append("company >= ? AND company < ?")
+            params += [company_prefix, company_prefix[:-1] + chr(ord(company_prefix[-1]) + 1)]
+
+        if active_on is not None:
+            conditions.append("expiration_date_fact >= ?")
+            params.append(active_on.isoformat())
+
+        if expiring_before is not None:
+            conditions.append("expiration_date_fact < ?")
+            params.append(expiring_before.isoformat())
+
+        if gtd is not None:
+            conditions.append(
+                "certification_number IN (SELECT certification_number FROM certification_gtds WHERE gtd = ? OR gtd > ? AND gtd < ?)"
+            )
+            params += [gtd, f"{gtd}(", f"{gtd})"]
+
+        if material is not None:
+            conditions.append("certification_number IN (SELECT certification_number FROM certification_materials WHERE material = ?)")
+            params.append(material)
+
+        for column, value in [("detail_thikness", detail_thikness), ("outer_diameter", outer_diameter)]:
+            if value is None:
+                continue
+
+            conditions.append(
+                f"({column}_from IS NOT NULL OR {column}_before IS NOT NULL) "
+                f"AND COALESCE({column}_from, 0) <= ? AND COALESCE({column}_before, ?) >= ?"
+            )
+            params += [value, value, value]
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        with self._read_lock:
+            rows = self._read_connection.execute(
+                f"SELECT data FROM certifications {where} ORDER BY expiration_date_fact, certification_number", 
+                params
+            ).fetchall()
+
+        return [PersonalNaksCertificationData.model_validate_json(row[0]) for row in rows]
+
+
+    def get_watermark(self) -> date | None:
+        with self._read_lock:
+            row = self._read_connection.execute("SELECT value FROM meta WHERE key = 'watermark'").fetchone()
+
+        return date.fromisoformat(row[0]) if row else None
+
+
+    def close(self) -> None:
+        self._read_connection.close()
+
+
+    def _connect_reader(self) -> sqlite3.Connection:
+        return sqlite3.connect(f"{self.path.absolute().as_uri()}?mode=ro", uri=True, check_same_thread=False)
+
+
+class SqlitePersonalNaksCertificationStore(SqlitePersonalNaksCertificationReader):
+
+    def __init__(self, path: Path, batch_size: int = 500) -> None:
+        self.path = path
+        self.batch_size = batch_size
+        self.written = 0
+        self.changed = 0
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._write_connection = sqlite3.connect(path, check_same_thread=False)
+        self._write_lock = Lock()
+        self._migrate()
+
+        super().__init__(path)
+
+        self._queue: Queue[PersonalNaksCertificationData | None] = Queue()
+        self._error: Exception | None = None
+        self._writer = Thread(target=self._write_batches, name="sqlite-store-writer", daemon=True)
+        self._writer.start()
+
+
+    def write(self, result: PersonalNaksCertificationData) -> None:
+        self._queue.put(result)
+        self.written += 1
+
+
+    def upsert(self, certifications: Iterable[PersonalNaksCertificationData]) -> int:
+        changed = self.changed
+
+        for certification in certifications:
+            self.write(certification)
+
+        self.commit()
+
+        return self.changed - changed
+
+
+    def set_watermark(self, value: date) -> None:
+        with self._write_lock, self._write_connection:
+            self._write_connection.execute("INSERT OR REPLACE INTO meta VALUES ('watermark', ?)", (value.isoformat(),))
+
+
+    def commit(self) -> None:
+        self._queue.join()
+
+        if self._error:
+            error, self._error = self._error, None
+            raise error
+
+
+    def close(self) -> None:
+        try:
+            self.commit()
+        finally:
+            self._queue.put(None)
+            self._writer.join()
+
+            super().close()
+            self._write_connection.close()
+
+
+    def _connect_reader(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, check_same_thread=False)
+
+
+    def _migrate(self) -> None:
+        if self._write_connection.execute("PRAGMA user_version").fetchone()[0] not in (0, SCHEMA_VERSION):
+            raise RuntimeError(f"{self.path} has unsupported schema version")
+
+        self._write_connection.executescript(SCHEMA)
+        self._write_connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+
+    def _write_batches(self) -> None:
+        stopped = False
+
+        while not stopped:
+            batch = [self._queue.get()]
+
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except Empty:
+                    break
+
+            certifications = [el for el in batch if el is not None]
+            stopped = len(certifications) < len(batch)
+
+            try:
+                if certifications:
+                    self._upsert_batch(certifications)
+            except Exception as e:
+                self._error = e
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+
+    def _upsert_batch(self, certifications: list[PersonalNaksCertificationData]) -> None:
+        rows: dict[str, tuple] = {}
+
+        for certification in certifications:
+            data = certification.model_dump_json()
+            rows[certification.certification_number] = (certification, data, sha256(data.encode()).hexdigest())
+
+        with self._write_lock, self._write_connection:
+            stored_hashes = dict(
+                self._write_connection.execute(
+                    f"SELECT certification_number, data_hash FROM certifications WHERE certification_number IN ({', '.join('?' * len(rows))})",
+                    list(rows)
+                )
+            )
+
+            changed = [row for number, row in rows.items() if stored_hashes.get(number) != row[2]]
+
+            if not changed:
+                return
+
+            updated_at = datetime.now().isoformat(timespec="seconds")
+            numbers = [(el.certification_number,) for el, _, _ in changed]
+
+            self._write_connection.executemany(
+                UPSERT,
+                [self._to_row(certification, data, data_hash, updated_at) for certification, data, data_hash in changed]
+            )
+
+            self._write_connection.executemany("DELETE FROM certification_gtds WHERE certification_number = ?", numbers)
+            self._write_connection.executemany(
+                "INSERT OR IGNORE INTO certification_gtds VALUES (?, ?)",
+                [(gtd, el.certification_number) for el, _, _ in changed for gtd in el.gtd]
+            )
+
+            self._write_connection.executemany("DELETE FROM certification_materials WHERE certification_number = ?", numbers)
+            self._write_connection.executemany(
+                "INSERT OR IGNORE INTO certification_materials VALUES (?, ?)",
+                [(material, el.certification_number) for el, _, _ in changed for material in el.materials or []]
+            )
+
+        self.changed += len(changed)
+
+
+    def _to_row(self, certification: PersonalNaksCertificationData, data: str, data_hash: str, updated_at: str) -> tuple:
+        return (
+            certification.certification_number,
+            certification.name,
+            certification.kleymo,
+            certification.company,
+            certification.certification_date.isoformat(),
+            certification.expiration_date.isoformat(),
+            certification.expiration_date_fact.isoformat(),
+            certification.method,
+            certification.detail_thikness_from,
+            certification.detail_thikness_before,
+            certification.outer_diameter_from,
+            certification.outer_diameter_before,
+            data,
+            data_hash,
+            updated_at
+        )
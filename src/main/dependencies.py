@@ -1,6 +1,15 @@
 from dishka import Provider, Scope, provide
 
-from src.application.interactors import LoginInteractor, ParsePersonalNaksCertificationsInteractor
+from src.application.interactors import (
+    LoginInteractor, 
+    ParsePersonalNaksCertificationsInteractor, 
+    AsyncParsePersonalNaksCertificationsInteractor,
+    PipelineParsePersonalNaksCertificationsInteractor,
+    SyncPersonalNaksCertificationsMirrorInteractor,
+    ParseExpiringPersonalNaksCertificationsInteractor,
+    PlannedParsePersonalNaksCertificationsInteractor
+)
+from src.application.planners import PersonalNaksSearchPlanner
 
 
 class DependecyProvider(Provider):
@@ -13,3 +22,37 @@ class DependecyProvider(Provider):
     @provide(scope=Scope.APP)
     def provide_parse_personal_naks_certifications_interactor(self) -> ParsePersonalNaksCertificationsInteractor:
         return ParsePersonalNaksCertificationsInteractor()
+
+
+    @provide(scope=Scope.APP)
+    def provide_async_parse_personal_naks_certifications_interactor(self) -> AsyncParsePersonalNaksCertificationsInteractor:
+        return AsyncParsePersonalNaksCertificationsInteractor()
+
+
+    @provide(scope=Scope.APP)
+    def provide_pipeline_parse_personal_naks_certifications_interactor(self) -> PipelineParsePersonalNaksCertificationsInteractor:
+        return PipelineParsePersonalNaksCertificationsInteractor()
+
+
+    @provide(scope=Scope.APP)
+    def provide_sync_personal_naks_certifications_mirror_interactor(
+        self, 
+        parse: ParsePersonalNaksCertificationsInteractor
+    ) -> SyncPersonalNaksCertificationsMirrorInteractor:
+        return SyncPersonalNaksCertificationsMirrorInteractor(parse)
+
+
+    @provide(scope=Scope.APP)
+    def provide_parse_expiring_personal_naks_certifications_interactor(
+        self, 
+        parse: ParsePersonalNaksCertificationsInteractor
+    ) -> ParseExpiringPersonalNaksCertificationsInteractor:
+        return ParseExpiringPersonalNaksCertificationsInteractor(parse)
+
+
+    @provide(scope=Scope.APP)
+    def provide_planned_parse_personal_naks_certifications_interactor(
+        self, 
+        parse: ParsePersonalNaksCertificationsInteractor
+    ) -> PlannedParsePersonalNaksCertificationsInteractor:
+        return PlannedParsePersonalNaksCertificationsInteractor(parse, PersonalNaksSearchPlanner())
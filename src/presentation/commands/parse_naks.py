@@ -1,23 +1,190 @@
+from datetime import date, datetime, timedelta
 from pathlib import Path
 
-from src.utils.funcs import read_json, save_json
-from click import Command, Option, group
+from src.utils.funcs import read_json
+from click import BadParameter, Choice, UsageError, Command, DateTime, Option, echo, group
 from dishka import FromDishka
 
-from src.application.interactors import ParsePersonalNaksCertificationsInteractor
+from src.application.interactors import (
+    ParsePersonalNaksCertificationsInteractor, 
+    AsyncParsePersonalNaksCertificationsInteractor,
+    PipelineParsePersonalNaksCertificationsInteractor,
+    SyncPersonalNaksCertificationsMirrorInteractor,
+    ParseExpiringPersonalNaksCertificationsInteractor,
+    PlannedParsePersonalNaksCertificationsInteractor
+)
 from src.infrastructure.dto import SearchNaksCertificationItem, PersonalNaksCertificationData
+from src.infrastructure.caches import SqlitePageCache
+from src.application.interfaces.result_sink import IResultSink
+from src.infrastructure.sinks import ArrowResultSink, JsonResultSink, NdjsonResultSink
+from src.infrastructure.parsers.base import ParseContext
+from src.application.interfaces.certification_store import IPersonalNaksCertificationStore
+from src.infrastructure.stores import (
+    JsonPersonalNaksCertificationStore, 
+    SqlitePersonalNaksCertificationStore, 
+    NdjsonPersonalNaksParseJournal
+)
 from src.presentation.cli_types import OptionalPath
+from src.utils.concurrency import AIMDConcurrencyController
+from src.utils.parse_utils import get_normalization_cache_stats
+from src.utils.rate_limiter import TokenBucketRateLimiter
 from src.config import ApplicationConfig
 
 
+PIPELINE_STAGES = list(PipelineParsePersonalNaksCertificationsInteractor.default_stage_workers)
+
+
+def output_options() -> list[Option]:
+    return [
+        Option(["--output-format", "-of"], type=Choice(["ndjson", "json", "parquet", "arrow", "sqlite"]), default="ndjson", show_default=True, help="json is written at the end, other formats while parsing, sqlite upserts into --store-path"),
+        Option(["--compress/--no-compress"], default=True, show_default=True, help="gzip ndjson output"),
+        Option(["--store-path", "-stp"], type=Path, default=ApplicationConfig.PERSONAL_NAKS_STORE_PATH, show_default=True, help="sqlite store path for sqlite output format")
+    ]
+
+
+SQLITE_SUFFIXES = (".sqlite3", ".sqlite", ".db")
+
+
+def make_result_sink(save_file_name: str, output_format: str, compress: bool, store_path: Path) -> IResultSink[PersonalNaksCertificationData]:
+    if output_format == "sqlite":
+        return SqlitePersonalNaksCertificationStore(store_path)
+
+    if output_format == "json":
+        return JsonResultSink(ApplicationConfig.SAVES_DIR() / f"{save_file_name}.json")
+
+    if output_format in ["parquet", "arrow"]:
+        try:
+            return ArrowResultSink(ApplicationConfig.SAVES_DIR() / f"{save_file_name}.{output_format}", output_format)
+        except ImportError as e:
+            raise UsageError(str(e))
+
+    suffix = ".ndjson.gz" if compress else ".ndjson"
+
+    return NdjsonResultSink(ApplicationConfig.SAVES_DIR() / f"{save_file_name}{suffix}", compress)
+
+
+def save_search_result(data: list[PersonalNaksCertificationData], sink: IResultSink[PersonalNaksCertificationData]) -> None:
+    for el in data:
+        sink.write(el)
+
+
+def close_result_sink(sink: IResultSink[PersonalNaksCertificationData]) -> None:
+    sink.close()
+
+    echo(f"{sink.written} certifications saved to {sink.path}")
+
+    if isinstance(sink, SqlitePersonalNaksCertificationStore):
+        echo(f"{sink.changed} of them are new or changed")
+
+
+def parse_stage_workers(values: tuple[str, ...]) -> dict[str, int]:
+    result: dict[str, int] = {}
+
+    for value in values:
+        name, _, workers = value.partition("=")
+
+        if name not in PIPELINE_STAGES or not workers.isdigit() or int(workers) < 1:
+            raise BadParameter(f"{value} (expected name=N, stages: {', '.join(PIPELINE_STAGES)})", param_hint="--stage-workers")
+
+        result[name] = int(workers)
+
+    return result
+
+
+def request_options() -> list[Option]:
+    return [
+        Option(["--rps"], type=float, default=2, show_default=True, help="max requests per second to naks.ru shared by all workers"),
+        Option(["--burst"], type=int, default=5, show_default=True, help="max requests burst above --rps"),
+        Option(["--page-workers", "-pw"], type=int, default=4, show_default=True, help="threads fetching next result pages of broad searches"),
+        Option(["--detail-workers", "-dw"], type=int, default=8, show_default=True, help="threads prefetching detail pages of result rows shared by all workers"),
+        Option(["--stream", "-s"], is_flag=True, default=False, help="parse result pages rows while they are downloading"),
+        Option(["--parse-processes", "-pp"], type=int, default=0, show_default=True, help="processes extracting and validating downloaded pages, 0 parses them in fetch workers")
+    ]
+
+
+def cache_options() -> list[Option]:
+    return [
+        Option(["--http-cache", "-hc"], is_flag=True, default=False, help="reuse pages saved on disk by previous runs"),
+        Option(["--cache-main-ttl"], type=float, default=1, show_default=True, help="result pages cache lifetime, hours"),
+        Option(["--cache-detail-ttl"], type=float, default=24, show_default=True, help="detail pages cache lifetime, hours"),
+        Option(["--cache-max-size"], type=int, default=512, show_default=True, help="cache size limit, MB")
+    ]
+
+
+def make_page_cache(http_cache: bool, cache_main_ttl: float, cache_detail_ttl: float, cache_max_size: int) -> SqlitePageCache | None:
+    if not http_cache:
+        return None
+
+    return SqlitePageCache(
+        ApplicationConfig.HTTP_CACHE_PATH(),
+        ttls={
+            "main": timedelta(hours=cache_main_ttl),
+            "additional": timedelta(hours=cache_detail_ttl)
+        },
+        max_size=cache_max_size * 2 ** 20
+    )
+
+
+def make_certification_store(path: Path) -> IPersonalNaksCertificationStore:
+    if path.suffix in SQLITE_SUFFIXES:
+        return SqlitePersonalNaksCertificationStore(path)
+
+    return JsonPersonalNaksCertificationStore(path)
+
+
+def close_certification_store(store: IPersonalNaksCertificationStore | None) -> None:
+    if isinstance(store, SqlitePersonalNaksCertificationStore):
+        store.close()
+
+
+def make_known_certifications(reuse_from: Path | None) -> IPersonalNaksCertificationStore | None:
+    if not reuse_from:
+        return None
+
+    return make_certification_store(reuse_from)
+
+
+def echo_run_summary(context: ParseContext) -> None:
+    if context.known_certifications:
+        echo(f"detail pages: {context.requests_count['additional']} fetched, {context.requests_count['reused']} reused from previous results")
+
+    if coalesced := context.get_coalesced_count():
+        echo(f"detail pages: {coalesced} requests coalesced with concurrent ones")
+
+    if context.page_cache:
+        echo(context.page_cache.summary())
+
+    echo(context.transfer_stats.summary())
+
+    cache_stats = get_normalization_cache_stats()
+    hits = sum(el[0] for el in cache_stats.values())
+    calls = hits + sum(el[1] for el in cache_stats.values())
+
+    if calls:
+        per_field = ", ".join(f"{name} {el[0]}/{el[0] + el[1]}" for name, el in cache_stats.items())
+        echo(f"normalization cache: {hits / calls:.0%} hits ({per_field})")
+
+
 class PersonalNaksCertificationsCommand(Command): 
     def __init__(self):
         name = "personal-naks-certs"
 
         params= [
             Option(["--search-items-path", "-sip"], type=OptionalPath(), help="path to json file"),
-            Option(["--threads", "-th"], type=int, default=1, show_default=True, help="threads amount"),
-            Option(["--save-file-name", "-sfn"], type=str)
+            Option(["--threads", "-th"], type=int, default=1, show_default=True, help="threads amount (coroutines amount for async engine)"),
+            Option(["--engine", "-e"], type=Choice(["threads", "async", "pipeline"]), default="threads", show_default=True, help="fetch engine"),
+            Option(["--max-in-flight", "-mif"], type=int, default=100, show_default=True, help="max concurrent requests for async engine"),
+            Option(["--adaptive", "-a"], is_flag=True, default=False, help="auto-tune concurrent requests during the run starting from --threads"),
+            Option(["--max-threads", "-mth"], type=int, default=32, show_default=True, help="upper threads and concurrent requests bound for --adaptive"),
+            Option(["--stage-workers", "-sw"], type=str, multiple=True, help=f"pipeline engine stage workers as name=N, stages: {', '.join(PIPELINE_STAGES)}"),
+            Option(["--stage-queue-size", "-sqs"], type=int, default=100, show_default=True, help="pipeline engine queue size in front of every stage"),
+            Option(["--plan", "-p"], is_flag=True, default=False, help="collapse narrow search items into few broad searches"),
+            *request_options(),
+            *cache_options(),
+            Option(["--reuse-from", "-rf"], type=OptionalPath(), help="previous save (json or ndjson), mirror json file or sqlite store, details of unchanged certifications are taken from it"),
+            Option(["--resume", "-rs"], is_flag=True, default=False, help="skip search items completed by the interrupted run with the same --save-file-name"),
+            *output_options(),
+            Option(["--save-file-name", "-sfn"], type=str, required=True)
         ]
 
         super().__init__(
@@ -30,17 +197,96 @@ class PersonalNaksCertificationsCommand(Command):
     def execute(self, 
         search_items_path: Path | None, 
         threads: int,
+        engine: str,
+        max_in_flight: int,
+        adaptive: bool,
+        max_threads: int,
+        stage_workers: tuple[str, ...],
+        stage_queue_size: int,
+        plan: bool,
+        rps: float,
+        burst: int,
+        page_workers: int,
+        detail_workers: int,
+        stream: bool,
+        parse_processes: int,
+        http_cache: bool,
+        cache_main_ttl: float,
+        cache_detail_ttl: float,
+        cache_max_size: int,
+        reuse_from: Path | None,
+        resume: bool,
+        output_format: str,
+        compress: bool,
+        store_path: Path,
         save_file_name: str,
-        parse: FromDishka[ParsePersonalNaksCertificationsInteractor]
+        parse: FromDishka[ParsePersonalNaksCertificationsInteractor],
+        async_parse: FromDishka[AsyncParsePersonalNaksCertificationsInteractor],
+        pipeline_parse: FromDishka[PipelineParsePersonalNaksCertificationsInteractor],
+        planned_parse: FromDishka[PlannedParsePersonalNaksCertificationsInteractor]
     ):
+        if plan and engine != "threads":
+            raise UsageError("--plan is supported by threads engine only")
+
+        if resume and (plan or engine == "pipeline"):
+            raise UsageError("--resume is not supported with --plan and pipeline engine")
+
+        if stream and engine == "pipeline":
+            raise UsageError("--stream is not supported by pipeline engine")
+
+        if engine == "pipeline" and (adaptive or threads != 1):
+            raise UsageError("--threads and --adaptive are not supported by pipeline engine, use --stage-workers")
+
+        if adaptive and engine == "async":
+            raise UsageError("--adaptive is not supported by async engine, use --max-in-flight")
+
+        pipeline_stage_workers = parse_stage_workers(stage_workers)
+
         if search_items_path:
             search_values  = self.load_search_values_file_data(search_items_path)
         else:
             search_values = self.load_default_search_values_file_data()
 
-        parse_result = parse(search_values, threads)
+        controller = AIMDConcurrencyController(threads, max_limit=max_threads) if adaptive else None
+
+        context = ParseContext(
+            rate_limiter=TokenBucketRateLimiter(rps, burst),
+            request_observer=controller,
+            page_workers=page_workers,
+            detail_workers=detail_workers,
+            stream_main_pages=stream,
+            parse_processes=parse_processes,
+            page_cache=make_page_cache(http_cache, cache_main_ttl, cache_detail_ttl, cache_max_size),
+            known_certifications=make_known_certifications(reuse_from)
+        )
+
+        journal = None if plan or engine == "pipeline" else NdjsonPersonalNaksParseJournal(
+            ApplicationConfig.SAVES_DIR() / f"{save_file_name}.journal.ndjson", 
+            resume
+        )
+
+        sink = make_result_sink(save_file_name, output_format, compress, store_path)
+
+        try:
+            with context:
+                if engine == "async":
+                    async_parse(search_values, context, threads, max_in_flight, journal, sink)
+                elif engine == "pipeline":
+                    pipeline_parse(search_values, context, pipeline_stage_workers, stage_queue_size, sink)
+                elif plan:
+                    save_search_result(planned_parse(search_values, context, threads, controller), sink)
+                else:
+                    parse(search_values, context, threads, controller, journal, sink)
 
-        self.save_search_result(parse_result, save_file_name)
+            echo_run_summary(context)
+        finally:
+            close_certification_store(context.known_certifications)
+            close_result_sink(sink)
+
+        if journal and context.failed_items:
+            journal.close()
+        elif journal:
+            journal.discard()
 
     
     def load_search_values_file_data(self, path: Path) -> list[SearchNaksCertificationItem]:
@@ -54,11 +300,152 @@ class PersonalNaksCertificationsCommand(Command):
 
         return [SearchNaksCertificationItem(**i) for i in content]
 
+
+class PersonalNaksCertificationsMirrorCommand(Command): 
+    def __init__(self):
+        name = "personal-naks-mirror"
+
+        params= [
+            Option(["--threads", "-th"], type=int, default=1, show_default=True, help="threads amount"),
+            *request_options(),
+            *cache_options(),
+            Option(["--full", "-f"], is_flag=True, default=False, help="crawl the whole registry instead of changes since the last sync"),
+            Option(["--refetch", "-r"], is_flag=True, default=False, help="request detail pages of certifications unchanged since they were mirrored"),
+            Option(["--mirror-path", "-mp"], type=Path, default=ApplicationConfig.PERSONAL_NAKS_MIRROR_PATH, show_default=True, help="path to mirror json file, .sqlite3 path for sqlite store")
+        ]
+
+        super().__init__(
+            name=name,
+            params=params,
+            callback=self.execute
+        )
+
+    
+    def execute(self, 
+        threads: int,
+        rps: float,
+        burst: int,
+        page_workers: int,
+        detail_workers: int,
+        stream: bool,
+        parse_processes: int,
+        http_cache: bool,
+        cache_main_ttl: float,
+        cache_detail_ttl: float,
+        cache_max_size: int,
+        full: bool,
+        refetch: bool,
+        mirror_path: Path,
+        sync: FromDishka[SyncPersonalNaksCertificationsMirrorInteractor]
+    ):
+        store = make_certification_store(mirror_path)
+
+        context = ParseContext(
+            rate_limiter=TokenBucketRateLimiter(rps, burst),
+            page_workers=page_workers,
+            detail_workers=detail_workers,
+            stream_main_pages=stream,
+            parse_processes=parse_processes,
+            page_cache=make_page_cache(http_cache, cache_main_ttl, cache_detail_ttl, cache_max_size),
+            known_certifications=None if refetch else store
+        )
+
+        try:
+            with context:
+                sync(store, context, threads, full)
+        finally:
+            close_certification_store(store)
+
+        echo_run_summary(context)
+
+
+class ExpiringPersonalNaksCertificationsCommand(Command): 
+    def __init__(self):
+        name = "personal-naks-expiring"
+
+        params= [
+            Option(["--date-from", "-df"], type=DateTime(["%d.%m.%Y", "%Y-%m-%d"]), help="window start, today by default"),
+            Option(["--date-before", "-db"], type=DateTime(["%d.%m.%Y", "%Y-%m-%d"]), help="window end"),
+            Option(["--days", "-d"], type=int, help="window length in days, used when --date-before is not set"),
+            Option(["--name", "-n"], type=str, default=""),
+            Option(["--cert-abbr", "-ca"], type=str, default=""),
+            Option(["--cert-lvl", "-cl"], type=str, default=""),
+            Option(["--company", "-c"], type=str, default="", help="company name part, filtered before detail pages are requested"),
+            *request_options(),
+            *cache_options(),
+            Option(["--reuse-from", "-rf"], type=OptionalPath(), help="previous save (json or ndjson), mirror json file or sqlite store, details of unchanged certifications are taken from it"),
+            *output_options(),
+            Option(["--save-file-name", "-sfn"], type=str, required=True)
+        ]
+
+        super().__init__(
+            name=name,
+            params=params,
+            callback=self.execute
+        )
+
     
-    def save_search_result(self, data: list[PersonalNaksCertificationData], save_file_name: str) -> list[SearchNaksCertificationItem]:
-        data = [el.model_dump(mode="json") for el in data]
-        
-        save_json(data, ApplicationConfig.SAVES_DIR() / f"{save_file_name}.json")
+    def execute(self, 
+        date_from: datetime | None,
+        date_before: datetime | None,
+        days: int | None,
+        name: str,
+        cert_abbr: str,
+        cert_lvl: str,
+        company: str,
+        rps: float,
+        burst: int,
+        page_workers: int,
+        detail_workers: int,
+        stream: bool,
+        parse_processes: int,
+        http_cache: bool,
+        cache_main_ttl: float,
+        cache_detail_ttl: float,
+        cache_max_size: int,
+        reuse_from: Path | None,
+        output_format: str,
+        compress: bool,
+        store_path: Path,
+        save_file_name: str,
+        parse_expiring: FromDishka[ParseExpiringPersonalNaksCertificationsInteractor]
+    ):
+        window_start = date_from.date() if date_from else date.today()
+
+        if date_before:
+            window_end = date_before.date()
+        elif days is not None:
+            window_end = window_start + timedelta(days=days)
+        else:
+            raise BadParameter("--date-before or --days is required")
+
+        context = ParseContext(
+            rate_limiter=TokenBucketRateLimiter(rps, burst),
+            page_workers=page_workers,
+            detail_workers=detail_workers,
+            stream_main_pages=stream,
+            parse_processes=parse_processes,
+            page_cache=make_page_cache(http_cache, cache_main_ttl, cache_detail_ttl, cache_max_size),
+            known_certifications=make_known_certifications(reuse_from)
+        )
+
+        sink = make_result_sink(save_file_name, output_format, compress, store_path)
+
+        try:
+            with context:
+                parse_result = parse_expiring(
+                    SearchNaksCertificationItem(name=name, cert_abbr=cert_abbr, cert_lvl=cert_lvl),
+                    window_start,
+                    window_end,
+                    context,
+                    company
+                )
+
+            echo_run_summary(context)
+            save_search_result(parse_result, sink)
+        finally:
+            close_certification_store(context.known_certifications)
+            close_result_sink(sink)
 
 
 @group("parse")
@@ -66,3 +453,5 @@ def parse_group(): ...
 
 
 parse_group.add_command(PersonalNaksCertificationsCommand())
+parse_group.add_command(PersonalNaksCertificationsMirrorCommand())
+parse_group.add_command(ExpiringPersonalNaksCertificationsCommand())
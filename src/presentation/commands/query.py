@@ -0,0 +1,247 @@
+from datetime import date, datetime
+from time import perf_counter
+from pathlib import Path
+from json import dumps
+import csv
+
+from click import Argument, Choice, Command, DateTime, Option, UsageError, echo, get_text_stream, group
+
+from src.infrastructure.dto import PersonalNaksCertificationData
+from src.infrastructure.stores import SqlitePersonalNaksCertificationReader
+from src.presentation.cli_types import OptionalPath
+from src.config import ApplicationConfig
+
+
+def query_options() -> list[Option]:
+    return [
+        Option(["--store-path", "-stp"], type=OptionalPath(), default=ApplicationConfig.PERSONAL_NAKS_STORE_PATH, show_default=True, help="sqlite store filled by parse commands"),
+        Option(["--format", "-f", "output_format"], type=Choice(["json", "csv"]), default="json", show_default=True),
+        Option(["--output", "-o"], type=Path, help="output file, stdout by default")
+    ]
+
+
+def active_options() -> list[Option]:
+    return [
+        Option(["--include-expired", "-ie"], is_flag=True, default=False, help="include certifications expired before today")
+    ]
+
+
+def run_query(store_path: Path | None, output_format: str, output: Path | None, **filters) -> None:
+    if store_path is None:
+        raise UsageError("--store-path is required")
+
+    store = SqlitePersonalNaksCertificationReader(store_path)
+
+    try:
+        started_at = perf_counter()
+        certifications = store.find(**filters)
+        elapsed = perf_counter() - started_at
+    finally:
+        store.close()
+
+    if output:
+        with open(output, "w", encoding="utf-8", newline="") as file:
+            write_certifications(certifications, output_format, file)
+    else:
+        write_certifications(certifications, output_format, get_text_stream("stdout"))
+
+    echo(f"{len(certifications)} certifications found in {elapsed * 1000:.1f} ms", err=True)
+
+
+def write_certifications(certifications: list[PersonalNaksCertificationData], output_format: str, file) -> None:
+    rows = [el.model_dump(mode="json", exclude={"html"}) for el in certifications]
+
+    if output_format == "json":
+        file.write(dumps(rows, indent=4, ensure_ascii=False))
+        file.write("\n")
+        return
+
+    fieldnames = [name for name in PersonalNaksCertificationData.model_fields if name != "html"]
+    writer = csv.DictWriter(file, fieldnames=fieldnames)
+    writer.writeheader()
+
+    for row in rows:
+        writer.writerow({key: "; ".join(value) if isinstance(value, list) else value for key, value in row.items()})
+
+
+def get_active_on(include_expired: bool) -> date | None:
+    return None if include_expired else date.today()
+
+
+class ByKleymoQueryCommand(Command):
+    def __init__(self):
+        name = "by-kleymo"
+
+        params= [
+            Argument(["kleymo"], type=str),
+            *active_options(),
+            *query_options()
+        ]
+
+        super().__init__(
+            name=name,
+            params=params,
+            callback=self.execute
+        )
+
+
+    def execute(self, kleymo: str, include_expired: bool, store_path: Path | None, output_format: str, output: Path | None):
+        run_query(store_path, output_format, output, kleymo=kleymo.upper(), active_on=get_active_on(include_expired))
+
+
+class ByCompanyQueryCommand(Command):
+    def __init__(self):
+        name = "by-company"
+
+        params= [
+            Argument(["company"], type=str),
+            Option(["--prefix", "-p"], is_flag=True, default=False, help="match names starting with COMPANY case-sensitively through the company index"),
+            *active_options(),
+            *query_options()
+        ]
+
+        super().__init__(
+            name=name,
+            params=params,
+            callback=self.execute,
+            help="certifications whose company name contains COMPANY in any case, this match scans the whole store, use --prefix on large stores"
+        )
+
+
+    def execute(self, company: str, prefix: bool, include_expired: bool, store_path: Path | None, output_format: str, output: Path | None):
+        if prefix:
+            run_query(store_path, output_format, output, company_prefix=company, active_on=get_active_on(include_expired))
+        else:
+            run_query(store_path, output_format, output, company=company, active_on=get_active_on(include_expired))
+
+
+class ExpiringBeforeQueryCommand(Command):
+    def __init__(self):
+        name = "expiring-before"
+
+        params= [
+            Argument(["date_before"], type=DateTime(["%d.%m.%Y", "%Y-%m-%d"])),
+            Option(["--date-from", "-df"], type=DateTime(["%d.%m.%Y", "%Y-%m-%d"]), help="window start, today by default"),
+            Option(["--company", "-c"], type=str, help="company name part"),
+            *query_options()
+        ]
+
+        super().__init__(
+            name=name,
+            params=params,
+            callback=self.execute
+        )
+
+
+    def execute(self,
+        date_before: datetime,
+        date_from: datetime | None,
+        company: str | None,
+        store_path: Path | None,
+        output_format: str,
+        output: Path | None
+    ):
+        run_query(
+            store_path,
+            output_format,
+            output,
+            company=company,
+            active_on=date_from.date() if date_from else date.today(),
+            expiring_before=date_before.date()
+        )
+
+
+class PermittedQueryCommand(Command):
+    def __init__(self):
+        name = "permitted"
+
+        params= [
+            Option(["--gtd", "-g"], type=str, help="gtd code, КО(1) or КО for any subgroup"),
+            Option(["--material", "-m"], type=str, help="material group, e.g. М01"),
+            Option(["--company", "-c"], type=str, help="company name part"),
+            *active_options(),
+            *query_options()
+        ]
+
+        super().__init__(
+            name=name,
+            params=params,
+            callback=self.execute
+        )
+
+
+    def execute(self,
+        gtd: str | None,
+        material: str | None,
+        company: str | None,
+        include_expired: bool,
+        store_path: Path | None,
+        output_format: str,
+        output: Path | None
+    ):
+        if not gtd and not material:
+            raise UsageError("--gtd or --material is required")
+
+        run_query(
+            store_path,
+            output_format,
+            output,
+            gtd=gtd.upper() if gtd else None,
+            material=material.upper().replace("M", "М") if material else None,
+            company=company,
+            active_on=get_active_on(include_expired)
+        )
+
+
+class ThicknessQueryCommand(Command):
+    def __init__(self):
+        name = "thickness"
+
+        params= [
+            Argument(["detail_thikness"], type=float),
+            Option(["--outer-diameter", "-od"], type=float, help="outer diameter which range must also cover, mm"),
+            Option(["--gtd", "-g"], type=str, help="gtd code, КО(1) or КО for any subgroup"),
+            Option(["--material", "-m"], type=str, help="material group, e.g. М01"),
+            *active_options(),
+            *query_options()
+        ]
+
+        super().__init__(
+            name=name,
+            params=params,
+            callback=self.execute,
+            help="certifications whose detail thickness range covers DETAIL_THIKNESS mm"
+        )
+
+
+    def execute(self,
+        detail_thikness: float,
+        outer_diameter: float | None,
+        gtd: str | None,
+        material: str | None,
+        include_expired: bool,
+        store_path: Path | None,
+        output_format: str,
+        output: Path | None
+    ):
+        run_query(
+            store_path,
+            output_format,
+            output,
+            detail_thikness=detail_thikness,
+            outer_diameter=outer_diameter,
+            gtd=gtd.upper() if gtd else None,
+            material=material.upper().replace("M", "М") if material else None,
+            active_on=get_active_on(include_expired)
+        )
+
+
+@group("query")
+def query_group(): ...
+
+
+query_group.add_command(ByKleymoQueryCommand())
+query_group.add_command(ByCompanyQueryCommand())
+query_group.add_command(ExpiringBeforeQueryCommand())
+query_group.add_command(PermittedQueryCommand())
+query_group.add_command(ThicknessQueryCommand())
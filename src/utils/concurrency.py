@@ -0,0 +1,84 @@
+from contextlib import contextmanager
+from statistics import median
+from threading import Condition
+from typing import Iterator
+
+
+class AIMDConcurrencyController:
+
+    def __init__(
+        self,
+        initial: int,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        window: int = 20,
+        error_threshold: float = 0.1,
+        latency_tolerance: float = 2
+    ) -> None:
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.window = window
+        self.error_threshold = error_threshold
+        self.latency_tolerance = latency_tolerance
+
+        self.limit = min(max(initial, min_limit), max_limit)
+        self.active = 0
+
+        self._samples: list[tuple[float, bool]] = []
+        self._base_latency: float | None = None
+        self._condition = Condition()
+
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        self.acquire()
+
+        try:
+            yield
+        finally:
+            self.release()
+
+
+    def acquire(self) -> None:
+        with self._condition:
+            while self.active >= self.limit:
+                self._condition.wait()
+
+            self.active += 1
+
+
+    def release(self) -> None:
+        with self._condition:
+            self.active -= 1
+            self._condition.notify()
+
+
+    def observe(self, latency: float, ok: bool) -> None:
+        with self._condition:
+            self._samples.append((latency, ok))
+
+            if len(self._samples) < self.window:
+                return
+
+            self._adjust()
+            self._samples.clear()
+
+
+    def _adjust(self) -> None:
+        latencies = [latency for latency, ok in self._samples if ok]
+        error_rate = 1 - len(latencies) / len(self._samples)
+
+        window_latency = median(latencies) if latencies else None
+
+        if window_latency is not None and (self._base_latency is None or window_latency < self._base_latency):
+            self._base_latency = window_latency
+
+        overloaded = error_rate > self.error_threshold or (
+            window_latency is not None and window_latency > self._base_latency * self.latency_tolerance
+        )
+
+        if overloaded:
+            self.limit = max(self.min_limit, self.limit // 2)
+        else:
+            self.limit = min(self.max_limit, self.limit + 1)
+            self._condition.notify_all()
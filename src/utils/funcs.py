@@ -1,8 +1,9 @@
 from string import digits, ascii_letters
-from json import dump, load
+from json import dump, load, loads
 from random import choices
 from pathlib import Path
 import typing as t
+import gzip
 
 from src.config import ApplicationConfig
 
@@ -22,10 +23,34 @@ def read_json(path: str | Path) -> list | dict | t.Any:
     return load(open(path, "r", encoding="utf-8"))
 
 
+def read_ndjson(path: str | Path) -> t.Iterator[dict]:
+    opener = gzip.open if str(path).endswith(".gz") else open
+
+    with opener(path, "rt", encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                yield loads(line)
+
+
+def iter_unique[T](items: t.Iterable[T], key: t.Callable[[T], t.Hashable]) -> t.Iterator[T]:
+    seen: set[t.Hashable] = set()
+
+    for item in items:
+        item_key = key(item)
+
+        if item_key in seen:
+            continue
+
+        seen.add(item_key)
+        yield item
+
+
 def gtd_data_json() -> dict[str, dict[str, str | dict]]:
-    return load(open(f"{ApplicationConfig.BASE_DIR()}/static/data/gtd_data.json", "r", encoding="utf-8"))
+    return load(open(ApplicationConfig.GTD_DATA_PATH(), "r", encoding="utf-8"))
 
 
-def gtd_description_short_dict(gtd_data: dict[str, dict[str, str | dict]] = gtd_data_json()) -> dict[str, str]:
+def gtd_description_short_dict(gtd_data: dict[str, dict[str, str | dict]] | None = None) -> dict[str, str]:
+    if gtd_data is None:
+        gtd_data = gtd_data_json()
 
     return {value["description"]: key  for key, value in gtd_data.items()}
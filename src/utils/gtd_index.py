@@ -0,0 +1,49 @@
+from functools import cache
+from json import loads
+from pathlib import Path
+import re
+
+from src.config import ApplicationConfig
+
+
+__all__ = [
+    "GtdIndex",
+    "load_gtd_index",
+    "get_gtd_index"
+]
+
+
+SUBGROUP_PATTERN = re.compile(r"[0-9]+")
+
+
+class GtdIndex:
+
+    def __init__(self, descriptions: dict[str, str]) -> None:
+        self.descriptions = descriptions
+
+        alternatives = "|".join(re.escape(description) for description in sorted(descriptions, key=len, reverse=True))
+        self._pattern = re.compile(rf"(?:^|\)[,;])\s*({alternatives})\s*\(([^)]*)")
+
+
+    @classmethod
+    def from_gtd_data(cls, gtd_data: dict[str, dict]) -> "GtdIndex":
+        return cls({value["description"]: key for key, value in gtd_data.items()})
+
+
+    def parse(self, string: str) -> list[str]:
+        result: list[str] = []
+
+        for match in self._pattern.finditer(string):
+            gtd_short = self.descriptions[match.group(1)]
+            result += [f"{gtd_short}({int(subgroup)})" for subgroup in SUBGROUP_PATTERN.findall(match.group(2))]
+
+        return result
+
+
+def load_gtd_index(data_path: Path) -> GtdIndex:
+    return GtdIndex.from_gtd_data(loads(data_path.read_text(encoding="utf-8")))
+
+
+@cache
+def get_gtd_index() -> GtdIndex:
+    return load_gtd_index(ApplicationConfig.GTD_DATA_PATH())
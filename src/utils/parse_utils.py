@@ -1,42 +1,55 @@
-from typing import Iterator
+from functools import lru_cache
 import re
 
-from src.utils.funcs import gtd_description_short_dict
+from src.utils.gtd_index import get_gtd_index
 
 
-def parse_gtds(string: str) -> Iterator[list[str] | None]:
-    strings = re.split(r"\),|\);", string)
+NORMALIZATION_CACHE_SIZE = 4096
 
-    gtd_data = gtd_description_short_dict()
-
-    for el in strings:
-        description, subgroups = el.split(" (")
-        gtd_short = gtd_data.get(description.strip())
-
-        if not gtd_short:
-            yield None
-    
-        subgroups: list[int] = [int(el.strip()) for el in re.findall(r"[0-9]+", subgroups)]
-
-        yield [f"{gtd_short}({el})" for el in subgroups]
+LIST_NOTE_PATTERN = re.compile(r"\[[\w\W]+\]")
+LIST_SEPARATOR_PATTERN = re.compile(r",|;")
+MATERIAL_PATTERN = re.compile(r"(М[0-9]+)(\+М[0-9]+)?")
+FROM_PATTERN = re.compile(r"от [0-9]+[.,][0-9]+|от [0-9]+|свыше [0-9]+[.,][0-9]+|Свыше [0-9]+[.,][0-9]+|свыше [0-9]+|Свыше [0-9]+")
+BEFORE_PATTERN = re.compile(r"до [0-9]+[.,][0-9]+|до [0-9]+|До [0-9]+[.,][0-9]+|До [0-9]+")
 
 
 def parse_list_data(string: str | None) -> list[str] | None:
     if not string:
         return None
 
-    string = re.sub(r"\[[\w\W]+\]", "", string)
+    return list(_parse_list_data(string))
+
+
+@lru_cache(maxsize=NORMALIZATION_CACHE_SIZE)
+def _parse_list_data(string: str) -> tuple[str, ...]:
+    string = LIST_NOTE_PATTERN.sub("", string)
+
+    return tuple(el.strip() for el in LIST_SEPARATOR_PATTERN.split(string))
+
+
+def parse_materials(string: str) -> list[str]:
+    return list(_parse_materials(string))
+
 
-    return [el.strip() for el in re.split(r",|;", string)]
+@lru_cache(maxsize=NORMALIZATION_CACHE_SIZE)
+def _parse_materials(string: str) -> tuple[str, ...]:
+    return tuple("".join(el) for el in MATERIAL_PATTERN.findall(string.replace("M", "М")))
+
+
+def parse_gtd(string: str) -> list[str]:
+    return list(_parse_gtd(string))
+
+
+@lru_cache(maxsize=NORMALIZATION_CACHE_SIZE)
+def _parse_gtd(string: str) -> tuple[str, ...]:
+    return tuple(get_gtd_index().parse(string))
 
 
 def parse_from_values(string: str | None) -> list[int | float] | None:
     if not string:
         return None
-    
-    from_pattern = re.compile(r"от [0-9]+[.,][0-9]+|от [0-9]+|свыше [0-9]+[.,][0-9]+|Свыше [0-9]+[.,][0-9]+|свыше [0-9]+|Свыше [0-9]+")
 
-    from_values: list[str] = from_pattern.findall(string)
+    from_values: list[str] = FROM_PATTERN.findall(string)
 
     return [
         float(el.replace(",", ".").replace("от ", "").replace("свыше ", "").replace("Свыше ", "").strip()) for el in from_values
@@ -46,10 +59,8 @@ def parse_from_values(string: str | None) -> list[int | float] | None:
 def parse_before_values(string: str | None) -> list[int | float] | None:
     if not string:
         return None
-    
-    before_pattern= re.compile(r"до [0-9]+[.,][0-9]+|до [0-9]+|До [0-9]+[.,][0-9]+|До [0-9]+")
 
-    before_values: list[str] = before_pattern.findall(string)
+    before_values: list[str] = BEFORE_PATTERN.findall(string)
 
     return [
         float(
@@ -58,8 +69,9 @@ def parse_before_values(string: str | None) -> list[int | float] | None:
     ] if before_values != [] else None
 
 
+@lru_cache(maxsize=NORMALIZATION_CACHE_SIZE)
 def get_from_value_or_none(string: str | None) -> int | float | None:
-    
+
     from_values = parse_from_values(string)
 
     if not from_values:
@@ -68,11 +80,24 @@ def get_from_value_or_none(string: str | None) -> int | float | None:
     return min(from_values)
 
 
+@lru_cache(maxsize=NORMALIZATION_CACHE_SIZE)
 def get_before_value_or_none(string: str | None) -> int | float | None:
-    
+
     before_values = parse_before_values(string)
 
     if not before_values:
         return None
 
     return max(before_values)
+
+
+def get_normalization_cache_stats() -> dict[str, tuple[int, int]]:
+    caches = {
+        "list_data": _parse_list_data,
+        "materials": _parse_materials,
+        "gtd": _parse_gtd,
+        "from_value": get_from_value_or_none,
+        "before_value": get_before_value_or_none
+    }
+
+    return {name: (func.cache_info().hits, func.cache_info().misses) for name, func in caches.items()}
@@ -0,0 +1,149 @@
+from dataclasses import dataclass, field
+from threading import Lock, Thread
+from time import perf_counter
+from queue import Queue
+import typing as t
+
+
+STOP = object()
+
+
+@dataclass
+class Stage[I, O]:
+    name: str
+    handle: t.Callable[[I], t.Iterable[O]]
+    workers: int = 1
+    queue_size: int = 100
+
+
+@dataclass
+class StageStats:
+    name: str
+    workers: int
+    queue_size: int
+    received: int = 0
+    emitted: int = 0
+    failed: int = 0
+    busy: float = 0
+    blocked: float = 0
+    max_depth: int = 0
+    errors: list[tuple[t.Any, Exception]] = field(default_factory=list, repr=False)
+    _lock: Lock = field(default_factory=Lock, repr=False)
+
+
+    def add(self, emitted: int, busy: float, blocked: float, item: t.Any, error: Exception | None) -> None:
+        with self._lock:
+            self.received += 1
+            self.emitted += emitted
+            self.busy += busy
+            self.blocked += blocked
+
+            if error:
+                self.failed += 1
+                self.errors.append((item, error))
+
+
+    def observe_depth(self, depth: int) -> None:
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+
+    def summary(self, elapsed: float) -> str:
+        capacity = elapsed * self.workers
+
+        return (
+            f"{self.name}: {self.workers} workers, {self.received} in, {self.emitted} out, {self.failed} failed, "
+            f"{self.received / elapsed if elapsed else 0:.1f}/s, busy {self.busy / capacity if capacity else 0:.0%}, "
+            f"blocked downstream {self.blocked / capacity if capacity else 0:.0%}, max queue {self.max_depth}/{self.queue_size}"
+        )
+
+
+class Pipeline:
+
+    def __init__(self, stages: list[Stage]) -> None:
+        self.stages = stages
+        self.stats = [StageStats(stage.name, stage.workers, stage.queue_size) for stage in stages]
+        self.elapsed = 0.0
+
+        self._queues: list[Queue[t.Any]] = [Queue(maxsize=stage.queue_size) for stage in stages]
+        self._alive = [stage.workers for stage in stages]
+        self._lock = Lock()
+
+
+    def run(self, items: t.Iterable[t.Any]) -> None:
+        started_at = perf_counter()
+
+        threads = [
+            Thread(target=self._work, args=(i,), name=f"{stage.name}-{n}", daemon=True)
+            for i, stage in enumerate(self.stages)
+            for n in range(stage.workers)
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        for item in items:
+            self._put(0, item)
+
+        for _ in range(self.stages[0].workers):
+            self._queues[0].put(STOP)
+
+        for thread in threads:
+            thread.join()
+
+        self.elapsed = perf_counter() - started_at
+
+
+    def get_failures(self) -> list[tuple[str, t.Any, Exception]]:
+        return [(stats.name, item, error) for stats in self.stats for item, error in stats.errors]
+
+
+    def summary(self) -> list[str]:
+        return [stats.summary(self.elapsed) for stats in self.stats]
+
+
+    def _work(self, i: int) -> None:
+        stage = self.stages[i]
+        stats = self.stats[i]
+
+        try:
+            while (item := self._queues[i].get()) is not STOP:
+                emitted = 0
+                busy = blocked = 0.0
+                error = None
+                started_at = perf_counter()
+
+                try:
+                    for result in stage.handle(item):
+                        busy += perf_counter() - started_at
+                        blocked += self._put(i + 1, result)
+                        emitted += 1
+                        started_at = perf_counter()
+                except Exception as e:
+                    error = e
+
+                stats.add(emitted, busy + perf_counter() - started_at, blocked, item, error)
+        finally:
+            self._stop_stage(i)
+
+
+    def _put(self, i: int, item: t.Any) -> float:
+        if i == len(self.stages):
+            return 0
+
+        started_at = perf_counter()
+        self._queues[i].put(item)
+        blocked = perf_counter() - started_at
+        self.stats[i].observe_depth(self._queues[i].qsize())
+
+        return blocked
+
+
+    def _stop_stage(self, i: int) -> None:
+        with self._lock:
+            self._alive[i] -= 1
+            last = self._alive[i] == 0
+
+        if last and i + 1 < len(self.stages):
+            for _ in range(self.stages[i + 1].workers):
+                self._queues[i + 1].put(STOP)
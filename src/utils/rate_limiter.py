@@ -0,0 +1,87 @@
+from email.utils import parsedate_to_datetime
+from datetime import datetime, UTC
+from asyncio import sleep as async_sleep
+from time import monotonic, sleep
+from threading import Lock
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+
+    value = value.strip()
+
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_dt = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max((retry_dt - datetime.now(UTC)).total_seconds(), 0)
+
+
+class TokenBucketRateLimiter:
+
+    def __init__(self, rate: float, burst: int = 1, min_rate: float | None = None) -> None:
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate or rate / 16
+
+        self._tokens = float(burst)
+        self._updated_at = monotonic()
+        self._lock = Lock()
+
+
+    def acquire(self) -> None:
+        delay = self._reserve()
+
+        if delay > 0:
+            sleep(delay)
+
+
+    async def acquire_async(self) -> None:
+        delay = self._reserve()
+
+        if delay > 0:
+            await async_sleep(delay)
+
+
+    def throttle(self, retry_after: float | None = None) -> None:
+        with self._lock:
+            now = monotonic()
+            self._refill(now)
+
+            self.rate = max(self.min_rate, self.rate / 2)
+
+            if retry_after:
+                self._tokens = min(self._tokens, 0)
+                self._updated_at = max(self._updated_at, now + retry_after)
+
+
+    def recover(self) -> None:
+        with self._lock:
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+
+
+    def _reserve(self) -> float:
+        with self._lock:
+            now = monotonic()
+            self._refill(now)
+
+            self._tokens -= 1
+
+            return max(self._updated_at - now, 0) + max(-self._tokens, 0) / self.rate
+
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+
+        if elapsed <= 0:
+            return
+
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._updated_at = now
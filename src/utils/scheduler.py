@@ -0,0 +1,190 @@
+from asyncio import Queue as AsyncQueue, gather
+from dataclasses import dataclass, field
+from threading import Lock, Thread
+from queue import Queue
+import typing as t
+
+
+STOP = object()
+
+
+@dataclass
+class WorkFailure[T]:
+    item: T
+    error: Exception
+
+
+@dataclass
+class WorkerState[T]:
+    completed: int = 0
+    failures: list[WorkFailure[T]] = field(default_factory=list)
+    error: Exception | None = None
+
+
+class BaseWorkScheduler[T]:
+
+    def __init__(
+        self, 
+        workers: int, 
+        attempts: int = 2, 
+        on_completed: t.Callable[[T], None] | None = None,
+        on_result: t.Callable[[T, t.Any], None] | None = None
+    ) -> None:
+        self.workers = workers
+        self.attempts = attempts
+        self.on_completed = on_completed
+        self.on_result = on_result
+
+        self.active = 0
+        self.completed = 0
+        self.failures: list[WorkFailure[T]] = []
+        self.worker_errors: list[Exception] = []
+
+
+    def _merge(self, states: list[WorkerState[T]]) -> None:
+        for state in states:
+            self.completed += state.completed
+            self.failures += state.failures
+
+            if state.error:
+                self.worker_errors.append(state.error)
+
+
+    def _save(self, item: T, result: t.Any) -> Exception | None:
+        if not self.on_result:
+            return None
+
+        try:
+            self.on_result(item, result)
+        except Exception as e:
+            return e
+
+        return None
+
+
+    def _complete(self, state: WorkerState[T], item: T, error: Exception | None) -> None:
+        if error:
+            state.failures.append(WorkFailure(item, error))
+        else:
+            state.completed += 1
+
+        if self.on_completed:
+            self.on_completed(item)
+
+
+class WorkScheduler[T](BaseWorkScheduler[T]):
+
+    def __init__(
+        self, 
+        workers: int, 
+        attempts: int = 2, 
+        on_completed: t.Callable[[T], None] | None = None,
+        on_result: t.Callable[[T, t.Any], None] | None = None
+    ) -> None:
+        super().__init__(workers, attempts, on_completed, on_result)
+
+        self._lock = Lock()
+
+
+    def run(self, items: t.Iterable[T], make_handler: t.Callable[[], t.Callable[[T], t.Any]]) -> None:
+        queue: Queue[t.Any] = Queue()
+
+        for item in items:
+            queue.put(item)
+
+        for _ in range(self.workers):
+            queue.put(STOP)
+
+        states: list[WorkerState[T]] = [WorkerState() for _ in range(self.workers)]
+        threads = [Thread(target=self._work, args=(queue, make_handler, state)) for state in states]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self._fail_unhandled(queue, states)
+        self._merge(states)
+
+
+    def _work(self, queue: Queue[t.Any], make_handler: t.Callable[[], t.Callable[[T], t.Any]], state: WorkerState[T]) -> None:
+        with self._lock:
+            self.active += 1
+
+        try:
+            handler = make_handler()
+        except Exception as e:
+            state.error = e
+        else:
+            while (item := queue.get()) is not STOP:
+                self._complete(state, item, self._handle(handler, item))
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+    def _fail_unhandled(self, queue: Queue[t.Any], states: list[WorkerState[T]]) -> None:
+        errors = [state.error for state in states if state.error]
+
+        while errors and not queue.empty():
+            item = queue.get_nowait()
+
+            if item is not STOP:
+                self._complete(states[0], item, errors[0])
+
+
+    def _handle(self, handler: t.Callable[[T], t.Any], item: T) -> Exception | None:
+        error = None
+
+        for _ in range(self.attempts):
+            try:
+                result = handler(item)
+            except Exception as e:
+                error = e
+            else:
+                return self._save(item, result)
+
+        return error
+
+
+class AsyncWorkScheduler[T](BaseWorkScheduler[T]):
+
+    async def run(self, items: t.Iterable[T], handler: t.Callable[[T], t.Awaitable[t.Any]]) -> None:
+        queue: AsyncQueue[t.Any] = AsyncQueue()
+
+        for item in items:
+            queue.put_nowait(item)
+
+        for _ in range(self.workers):
+            queue.put_nowait(STOP)
+
+        states: list[WorkerState[T]] = [WorkerState() for _ in range(self.workers)]
+
+        await gather(*(self._work(queue, handler, state) for state in states))
+
+        self._merge(states)
+
+
+    async def _work(self, queue: AsyncQueue[t.Any], handler: t.Callable[[T], t.Awaitable[t.Any]], state: WorkerState[T]) -> None:
+        self.active += 1
+
+        try:
+            while (item := await queue.get()) is not STOP:
+                self._complete(state, item, await self._handle(handler, item))
+        finally:
+            self.active -= 1
+
+
+    async def _handle(self, handler: t.Callable[[T], t.Awaitable[t.Any]], item: T) -> Exception | None:
+        error = None
+
+        for _ in range(self.attempts):
+            try:
+                result = await handler(item)
+            except Exception as e:
+                error = e
+            else:
+                return self._save(item, result)
+
+        return error
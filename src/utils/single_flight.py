@@ -0,0 +1,59 @@
+from asyncio import Task, create_task, shield
+from concurrent.futures import Future
+from threading import Lock
+import typing as t
+
+
+class SingleFlight[K, V]:
+
+    def __init__(self) -> None:
+        self.coalesced = 0
+
+        self._calls: dict[K, Future[V]] = {}
+        self._lock = Lock()
+
+
+    def do(self, key: K, func: t.Callable[[], V]) -> V:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+
+            if leader:
+                call = self._calls[key] = Future()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            return call.result()
+
+        try:
+            result = func()
+        except BaseException as e:
+            call.set_exception(e)
+            raise
+        else:
+            call.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class AsyncSingleFlight[K, V]:
+
+    def __init__(self) -> None:
+        self.coalesced = 0
+
+        self._calls: dict[K, Task[V]] = {}
+
+
+    async def do(self, key: K, func: t.Callable[[], t.Awaitable[V]]) -> V:
+        call = self._calls.get(key)
+
+        if call is not None:
+            self.coalesced += 1
+        else:
+            call = self._calls[key] = create_task(func())
+            call.add_done_callback(lambda _: self._calls.pop(key, None))
+
+        return await shield(call)
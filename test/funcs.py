@@ -4,6 +4,8 @@ import typing as t
 from jose.jwt import encode as jwt_encode
 from http.cookies import SimpleCookie
 
+from src.infrastructure.dto import PersonalNaksCertificationData
+
 
 def from_dict_to_cmd_args[T: dict](data: T) -> t.Iterator[str]:
     for key, value in data.items():
@@ -11,6 +13,22 @@ def from_dict_to_cmd_args[T: dict](data: T) -> t.Iterator[str]:
         yield f"--{key}={value}"
 
 
+def make_certification(certification_number: str, company: str = "ООО Компания", **kwargs) -> PersonalNaksCertificationData:
+    return PersonalNaksCertificationData(**{
+        "name": "Иванов Иван Иванович",
+        "kleymo": "1A2B",
+        "company": company,
+        "certification_number": certification_number,
+        "certification_date": "01.02.2023",
+        "expiration_date": "01.02.2026",
+        "expiration_date_fact": "01.02.2026",
+        "gtd": ["КО(1)", "КО(2)", "СК(1)"],
+        "materials": ["М01", "М03"],
+        "html": "",
+        **kwargs
+    })
+
+
 def create_test_access_token() -> str:
     payload = {
         "user_ident": "bd4f45dab3bf41bc979d285d54f0ad03",
@@ -0,0 +1,69 @@
+from datetime import timedelta
+from pathlib import Path
+
+from src.infrastructure.caches import SqlitePageCache
+from src.infrastructure.parsers.base import NaksPage
+
+
+def make_cache(path: Path, max_size: int = 2 ** 20, ttl: timedelta = timedelta(hours=1)) -> SqlitePageCache:
+    return SqlitePageCache(path / "cache.sqlite3", ttls={"main": ttl, "additional": ttl}, max_size=max_size)
+
+
+class TestSqlitePageCache:
+
+    def test_returns_stored_page_and_counts_hits(self, tmp_path: Path) -> None:
+        cache = make_cache(tmp_path)
+
+        assert cache.get("additional", "1") is None
+
+        cache.set("additional", "1", NaksPage(content=b"<html></html>", encoding="cp1251"))
+
+        assert cache.get("additional", "1") == NaksPage(content=b"<html></html>", encoding="cp1251")
+        assert cache.get("main", "1") is None
+        assert (cache.hits["additional"], cache.misses["additional"], cache.misses["main"]) == (1, 1, 1)
+
+
+    def test_expired_page_is_a_miss(self, tmp_path: Path) -> None:
+        cache = make_cache(tmp_path, ttl=timedelta(seconds=-1))
+
+        cache.set("main", "1", NaksPage(content=b"page", encoding="cp1251"))
+
+        assert cache.get("main", "1") is None
+
+
+    def test_evicts_least_recently_used_pages(self, tmp_path: Path) -> None:
+        cache = make_cache(tmp_path, max_size=20)
+
+        cache.set("additional", "1", NaksPage(content=b"1" * 10, encoding="cp1251"))
+        cache.set("additional", "2", NaksPage(content=b"2" * 10, encoding="cp1251"))
+        cache.get("additional", "1")
+        cache.set("additional", "3", NaksPage(content=b"3" * 10, encoding="cp1251"))
+
+        assert cache.get("additional", "1") is not None
+        assert cache.get("additional", "2") is None
+        assert cache.get("additional", "3") is not None
+
+
+    def test_keeps_pages_between_runs(self, tmp_path: Path) -> None:
+        cache = make_cache(tmp_path)
+        cache.set("main", "key", NaksPage(content=b"page", encoding="utf-8"))
+        cache.close()
+
+        assert make_cache(tmp_path).get("main", "key") == NaksPage(content=b"page", encoding="utf-8")
+
+
+    def test_stale_page_with_validators_can_be_refreshed(self, tmp_path: Path) -> None:
+        cache = make_cache(tmp_path, ttl=timedelta(seconds=-1))
+
+        cache.set("additional", "1", NaksPage(content=b"page", encoding="cp1251", etag='"e1"'))
+        cache.set("additional", "2", NaksPage(content=b"page", encoding="cp1251"))
+
+        assert cache.get("additional", "1") is None
+        assert cache.get_stale("additional", "1").etag == '"e1"'
+        assert cache.get_stale("additional", "2") is None
+
+        cache.ttls["additional"] = timedelta(hours=1)
+        cache.refresh("additional", "1")
+
+        assert cache.get("additional", "1").content == b"page"
+        assert cache.revalidated["additional"] == 1
@@ -0,0 +1,56 @@
+from pathlib import Path
+from json import loads
+import csv
+
+from click.testing import CliRunner
+
+from funcs import make_certification
+from src.infrastructure.stores import SqlitePersonalNaksCertificationStore
+from src.presentation.commands.query import query_group
+
+
+class TestQueryGroup:
+
+    def make_store(self, tmp_path: Path) -> Path:
+        path = tmp_path / "store.sqlite3"
+
+        store = SqlitePersonalNaksCertificationStore(path)
+        store.upsert([
+            make_certification("АЦСТ-1-00001"), 
+            make_certification("АЦСТ-1-00002", "АО Завод", kleymo="3C4D", expiration_date_fact="01.02.2100")
+        ])
+        store.close()
+
+        return path
+
+
+    def test_by_company_writes_json(self, tmp_path: Path) -> None:
+        store_path = self.make_store(tmp_path)
+        output = tmp_path / "result.json"
+
+        result = CliRunner().invoke(query_group, ["by-company", "завод", "-stp", str(store_path), "-o", str(output)])
+
+        assert result.exit_code == 0, result.output
+        assert [el["certification_number"] for el in loads(output.read_text(encoding="utf-8"))] == ["АЦСТ-1-00002"]
+
+
+    def test_by_kleymo_writes_csv(self, tmp_path: Path) -> None:
+        store_path = self.make_store(tmp_path)
+        output = tmp_path / "result.csv"
+
+        result = CliRunner().invoke(query_group, ["by-kleymo", "1a2b", "--include-expired", "-stp", str(store_path), "-f", "csv", "-o", str(output)])
+
+        assert result.exit_code == 0, result.output
+
+        with open(output, encoding="utf-8", newline="") as file:
+            rows = list(csv.DictReader(file))
+
+        assert [(row["certification_number"], row["gtd"], row["materials"]) for row in rows] == [("АЦСТ-1-00001", "КО(1); КО(2); СК(1)", "М01; М03")]
+        assert "html" not in rows[0]
+
+
+    def test_missing_store_is_not_created(self, tmp_path: Path) -> None:
+        result = CliRunner().invoke(query_group, ["by-kleymo", "1A2B", "-stp", str(tmp_path / "missing.sqlite3")])
+
+        assert result.exit_code == 2
+        assert not (tmp_path / "missing.sqlite3").exists()
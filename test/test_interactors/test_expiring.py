@@ -0,0 +1,64 @@
+from datetime import date
+
+from src.application.interactors import ParseExpiringPersonalNaksCertificationsInteractor
+from src.application.interactors.expiring import CompanyRowFilter
+from src.infrastructure.dto import PersonalNaksCertificationData, SearchNaksCertificationItem
+from src.infrastructure.parsers.base import ParseContext
+from src.infrastructure.parsers.personal import PersonalNaksCertificationMainPageData
+from src.utils.rate_limiter import TokenBucketRateLimiter
+
+
+class StubParseInteractor:
+
+    def __init__(self) -> None:
+        self.search_items: list[SearchNaksCertificationItem] = []
+
+
+    def __call__(self, search_items: list[SearchNaksCertificationItem], context: ParseContext) -> list[PersonalNaksCertificationData]:
+        self.search_items += search_items
+
+        return []
+
+
+def make_row(company: str) -> PersonalNaksCertificationMainPageData:
+    return PersonalNaksCertificationMainPageData(
+        name="Иванов Иван Иванович",
+        company=company,
+        certification_number="АЦСТ-1-00001",
+        certification_date="01.02.2023",
+        expiration_date="01.02.2026",
+        expiration_date_fact="01.02.2026",
+        additional_page_id="1"
+    )
+
+
+class TestParseExpiringPersonalNaksCertificationsInteractor:
+
+    def test_window_is_sent_as_active_to_filter(self) -> None:
+        parse = StubParseInteractor()
+        context = ParseContext(rate_limiter=TokenBucketRateLimiter(100, 100))
+
+        ParseExpiringPersonalNaksCertificationsInteractor(parse)(
+            SearchNaksCertificationItem(cert_abbr="АЦСТ"), 
+            date(2025, 3, 1), 
+            date(2025, 4, 1), 
+            context
+        )
+
+        assert parse.search_items == [SearchNaksCertificationItem(cert_abbr="АЦСТ", date_active_to_from="01.03.2025", date_active_to_before="01.04.2025")]
+        assert context.row_filter is None
+
+
+    def test_company_sets_case_insensitive_row_filter(self) -> None:
+        context = ParseContext(rate_limiter=TokenBucketRateLimiter(100, 100))
+
+        ParseExpiringPersonalNaksCertificationsInteractor(StubParseInteractor())(
+            SearchNaksCertificationItem(), 
+            date(2025, 3, 1), 
+            date(2025, 4, 1), 
+            context, 
+            "Завод"
+        )
+
+        assert isinstance(context.row_filter, CompanyRowFilter)
+        assert context.filter_rows(SearchNaksCertificationItem(), [make_row("АО ЗАВОД"), make_row("ООО Компания")]) == [make_row("АО ЗАВОД")]
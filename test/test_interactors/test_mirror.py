@@ -0,0 +1,148 @@
+from datetime import date, timedelta
+from pathlib import Path
+
+from funcs import make_certification
+from src.application.common.exc import BadResponseError
+from src.application.interactors import SyncPersonalNaksCertificationsMirrorInteractor
+from src.infrastructure.dto import PersonalNaksCertificationData, SearchNaksCertificationItem
+from src.infrastructure.parsers.base import ParseContext
+from src.infrastructure.parsers.personal import PersonalNaksCertificationMainPageData
+from src.infrastructure.stores import JsonPersonalNaksCertificationStore
+from src.utils.rate_limiter import TokenBucketRateLimiter
+
+
+class StubParseInteractor:
+
+    def __init__(
+        self, 
+        certifications: list[PersonalNaksCertificationData], 
+        failed_items: int = 0, 
+        failed_pages: int = 0,
+        failed_rows: list[PersonalNaksCertificationMainPageData] | None = None
+    ) -> None:
+        self.certifications = certifications
+        self.failed_items = failed_items
+        self.failed_pages = failed_pages
+        self.failed_rows = failed_rows or []
+        self.search_items: list[SearchNaksCertificationItem] = []
+
+
+    def __call__(self, search_items: list[SearchNaksCertificationItem], context: ParseContext, k: int = 1) -> list[PersonalNaksCertificationData]:
+        self.search_items += search_items
+        context.failed_items += self.failed_items
+
+        for page in range(self.failed_pages):
+            context.add_failed_page(search_items[0], page + 2, BadResponseError("bad status code: 500"))
+
+        for row in self.failed_rows:
+            context.add_failed_row(row, BadResponseError("bad status code: 500"))
+
+        # every certification is a page of its own
+        for certification in self.certifications:
+            context.on_page([certification])
+
+        return self.certifications
+
+
+def make_main_cert_data(certification_date: str) -> PersonalNaksCertificationMainPageData:
+    return PersonalNaksCertificationMainPageData(
+        name="Иванов Иван Иванович",
+        kleymo="1A2B",
+        company="ООО Компания",
+        certification_number="АЦСТ-1-00003",
+        certification_date=certification_date,
+        expiration_date="01.02.2026",
+        expiration_date_fact="01.02.2026",
+        additional_page_id="3"
+    )
+
+
+def make_context() -> ParseContext:
+    return ParseContext(rate_limiter=TokenBucketRateLimiter(100, 100))
+
+
+class TestSyncPersonalNaksCertificationsMirrorInteractor:
+
+    def test_first_sync_crawls_whole_registry_and_sets_watermark(self, tmp_path: Path) -> None:
+        store = JsonPersonalNaksCertificationStore(tmp_path / "mirror.json")
+        parse = StubParseInteractor([make_certification("АЦСТ-1-00001")])
+
+        assert SyncPersonalNaksCertificationsMirrorInteractor(parse)(store, make_context()) == 1
+        assert parse.search_items == [SearchNaksCertificationItem()]
+
+        store = JsonPersonalNaksCertificationStore(tmp_path / "mirror.json")
+
+        assert store.get_watermark() == date.today()
+        assert store.get("АЦСТ-1-00001") == make_certification("АЦСТ-1-00001")
+
+
+    def test_next_sync_searches_changes_since_watermark(self, tmp_path: Path) -> None:
+        store = JsonPersonalNaksCertificationStore(tmp_path / "mirror.json")
+        store.set_watermark(date(2025, 3, 10))
+        parse = StubParseInteractor([])
+
+        SyncPersonalNaksCertificationsMirrorInteractor(parse)(store, make_context())
+
+        assert parse.search_items == [
+            SearchNaksCertificationItem(date_create_from="09.03.2025"),
+            SearchNaksCertificationItem(date_active_from_from="09.03.2025")
+        ]
+
+        SyncPersonalNaksCertificationsMirrorInteractor(parse)(store, make_context(), full=True)
+
+        assert parse.search_items[-1] == SearchNaksCertificationItem()
+
+
+    def test_watermark_is_kept_when_search_items_fail(self, tmp_path: Path) -> None:
+        store = JsonPersonalNaksCertificationStore(tmp_path / "mirror.json")
+        watermark = date.today() - timedelta(days=7)
+        store.set_watermark(watermark)
+        parse = StubParseInteractor([make_certification("АЦСТ-1-00001")], failed_items=1)
+
+        assert SyncPersonalNaksCertificationsMirrorInteractor(parse)(store, make_context()) == 1
+
+        store = JsonPersonalNaksCertificationStore(tmp_path / "mirror.json")
+
+        assert store.get_watermark() == watermark
+        assert store.get("АЦСТ-1-00001") is not None
+
+
+    def test_watermark_is_kept_when_pages_fail(self, tmp_path: Path) -> None:
+        store = JsonPersonalNaksCertificationStore(tmp_path / "mirror.json")
+        watermark = date.today() - timedelta(days=7)
+        store.set_watermark(watermark)
+        parse = StubParseInteractor([make_certification("АЦСТ-1-00001")], failed_pages=1)
+
+        SyncPersonalNaksCertificationsMirrorInteractor(parse)(store, make_context())
+
+        assert JsonPersonalNaksCertificationStore(tmp_path / "mirror.json").get_watermark() == watermark
+
+
+    def test_watermark_is_held_back_only_to_failed_rows(self, tmp_path: Path) -> None:
+        store = JsonPersonalNaksCertificationStore(tmp_path / "mirror.json")
+        watermark = date.today() - timedelta(days=30)
+        store.set_watermark(watermark)
+        failed_since = date.today() - timedelta(days=5)
+        failed_rows = [
+            make_main_cert_data(failed_since.strftime("%d.%m.%Y")),
+            make_main_cert_data((date.today() - timedelta(days=2)).strftime("%d.%m.%Y"))
+        ]
+        parse = StubParseInteractor([make_certification("АЦСТ-1-00001"), make_certification("АЦСТ-1-00002")], failed_rows=failed_rows)
+
+        assert SyncPersonalNaksCertificationsMirrorInteractor(parse)(store, make_context()) == 2
+
+        store = JsonPersonalNaksCertificationStore(tmp_path / "mirror.json")
+
+        assert store.get_watermark() == failed_since
+        assert store.get("АЦСТ-1-00002") is not None
+
+
+    def test_watermark_does_not_move_back_for_rows_certified_before_it(self, tmp_path: Path) -> None:
+        store = JsonPersonalNaksCertificationStore(tmp_path / "mirror.json")
+        watermark = date.today() - timedelta(days=7)
+        store.set_watermark(watermark)
+        parse = StubParseInteractor([], failed_rows=[make_main_cert_data("01.02.2023")])
+
+        SyncPersonalNaksCertificationsMirrorInteractor(parse)(store, make_context())
+
+        assert JsonPersonalNaksCertificationStore(tmp_path / "mirror.json").get_watermark() == watermark
@@ -0,0 +1,35 @@
+from funcs import make_certification
+from src.application.interactors.parse_naks import ResultCollector
+from src.infrastructure.dto import PersonalNaksCertificationData
+
+
+class ListSink:
+
+    def __init__(self) -> None:
+        self.written: list[PersonalNaksCertificationData] = []
+
+
+    def write(self, result: PersonalNaksCertificationData) -> None:
+        self.written.append(result)
+
+
+class TestResultCollector:
+
+    def test_duplicates_are_written_to_sink_once(self) -> None:
+        sink = ListSink()
+        collector = ResultCollector(lambda el: el.certification_number, sink)
+
+        collector.add([make_certification("АЦСТ-1-00001"), make_certification("АЦСТ-1-00002")])
+        collector.add([make_certification("АЦСТ-1-00002", "ООО Другая"), make_certification("АЦСТ-1-00003")])
+
+        assert [el.certification_number for el in sink.written] == ["АЦСТ-1-00001", "АЦСТ-1-00002", "АЦСТ-1-00003"]
+        assert sink.written[1].company == "ООО Компания"
+        assert collector.results == []
+
+
+    def test_results_are_kept_without_sink(self) -> None:
+        collector = ResultCollector(lambda el: el.certification_number)
+
+        collector.add([make_certification("АЦСТ-1-00001"), make_certification("АЦСТ-1-00001")])
+
+        assert collector.results == [make_certification("АЦСТ-1-00001")]
@@ -0,0 +1,91 @@
+import typing as t
+
+import pytest
+
+from funcs import make_certification
+from src.application.interactors import PlannedParsePersonalNaksCertificationsInteractor
+from src.application.planners import PersonalNaksSearchPlanner
+from src.infrastructure.dto import PersonalNaksCertificationData, SearchNaksCertificationItem
+from src.infrastructure.parsers.base import ParseContext
+from src.infrastructure.parsers.personal import PersonalNaksCertificationMainPageData
+from src.utils.rate_limiter import TokenBucketRateLimiter
+
+
+def make_row(kleymo: str, name: str) -> PersonalNaksCertificationMainPageData:
+    return PersonalNaksCertificationMainPageData(
+        name=name,
+        kleymo=kleymo,
+        company="ООО Компания",
+        certification_number=f"АЦСТ-1-{kleymo}",
+        certification_date="01.02.2023",
+        expiration_date="01.02.2026",
+        expiration_date_fact="01.02.2026",
+        additional_page_id=kleymo
+    )
+
+
+class StubRegistryParseInteractor:
+
+    def __init__(self, rows: list[PersonalNaksCertificationMainPageData], match_code: t.Callable[[str, str], bool], rows_per_page: int = 2) -> None:
+        self.rows = rows
+        self.match_code = match_code
+        self.rows_per_page = rows_per_page
+
+
+    def __call__(self, search_items: list[SearchNaksCertificationItem], context: ParseContext, k: int = 1, controller: t.Any = None) -> list[PersonalNaksCertificationData]:
+        result: list[PersonalNaksCertificationData] = []
+
+        for search_item in search_items:
+            found = [row for row in self.rows if self._is_found(search_item, row)]
+            pages = [found[start:start + self.rows_per_page] for start in range(0, len(found), self.rows_per_page)] or [[]]
+
+            context.count_request("main")
+            rows = context.filter_rows(search_item, pages[0])
+
+            for page_rows in pages[1:context.limit_pages(search_item, len(pages))]:
+                context.count_request("main")
+                rows += context.filter_rows(search_item, page_rows)
+
+            result += [make_certification(row.certification_number, kleymo=row.kleymo, name=row.name) for row in rows]
+
+        return result
+
+
+    def _is_found(self, search_item: SearchNaksCertificationItem, row: PersonalNaksCertificationMainPageData) -> bool:
+        if search_item.kleymo and not self.match_code(row.kleymo, search_item.kleymo):
+            return False
+
+        return search_item.name.lower() in row.name.lower()
+
+
+def make_context() -> ParseContext:
+    return ParseContext(rate_limiter=TokenBucketRateLimiter(100, 100))
+
+
+class TestPlannedParsePersonalNaksCertificationsInteractor:
+
+    @pytest.mark.parametrize(
+        "match_code",
+        [str.startswith, lambda kleymo, code: code in kleymo, str.__eq__],
+        ids=["prefix", "substring", "exact"]
+    )
+    def test_kleymo_prefix_query_finds_targets_whatever_code_filter_does(self, match_code: t.Callable[[str, str], bool]) -> None:
+        rows = [make_row(kleymo, "Иванов Иван") for kleymo in ["1A2B", "1A2C", "01A2", "3F4G"]]
+        items = [SearchNaksCertificationItem(kleymo=kleymo) for kleymo in ["1A2B", "1A2C", "3F4G"]]
+        parse = PlannedParsePersonalNaksCertificationsInteractor(StubRegistryParseInteractor(rows, match_code), PersonalNaksSearchPlanner())
+
+        result = parse(items, make_context())
+
+        assert sorted(el.kleymo for el in result) == ["1A2B", "1A2C", "3F4G"]
+
+
+    def test_broad_query_falls_back_to_narrow_queries_when_it_costs_more(self) -> None:
+        rows = [make_row(f"{ident:04}", f"Иванов Иван {ident}") for ident in range(10)]
+        items = [SearchNaksCertificationItem(name=name) for name in ["Иванов Иван 1", "Иванов Иван 7"]]
+        context = make_context()
+        parse = PlannedParsePersonalNaksCertificationsInteractor(StubRegistryParseInteractor(rows, str.startswith), PersonalNaksSearchPlanner())
+
+        result = parse(items, context)
+
+        assert sorted(el.kleymo for el in result) == ["0001", "0007"]
+        assert context.requests_count["main"] == 3
@@ -0,0 +1,607 @@
+from asyncio import run, sleep as async_sleep
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from datetime import timedelta
+from multiprocessing import get_context
+from pathlib import Path
+from threading import Lock, Thread, current_thread
+from time import sleep
+from urllib.parse import parse_qs
+import gzip
+import re
+import typing as t
+
+from httpx import AsyncClient, MockTransport, Request, Response
+from requests import ConnectTimeout, ReadTimeout, Session
+from requests_mock import Mocker
+import pytest
+
+from src.application.common.exc import BadResponseError
+from src.application.interactors.expiring import CompanyRowFilter
+from src.infrastructure.dto import PersonalNaksCertificationData, SearchNaksCertificationItem
+from src.infrastructure.caches import SqlitePageCache
+from src.infrastructure.parsers.base import NaksPage, NaksPageStream, ParseContext, TransferStats, get_declared_encoding
+from src.infrastructure.parsers.personal import (
+    ACCEPT_ENCODING,
+    AsyncPersonalNaksCertificationParser,
+    PersonalNaksCertificationExtractor,
+    PersonalNaksCertificationMainPageData,
+    PersonalNaksCertificationHttpWorker,
+    PersonalNaksCertificationMainPageTask,
+    PersonalNaksCertificationParser,
+    PersonalNaksCertificationPipelineParser,
+    REGISTRY_ENCODING,
+    extract_certifications,
+    extract_main_page,
+    get_reusable_certification_data
+)
+from src.utils.concurrency import AIMDConcurrencyController
+from src.utils.rate_limiter import TokenBucketRateLimiter
+
+
+def make_row(ident: int, company: str = "ООО Компания") -> str:
+    return (
+        "<tr bgcolor='#ffffff'>"
+        f"<td>Иванов Иван {ident}</td><td><span>1A{ident:02}</span></td><td>{company}, г. Москва</td><td> </td>"
+        f"<td>АЦСТ-1-{ident:05}</td><td> </td><td> </td><td> </td><td>01.02.2023</td><td>01.02.2026</td><td> </td><td>РД</td>"
+        f"<td><a onclick='open_modal(\"/registry/personal/detail.php?ID={ident}\",\"w\");'>x</a></td>"
+        "</tr>"
+    )
+
+
+def make_main_page(rows_count: int, pages_count: int, companies: list[str] | None = None, first_ident: int = 0) -> bytes:
+    companies = companies or ["ООО Компания"]
+    rows = "".join(make_row(ident, companies[ident % len(companies)]) for ident in range(first_ident, first_ident + rows_count))
+    pages = "".join(f"<a href='/registry/personal/?PAGEN_1={page}'>{page}</a>" for page in range(2, pages_count + 1))
+
+    return f"<html><body><table class='tabl'><tr><th>ФИО</th></tr>{rows}</table><div>{pages}</div></body></html>".encode(REGISTRY_ENCODING)
+
+
+def make_additional_page(ident: str) -> bytes:
+    return f"<html><body><table><tr><td>Вид деталей</td><td>Т{ident}</td></tr></table></body></html>".encode(REGISTRY_ENCODING)
+
+
+def make_main_cert_data(ident: int, certification_date: str = "01.02.2023") -> PersonalNaksCertificationMainPageData:
+    return PersonalNaksCertificationMainPageData(
+        name=f"Иванов Иван {ident}",
+        kleymo=f"1A{ident:02}",
+        company="ООО Компания",
+        certification_number=f"АЦСТ-1-{ident:05}",
+        certification_date=certification_date,
+        expiration_date="01.02.2026",
+        expiration_date_fact="01.02.2026",
+        additional_page_id=str(ident),
+        method="РД"
+    )
+
+
+class StubHttpWorker:
+
+    def __init__(self, main_pages: tuple[bytes, ...], detail_delay: float = 0, page_delay: float = 0) -> None:
+        self.main_pages = main_pages
+        self.detail_delay = detail_delay
+        self.page_delay = page_delay
+        self.main_page_requests: list[tuple[int, str]] = []
+        self.failing_pages: set[int] = set()
+        self.failing_keys: set[str] = set()
+        self.additional_page_ids: list[str] = []
+        self.detail_threads: set[str] = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+        self._lock = Lock()
+
+
+    def get_main_page(self, search_item: SearchNaksCertificationItem, page: int = 1) -> NaksPage:
+        with self._lock:
+            self.main_page_requests.append((page, current_thread().name))
+
+        # later pages answer first, so pages come back out of page order
+        sleep(self.page_delay / page)
+
+        if page in self.failing_pages:
+            raise BadResponseError("bad status code: 500")
+
+        return NaksPage(self.main_pages[page - 1], REGISTRY_ENCODING)
+
+
+    @contextmanager
+    def stream_main_page(self, search_item: SearchNaksCertificationItem, page: int = 1) -> t.Iterator[NaksPageStream]:
+        content = self.get_main_page(search_item, page).content
+
+        yield NaksPageStream(chunks=[content[start:start + 64] for start in range(0, len(content), 64)], encoding=REGISTRY_ENCODING)
+
+
+    def get_additional_page(self, key: str) -> NaksPage:
+        with self._lock:
+            self.additional_page_ids.append(key)
+            self.detail_threads.add(current_thread().name)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        # later rows answer first, so results come back out of row order
+        sleep(self.detail_delay / (int(key) + 1))
+
+        with self._lock:
+            self.in_flight -= 1
+
+        if key in self.failing_keys:
+            raise BadResponseError("bad status code: 500")
+
+        return NaksPage(make_additional_page(key), REGISTRY_ENCODING)
+
+
+def make_parser(context: ParseContext, *main_pages: bytes, detail_delay: float = 0, page_delay: float = 0) -> PersonalNaksCertificationParser:
+    parser = PersonalNaksCertificationParser(context)
+    parser.http_worker = StubHttpWorker(main_pages, detail_delay, page_delay)
+
+    return parser
+
+
+def make_context(**kwargs) -> ParseContext:
+    return ParseContext(rate_limiter=TokenBucketRateLimiter(100, 100), **kwargs)
+
+
+class TestPersonalNaksCertificationParser:
+
+    def test_company_filter_is_applied_before_detail_fetches(self) -> None:
+        context = make_context(row_filter=CompanyRowFilter("завод"))
+        parser = make_parser(context, make_main_page(rows_count=6, pages_count=1, companies=["ООО Компания", "АО Завод"]))
+
+        result = parser.parse(SearchNaksCertificationItem())
+
+        assert [el.company for el in result] == ["АО Завод"] * 3
+        assert parser.http_worker.additional_page_ids == ["1", "3", "5"]
+        assert context.requests_count["additional"] == 3
+
+
+    def test_detail_pages_are_prefetched_concurrently_in_row_order(self) -> None:
+        content = make_main_page(rows_count=8, pages_count=1)
+        expected = [f"АЦСТ-1-{ident:05}" for ident in range(8)]
+
+        with make_context(detail_workers=4) as context:
+            parser = make_parser(context, content, detail_delay=.05)
+            result = parser.parse(SearchNaksCertificationItem())
+
+        assert [el.certification_number for el in result] == expected
+        assert parser.http_worker.max_in_flight > 1
+        assert all(name.startswith("naks-detail") for name in parser.http_worker.detail_threads)
+
+        with make_context(detail_workers=0) as context:
+            parser = make_parser(context, content, detail_delay=.01)
+            result = parser.parse(SearchNaksCertificationItem())
+
+        assert [el.certification_number for el in result] == expected
+        assert parser.http_worker.max_in_flight == 1
+        assert parser.http_worker.detail_threads == {current_thread().name}
+
+
+    @pytest.mark.parametrize("stream_main_pages", [False, True])
+    def test_next_pages_are_fetched_in_page_pool_and_merged_in_page_order(self, stream_main_pages: bool) -> None:
+        pages = [make_main_page(rows_count=2, pages_count=4, first_ident=page * 2) for page in range(4)]
+
+        with make_context(page_workers=3, stream_main_pages=stream_main_pages) as context:
+            parser = make_parser(context, *pages, page_delay=.05)
+            result = parser.parse(SearchNaksCertificationItem())
+
+        requests = parser.http_worker.main_page_requests
+
+        assert [el.certification_number for el in result] == [f"АЦСТ-1-{ident:05}" for ident in range(8)]
+        assert sorted(page for page, _ in requests) == [1, 2, 3, 4]
+        assert all(thread.startswith("naks-page") for page, thread in requests if page > 1)
+        assert context.requests_count["main"] == 4
+
+
+    @pytest.mark.parametrize("parse_processes", [0, 1])
+    def test_contained_failures_are_retried_and_recorded(self, parse_processes: int) -> None:
+        pages = [make_main_page(rows_count=2, pages_count=3, first_ident=page * 2) for page in range(3)]
+        completed_pages: list[list[str]] = []
+
+        with make_context(contain_failures=True, on_page=lambda result: completed_pages.append([el.kleymo for el in result]), parse_processes=parse_processes) as context:
+            parser = make_parser(context, *pages)
+            parser.http_worker.failing_pages = {2}
+            parser.http_worker.failing_keys = {"1"}
+            result = parser.parse(SearchNaksCertificationItem())
+
+        assert [el.certification_number for el in result] == ["АЦСТ-1-00000", "АЦСТ-1-00004", "АЦСТ-1-00005"]
+        assert completed_pages == [["1A00"], [], ["1A04", "1A05"]]
+        assert [(page, str(error)) for _, page, error in context.failed_pages] == [(2, "bad status code: 500")]
+        assert [row.certification_number for row, _ in context.failed_rows] == ["АЦСТ-1-00001"]
+        assert parser.http_worker.additional_page_ids.count("1") == 2
+        assert [page for page, _ in parser.http_worker.main_page_requests].count(2) == 2
+
+
+    def test_failures_fail_the_item_when_not_contained(self) -> None:
+        with make_context() as context:
+            parser = make_parser(context, make_main_page(rows_count=2, pages_count=1))
+            parser.http_worker.failing_keys = {"1"}
+
+            with pytest.raises(BadResponseError):
+                parser.parse(SearchNaksCertificationItem())
+
+        assert context.failed_rows == []
+
+
+    def test_http_workers_share_session_per_thread_until_context_exit(self) -> None:
+        with make_context() as context:
+            http_workers = [PersonalNaksCertificationParser(context).http_worker for _ in range(2)]
+            sessions: list[Session] = []
+
+            thread = Thread(target=lambda: sessions.extend(http_worker.session for http_worker in http_workers))
+            thread.start()
+            thread.join()
+
+            session = http_workers[0].session
+
+            assert http_workers[1].session is session
+            assert sessions[0] is sessions[1] is not session
+            assert sessions[0].headers["User-Agent"] == session.headers["User-Agent"]
+
+            closed: list[Session] = []
+
+            for opened in (session, sessions[0]):
+                opened.close = lambda opened=opened: closed.append(opened)
+
+        assert {id(el) for el in closed} == {id(session), id(sessions[0])}
+        assert http_workers[0].session is not session
+
+
+class TestPersonalNaksCertificationPipelineParser:
+
+    def test_next_pages_follow_pager_links(self) -> None:
+        page = make_main_page(rows_count=1, pages_count=3).replace(b"</body>", b"<script>var next = '?PAGEN_1=9';</script></body>")
+
+        with make_context() as context:
+            parser = PersonalNaksCertificationPipelineParser(context)
+            parser.http_worker = StubHttpWorker((page, page, page))
+            tasks = list(parser.fetch_main_page(PersonalNaksCertificationMainPageTask(SearchNaksCertificationItem(), 1)))
+
+        assert [task.page for task in tasks] == [1, 2, 3]
+
+
+class MockRegistry:
+
+    def __init__(self, pages_count: int = 1, rows_count: int = 2, statuses: dict[str, list[int]] | None = None, delay: float = 0) -> None:
+        self.pages_count = pages_count
+        self.rows_count = rows_count
+        self.statuses = statuses or {}
+        self.delay = delay
+        self.requested: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+
+    async def __call__(self, request: Request) -> Response:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        await async_sleep(self.delay)
+
+        self.in_flight -= 1
+
+        if request.method == "POST":
+            page = int(parse_qs(request.content.decode())["PAGEN_1"][0])
+            key = f"main-{page}"
+            content = make_main_page(self.rows_count, self.pages_count, first_ident=(page - 1) * self.rows_count)
+        else:
+            key = request.url.params["ID"]
+            content = make_additional_page(key)
+
+        self.requested.append(key)
+
+        if self.statuses.get(key):
+            return Response(self.statuses[key].pop(0), headers={"Retry-After": "0"})
+
+        return Response(200, content=content, headers={"Content-Type": "text/html; charset=windows-1251"})
+
+
+def parse_async(context: ParseContext, registry: MockRegistry, max_in_flight: int = 100) -> list[PersonalNaksCertificationData]:
+    async def main() -> list[PersonalNaksCertificationData]:
+        parser = AsyncPersonalNaksCertificationParser(context, max_in_flight)
+        parser.http_worker.client = AsyncClient(transport=MockTransport(registry))
+
+        async with parser:
+            return await parser.parse(SearchNaksCertificationItem())
+
+    return run(main())
+
+
+class TestAsyncPersonalNaksCertificationParser:
+
+    @pytest.mark.parametrize("stream_main_pages", [False, True])
+    def test_parses_all_pages_in_page_order(self, stream_main_pages: bool) -> None:
+        registry = MockRegistry(pages_count=3, rows_count=2)
+
+        result = parse_async(make_context(stream_main_pages=stream_main_pages), registry)
+
+        assert [el.certification_number for el in result] == [f"АЦСТ-1-{ident:05}" for ident in range(6)]
+        assert [el.detail_types for el in result] == [[f"Т{ident}"] for ident in range(6)]
+        assert sorted(key for key in registry.requested if key.startswith("main")) == ["main-1", "main-2", "main-3"]
+
+
+    @pytest.mark.parametrize("stream_main_pages", [False, True])
+    def test_retries_throttled_responses(self, stream_main_pages: bool) -> None:
+        registry = MockRegistry(statuses={"main-1": [429, 503], "1": [503]})
+
+        result = parse_async(make_context(stream_main_pages=stream_main_pages), registry)
+
+        assert len(result) == 2
+        assert registry.requested.count("main-1") == 3
+        assert registry.requested.count("1") == 2
+
+
+    @pytest.mark.parametrize(("stream_main_pages", "key"), [(False, "main-1"), (True, "main-1"), (False, "1")])
+    def test_fails_on_other_error_statuses(self, stream_main_pages: bool, key: str) -> None:
+        registry = MockRegistry(statuses={key: [500]})
+
+        with pytest.raises(BadResponseError):
+            parse_async(make_context(stream_main_pages=stream_main_pages), registry)
+
+        assert registry.requested.count(key) == 1
+
+
+    def test_max_in_flight_bounds_requests(self) -> None:
+        registry = MockRegistry(rows_count=12, delay=.01)
+
+        result = parse_async(make_context(), registry, max_in_flight=3)
+
+        assert len(result) == 12
+        assert registry.max_in_flight == 3
+
+
+class TestPersonalNaksCertificationHttpWorker:
+    extractor = PersonalNaksCertificationExtractor()
+
+    @pytest.mark.parametrize(
+        ("content_type", "encoding"),
+        [
+            ("text/html; charset=\"windows-1251\"", "windows-1251"),
+            ("text/html; charset='utf-8'", "utf-8"),
+            ("text/html;charset=windows-1251", "windows-1251"),
+            ("text/html", None),
+            (None, None)
+        ]
+    )
+    def test_declared_encoding(self, content_type: str | None, encoding: str | None) -> None:
+        assert get_declared_encoding(content_type) == encoding
+
+
+    @pytest.mark.parametrize(
+        ("content_type", "encoding"), 
+        [("text/html", REGISTRY_ENCODING), (None, REGISTRY_ENCODING), ("text/html; charset=windows-1251", "windows-1251")]
+    )
+    def test_cp1251_pages_are_decoded(self, content_type: str | None, encoding: str) -> None:
+        http_worker = PersonalNaksCertificationHttpWorker(TokenBucketRateLimiter(100, 100))
+        mock = Mocker()
+
+        with mock:
+            mock.get(
+                http_worker._get_additional_page_url("1"), 
+                content=make_additional_page("1"), 
+                headers={"Content-Type": content_type} if content_type else {}
+            )
+
+            page = http_worker.get_additional_page("1")
+
+        assert page.encoding == encoding
+        assert self.extractor.parse_additional_page(page.content, page.encoding).detail_types == "Т1"
+
+    def test_timeouts_are_retried(self) -> None:
+        http_worker = PersonalNaksCertificationHttpWorker(TokenBucketRateLimiter(100, 100))
+        mock = Mocker()
+
+        with mock:
+            mock.get(
+                http_worker._get_additional_page_url("1"), 
+                [{"exc": ReadTimeout}, {"exc": ConnectTimeout}, {"content": make_additional_page("1")}]
+            )
+
+            assert http_worker.get_additional_page("1").content == make_additional_page("1")
+            assert mock.call_count == 3
+
+
+    def test_concurrency_controller_bounds_every_request(self) -> None:
+        controller = AIMDConcurrencyController(initial=2, max_limit=2)
+        active: list[int] = []
+
+        def respond(content: bytes) -> t.Callable[..., bytes]:
+            def callback(request, context) -> bytes:
+                active.append(controller.active)
+                sleep(.01)
+
+                return content
+
+            return callback
+
+        mock = Mocker()
+
+        with mock, make_context(request_observer=controller, page_workers=4, detail_workers=8) as context:
+            parser = PersonalNaksCertificationParser(context)
+            mock.post(parser.http_worker.base_url, content=respond(make_main_page(rows_count=8, pages_count=1)))
+            mock.get(re.compile("detail.php"), content=respond(make_additional_page("1")))
+
+            result = parser.parse(SearchNaksCertificationItem())
+
+        assert len(result) == 8
+        assert len(active) == 9
+        assert max(active) == 2
+        assert controller.active == 0
+
+
+class TestConditionalDetailPageRequests:
+    last_modified = "Wed, 01 Jan 2025 00:00:00 GMT"
+
+    def make_http_worker(self, tmp_path: Path) -> PersonalNaksCertificationHttpWorker:
+        # detail pages expire at once, so every request after the first one is conditional
+        page_cache = SqlitePageCache(tmp_path / "cache.sqlite3", ttls={"main": timedelta(hours=1), "additional": timedelta(seconds=-1)}, max_size=2 ** 20)
+
+        return PersonalNaksCertificationHttpWorker(TokenBucketRateLimiter(100, 100), page_cache=page_cache, transfer_stats=TransferStats())
+
+
+    def test_not_modified_page_is_taken_from_cache(self, tmp_path: Path) -> None:
+        http_worker = self.make_http_worker(tmp_path)
+        content = make_additional_page("1")
+        compressed = gzip.compress(content)
+        mock = Mocker()
+
+        with mock:
+            mock.get(
+                http_worker._get_additional_page_url("1"), 
+                [
+                    {"content": compressed, "headers": {"Content-Encoding": "gzip", "ETag": "\"e1\"", "Last-Modified": self.last_modified}},
+                    {"status_code": 304, "headers": {"ETag": "\"e1\""}}
+                ]
+            )
+
+            first_page = http_worker.get_additional_page("1")
+            second_page = http_worker.get_additional_page("1")
+
+        first_request, second_request = mock.request_history
+
+        assert first_page.content == second_page.content == content
+        assert "If-None-Match" not in first_request.headers
+        assert (second_request.headers["If-None-Match"], second_request.headers["If-Modified-Since"]) == ("\"e1\"", self.last_modified)
+        assert first_request.headers["Accept-Encoding"] == second_request.headers["Accept-Encoding"] == ACCEPT_ENCODING
+        assert http_worker.page_cache.revalidated["additional"] == 1
+        assert (http_worker.transfer_stats.downloaded, http_worker.transfer_stats.revalidated) == (len(compressed), len(content))
+
+
+    def test_modified_page_replaces_cached_one(self, tmp_path: Path) -> None:
+        http_worker = self.make_http_worker(tmp_path)
+        mock = Mocker()
+
+        with mock:
+            mock.get(
+                http_worker._get_additional_page_url("1"), 
+                [
+                    {"content": make_additional_page("1"), "headers": {"ETag": "\"e1\""}},
+                    {"content": make_additional_page("2"), "headers": {"ETag": "\"e2\""}}
+                ]
+            )
+
+            http_worker.get_additional_page("1")
+
+            assert http_worker.get_additional_page("1").content == make_additional_page("2")
+
+        assert http_worker.page_cache.get_stale("additional", "1").etag == "\"e2\""
+        assert http_worker.page_cache.revalidated["additional"] == 0
+        assert http_worker.transfer_stats.revalidated == 0
+
+
+class TestProcessPoolExtraction:
+
+    def test_pages_and_models_cross_spawned_processes(self) -> None:
+        content = make_main_page(rows_count=3, pages_count=2)
+        pages = [(make_main_cert_data(ident), make_additional_page(str(ident)), REGISTRY_ENCODING) for ident in range(3)]
+
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+            main_page = executor.submit(extract_main_page, content, REGISTRY_ENCODING).result()
+            certifications = executor.submit(extract_certifications, pages).result()
+
+        assert main_page == extract_main_page(content, REGISTRY_ENCODING)
+        assert main_page.pages_count == 2
+        assert certifications == extract_certifications(pages)
+        assert [el.detail_types for el in certifications] == [["Т0"], ["Т1"], ["Т2"]]
+
+
+    def test_parse_in_processes_matches_parse_in_threads(self) -> None:
+        content = make_main_page(rows_count=5, pages_count=1)
+
+        with make_context(parse_processes=1) as context:
+            result = make_parser(context, content).parse(SearchNaksCertificationItem())
+
+        assert result == make_parser(make_context(), content).parse(SearchNaksCertificationItem())
+        assert len(result) == 5
+
+
+    def test_reused_and_extracted_rows_keep_row_order(self) -> None:
+        reused = PersonalNaksCertificationData.model_validate(make_main_cert_data(1).__dict__ | {"gtd": [], "html": ""})
+        page = NaksPage(make_additional_page("x"), REGISTRY_ENCODING)
+
+        with make_context(parse_processes=1) as context:
+            result = PersonalNaksCertificationParser(context)._extract_rows_in_processes([
+                (make_main_cert_data(0), page),
+                reused,
+                (make_main_cert_data(2, certification_date="bad"), page),
+                (make_main_cert_data(3), page)
+            ])
+
+        assert [el.certification_number for el in result] == ["АЦСТ-1-00000", "АЦСТ-1-00001", "АЦСТ-1-00003"]
+        assert result[1] is reused
+
+
+class TestPersonalNaksCertificationMainPageFeed:
+    extractor = PersonalNaksCertificationExtractor()
+
+    def test_feed_matches_whole_page_parsing(self) -> None:
+        content = make_main_page(rows_count=20, pages_count=3)
+        feed = self.extractor.feed_main_page(REGISTRY_ENCODING)
+
+        rows = []
+
+        for start in range(0, len(content), 64):
+            rows += feed.feed(content[start:start + 64])
+
+        rows += feed.close()
+
+        main_page = self.extractor.parse_main_page(content, REGISTRY_ENCODING)
+
+        assert rows == main_page.rows
+        assert feed.pages_count == main_page.pages_count == 3
+
+
+    def test_feed_emits_rows_before_page_end(self) -> None:
+        content = make_main_page(rows_count=5, pages_count=1)
+        feed = self.extractor.feed_main_page(REGISTRY_ENCODING)
+
+        rows = feed.feed(content[:content.index(b"</table>")])
+
+        assert len(rows) >= 4
+
+
+class DictCertificationStore(dict):
+
+    def get(self, certification_number: str) -> PersonalNaksCertificationData | None:
+        return super().get(certification_number)
+
+
+class TestGetReusableCertificationData:
+    main_cert_data = PersonalNaksCertificationMainPageData(
+        name="Иванов Иван Иванович",
+        kleymo="1A2B",
+        company="ООО Новая Компания",
+        certification_number="АЦСТ-1-00001",
+        certification_date="01.02.2023",
+        expiration_date="01.02.2026",
+        expiration_date_fact="01.02.2026",
+        additional_page_id="1",
+        method="РД"
+    )
+    known = PersonalNaksCertificationData(
+        name="Иванов Иван Иванович",
+        kleymo="1A2B",
+        company="ООО Компания",
+        certification_number="АЦСТ-1-00001",
+        certification_date="01.02.2023",
+        expiration_date="01.02.2026",
+        expiration_date_fact="01.02.2026",
+        method="РД",
+        gtd=["ГДО"],
+        materials=["М01"],
+        html="<div></div>"
+    )
+
+    def test_reuses_details_of_unchanged_certification(self) -> None:
+        certification = get_reusable_certification_data(self.main_cert_data, DictCertificationStore({self.known.certification_number: self.known}))
+
+        assert certification.gtd == ["ГДО"]
+        assert certification.materials == ["М01"]
+        assert certification.company == "ООО Новая Компания"
+
+
+    def test_skips_changed_or_unknown_certification(self) -> None:
+        changed = self.known.model_copy(update={"expiration_date_fact": self.known.certification_date})
+
+        assert get_reusable_certification_data(self.main_cert_data, DictCertificationStore({changed.certification_number: changed})) is None
+        assert get_reusable_certification_data(self.main_cert_data, DictCertificationStore()) is None
+        assert get_reusable_certification_data(self.main_cert_data, None) is None
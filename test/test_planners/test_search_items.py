@@ -0,0 +1,83 @@
+from src.application.planners import PersonalNaksSearchPlanner, PlannedSearchRowFilter
+from src.infrastructure.dto import SearchNaksCertificationItem
+from src.infrastructure.parsers.personal import PersonalNaksCertificationHttpWorker, PersonalNaksCertificationMainPageData
+from src.utils.rate_limiter import TokenBucketRateLimiter
+
+
+def make_row(kleymo: str, name: str = "Иванов Иван Иванович") -> PersonalNaksCertificationMainPageData:
+    return PersonalNaksCertificationMainPageData(
+        name=name,
+        kleymo=kleymo,
+        company="ООО Компания",
+        certification_number="АЦСТ-1-00001",
+        certification_date="01.02.2023",
+        expiration_date="01.02.2026",
+        expiration_date_fact="01.02.2026",
+        additional_page_id="1"
+    )
+
+
+class TestPersonalNaksSearchPlanner:
+    planner = PersonalNaksSearchPlanner()
+
+    def test_groups_kleymos_by_prefix(self) -> None:
+        items = [SearchNaksCertificationItem(kleymo=kleymo) for kleymo in ["1A2B", "1A2C", "1A2D", "3F4G"]]
+
+        plan = self.planner.plan(items)
+
+        assert [query.kleymo for query in plan.queries] == ["1A2"]
+        assert plan.queries[0].targets == items[:3]
+        assert plan.narrow == items[3:]
+
+
+    def test_kleymo_prefix_is_sent_as_registry_code_filter(self) -> None:
+        plan = self.planner.plan([SearchNaksCertificationItem(kleymo=kleymo) for kleymo in ["1a2b", "1A2C"]])
+        http_worker = PersonalNaksCertificationHttpWorker(TokenBucketRateLimiter(100, 100))
+
+        assert "&arrFilter_ff%5BCODE%5D=1A2&" in http_worker._get_request_data(plan.queries[0])
+
+
+    def test_groups_names_by_surname(self) -> None:
+        items = [SearchNaksCertificationItem(name=name) for name in ["Иванов Иван", "Иванов Петр"]]
+
+        plan = self.planner.plan(items)
+
+        assert [query.name for query in plan.queries] == ["Иванов"]
+
+
+    def test_keeps_narrow_items_with_certificate_number_or_dates(self) -> None:
+        items = [
+            SearchNaksCertificationItem(kleymo="1A2B", cert_number="1"),
+            SearchNaksCertificationItem(kleymo="1A2C", date_create_from="01.01.2024")
+        ]
+
+        plan = self.planner.plan(items)
+
+        assert plan.queries == []
+        assert plan.narrow == items
+
+
+class TestPlannedSearchRowFilter:
+
+    def test_resolves_matched_targets(self) -> None:
+        items = [SearchNaksCertificationItem(kleymo=kleymo) for kleymo in ["1A2B", "1A2C"]]
+        plan = PersonalNaksSearchPlanner().plan(items)
+        row_filter = PlannedSearchRowFilter()
+
+        assert row_filter(plan.queries[0], make_row("1A2B"))
+        assert not row_filter(plan.queries[0], make_row("1A2X"))
+        assert row_filter.get_unresolved(plan.queries) == [items[1]]
+
+
+    def test_abandons_broad_query_costing_more_than_its_targets(self) -> None:
+        items = [SearchNaksCertificationItem(kleymo=kleymo) for kleymo in ["1A2B", "1A2C"]]
+        plan = PersonalNaksSearchPlanner().plan(items)
+        row_filter = PlannedSearchRowFilter()
+
+        assert row_filter(plan.queries[0], make_row("1A2B"))
+        assert row_filter.limit_pages(plan.queries[0], 3) == 3
+        assert row_filter.get_unresolved(plan.queries) == [items[1]]
+
+        assert row_filter.limit_pages(plan.queries[0], 4) == 1
+        assert row_filter.get_unresolved(plan.queries) == items
+        assert row_filter.limit_pages(items[0], 4) == 4
@@ -0,0 +1,59 @@
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from funcs import make_certification
+from src.infrastructure.dto import PersonalNaksCertificationData
+from src.infrastructure.sinks import ArrowResultSink, JsonResultSink, NdjsonResultSink
+from src.utils.funcs import read_json, read_ndjson
+
+
+class TestResultSinks:
+    certifications = [make_certification("АЦСТ-1-00001"), make_certification("АЦСТ-1-00002")]
+
+    def test_ndjson_sink_writes_one_compact_line_per_result(self, tmp_path: Path) -> None:
+        for compress, name in [(True, "result.ndjson.gz"), (False, "result.ndjson")]:
+            sink = NdjsonResultSink(tmp_path / name, compress)
+
+            for certification in self.certifications:
+                sink.write(certification)
+
+            sink.close()
+
+            assert [PersonalNaksCertificationData.model_validate(el) for el in read_ndjson(tmp_path / name)] == self.certifications
+
+        assert (tmp_path / "result.ndjson").read_text(encoding="utf-8").count("\n") == 2
+
+
+    def test_json_sink_keeps_pretty_json_format(self, tmp_path: Path) -> None:
+        sink = JsonResultSink(tmp_path / "result.json")
+
+        for certification in self.certifications:
+            sink.write(certification)
+
+        sink.close()
+
+        assert read_json(tmp_path / "result.json") == [el.model_dump(mode="json") for el in self.certifications]
+
+
+    @pytest.mark.parametrize("file_format", ["parquet", "arrow"])
+    def test_arrow_sink_writes_native_list_and_date_columns(self, tmp_path: Path, file_format: str) -> None:
+        pa = pytest.importorskip("pyarrow")
+        path = tmp_path / f"result.{file_format}"
+
+        sink = ArrowResultSink(path, file_format, batch_size=1)
+
+        for certification in self.certifications:
+            sink.write(certification)
+
+        sink.close()
+
+        if file_format == "parquet":
+            table = pytest.importorskip("pyarrow.parquet").read_table(path, columns=["gtd", "expiration_date"])
+        else:
+            with pa.memory_map(str(path)) as source:
+                table = pa.ipc.open_file(source).read_all().select(["gtd", "expiration_date"])
+
+        assert table.schema.field("gtd").type == pa.list_(pa.string())
+        assert table.to_pylist() == [{"gtd": ["КО(1)", "КО(2)", "СК(1)"], "expiration_date": date(2026, 2, 1)}] * 2
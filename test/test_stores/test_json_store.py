@@ -0,0 +1,43 @@
+from datetime import date
+from pathlib import Path
+import gzip
+
+from funcs import make_certification
+from src.infrastructure.stores import JsonPersonalNaksCertificationStore
+from src.utils.funcs import save_json
+
+
+class TestJsonPersonalNaksCertificationStore:
+
+    def test_commit_round_trip(self, tmp_path: Path) -> None:
+        path = tmp_path / "mirror" / "mirror.json"
+
+        store = JsonPersonalNaksCertificationStore(path)
+
+        assert store.upsert([make_certification("АЦСТ-1-00001"), make_certification("АЦСТ-1-00002")]) == 2
+        assert store.upsert([make_certification("АЦСТ-1-00001"), make_certification("АЦСТ-1-00002", "ООО Другая")]) == 1
+
+        store.set_watermark(date(2025, 1, 1))
+        store.commit()
+
+        store = JsonPersonalNaksCertificationStore(path)
+
+        assert store.get_watermark() == date(2025, 1, 1)
+        assert store.get("АЦСТ-1-00002") == make_certification("АЦСТ-1-00002", "ООО Другая")
+        assert store.get("АЦСТ-1-00003") is None
+
+
+    def test_loads_legacy_list_and_ndjson_saves(self, tmp_path: Path) -> None:
+        certifications = [make_certification("АЦСТ-1-00001"), make_certification("АЦСТ-1-00002")]
+
+        save_json([el.model_dump(mode="json") for el in certifications], tmp_path / "save.json")
+
+        with gzip.open(tmp_path / "save.ndjson.gz", "wt", encoding="utf-8") as file:
+            for certification in certifications:
+                file.write(certification.model_dump_json() + "\n")
+
+        for name in ["save.json", "save.ndjson.gz"]:
+            store = JsonPersonalNaksCertificationStore(tmp_path / name)
+
+            assert store.get_watermark() is None
+            assert [store.get(el.certification_number) for el in certifications] == certifications
@@ -0,0 +1,42 @@
+from pathlib import Path
+
+from funcs import make_certification
+from src.infrastructure.dto import SearchNaksCertificationItem
+from src.infrastructure.stores import NdjsonPersonalNaksParseJournal
+
+
+class TestNdjsonPersonalNaksParseJournal:
+
+    def test_resume_restores_completed_items_and_results(self, tmp_path: Path) -> None:
+        path = tmp_path / "run.journal.ndjson"
+
+        journal = NdjsonPersonalNaksParseJournal(path)
+        journal.append(SearchNaksCertificationItem(kleymo="1A2B"), [make_certification("АЦСТ-1-00001")])
+        journal.close()
+
+        with open(path, "a", encoding="utf-8") as file:
+            file.write('{"search_item": {"kleymo": "3C')
+
+        journal = NdjsonPersonalNaksParseJournal(path, resume=True)
+
+        assert journal.is_completed(SearchNaksCertificationItem(kleymo="1A2B"))
+        assert not journal.is_completed(SearchNaksCertificationItem(kleymo="3C4D"))
+        assert journal.get_completed_results() == [make_certification("АЦСТ-1-00001")]
+
+        journal.append(SearchNaksCertificationItem(kleymo="3C4D"), [])
+        journal.close()
+
+        assert len(path.read_text(encoding="utf-8").splitlines()) == 2
+
+
+    def test_new_run_starts_empty_journal(self, tmp_path: Path) -> None:
+        path = tmp_path / "run.journal.ndjson"
+
+        journal = NdjsonPersonalNaksParseJournal(path)
+        journal.append(SearchNaksCertificationItem(kleymo="1A2B"), [])
+        journal.close()
+
+        journal = NdjsonPersonalNaksParseJournal(path)
+
+        assert not journal.is_completed(SearchNaksCertificationItem(kleymo="1A2B"))
+        assert path.read_bytes() == b""
@@ -0,0 +1,80 @@
+from datetime import date
+from pathlib import Path
+import sqlite3
+
+from funcs import make_certification
+from src.infrastructure.stores import SqlitePersonalNaksCertificationStore
+
+
+class TestSqlitePersonalNaksCertificationStore:
+
+    def test_upsert_saves_only_changed_rows(self, tmp_path: Path) -> None:
+        path = tmp_path / "store.sqlite3"
+
+        store = SqlitePersonalNaksCertificationStore(path, batch_size=2)
+
+        assert store.upsert([make_certification("АЦСТ-1-00001"), make_certification("АЦСТ-1-00002")]) == 2
+        assert store.upsert([make_certification("АЦСТ-1-00001"), make_certification("АЦСТ-1-00002", "ООО Другая")]) == 1
+
+        store.set_watermark(date(2025, 1, 1))
+        store.close()
+
+        store = SqlitePersonalNaksCertificationStore(path)
+
+        assert store.get("АЦСТ-1-00002") == make_certification("АЦСТ-1-00002", "ООО Другая")
+        assert store.get("АЦСТ-1-00003") is None
+        assert store.get_watermark() == date(2025, 1, 1)
+
+        store.close()
+
+        with sqlite3.connect(path) as connection:
+            gtds = connection.execute("SELECT gtd, COUNT(*) FROM certification_gtds GROUP BY gtd ORDER BY gtd").fetchall()
+
+        assert gtds == [("КО(1)", 2), ("КО(2)", 2), ("СК(1)", 2)]
+
+
+    def test_writes_are_applied_in_background(self, tmp_path: Path) -> None:
+        store = SqlitePersonalNaksCertificationStore(tmp_path / "store.sqlite3")
+
+        for i in range(1200):
+            store.write(make_certification(f"АЦСТ-1-{i:05}"))
+
+        store.commit()
+
+        assert store.written == 1200
+        assert store.changed == 1200
+        assert store.get("АЦСТ-1-01199") is not None
+
+        store.close()
+
+
+    def test_find_uses_all_filters(self, tmp_path: Path) -> None:
+        store = SqlitePersonalNaksCertificationStore(tmp_path / "store.sqlite3")
+
+        first = make_certification("АЦСТ-1-00001", detail_thikness_from=2, detail_thikness_before=12)
+        second = make_certification(
+            "АЦСТ-1-00002", 
+            "АО Завод", 
+            kleymo="3C4D", 
+            gtd=["НГДО(3)"], 
+            materials=["М11"],
+            expiration_date_fact="01.02.2024",
+            detail_thikness_from=10
+        )
+
+        store.upsert([first, second])
+
+        assert store.find(kleymo="3C4D") == [second]
+        assert store.find(company="завод") == [second]
+        assert store.find(company_prefix="АО З") == [second]
+        assert store.find(company_prefix="АО Я") == []
+        assert store.find(active_on=date(2025, 1, 1)) == [first]
+        assert store.find(expiring_before=date(2025, 1, 1)) == [second]
+        assert store.find(gtd="КО") == [first]
+        assert store.find(gtd="КО(2)", material="М03") == [first]
+        assert store.find(gtd="К") == []
+        assert store.find(detail_thikness=11) == [second, first]
+        assert store.find(detail_thikness=20) == [second]
+        assert store.find(detail_thikness=1) == []
+
+        store.close()
@@ -0,0 +1,71 @@
+from threading import Thread
+from time import sleep
+
+from src.utils.concurrency import AIMDConcurrencyController
+
+
+class TestAIMDConcurrencyController:
+
+    def test_additive_increase_on_healthy_window(self) -> None:
+        controller = AIMDConcurrencyController(initial=4, window=5)
+
+        for _ in range(10):
+            controller.observe(0.2, True)
+
+        assert controller.limit == 6
+
+
+    def test_multiplicative_decrease_on_errors(self) -> None:
+        controller = AIMDConcurrencyController(initial=8, window=5)
+
+        for ok in [True, False, True, False, True]:
+            controller.observe(0.2, ok)
+
+        assert controller.limit == 4
+
+
+    def test_multiplicative_decrease_on_latency_growth(self) -> None:
+        controller = AIMDConcurrencyController(initial=8, window=5)
+
+        for _ in range(5):
+            controller.observe(0.2, True)
+
+        for _ in range(5):
+            controller.observe(1, True)
+
+        assert controller.limit == 4
+
+
+    def test_limit_is_bounded(self) -> None:
+        controller = AIMDConcurrencyController(initial=2, min_limit=2, max_limit=3, window=1)
+
+        for _ in range(5):
+            controller.observe(0.2, True)
+
+        assert controller.limit == 3
+
+        for _ in range(5):
+            controller.observe(0.2, False)
+
+        assert controller.limit == 2
+
+
+    def test_slot_blocks_above_limit(self) -> None:
+        controller = AIMDConcurrencyController(initial=1)
+        entered: list[int] = []
+
+        def worker(ident: int) -> None:
+            with controller.slot():
+                entered.append(ident)
+                sleep(.05)
+
+        with controller.slot():
+            thread = Thread(target=worker, args=(1,))
+            thread.start()
+            sleep(.05)
+
+            assert entered == []
+
+        thread.join()
+
+        assert entered == [1]
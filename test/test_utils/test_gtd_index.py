@@ -0,0 +1,34 @@
+from json import dumps
+from pathlib import Path
+
+from src.utils.gtd_index import GtdIndex, load_gtd_index
+
+
+GTD_DATA = {
+    "КО": {"description": "Котельное оборудование"},
+    "ОХНВП": {"description": "Оборудование химических, нефтехимических, нефтеперерабатывающих и взрывопожароопасных производств"},
+    "ПТО": {"description": "Подъемно-транспортное оборудование"},
+    "ПТОП": {"description": "Подъемно-транспортное оборудование портов"}
+}
+
+
+class TestGtdIndex:
+
+    def test_parse_maps_descriptions_to_codes_and_subgroups(self) -> None:
+        index = GtdIndex.from_gtd_data(GTD_DATA)
+
+        gtd = (
+            "Котельное оборудование (1, 2, 3); "
+            "Оборудование химических, нефтехимических, нефтеперерабатывающих и взрывопожароопасных производств (4),"
+            "Подъемно-транспортное оборудование портов (1); Неизвестное оборудование (2); Подъемно-транспортное оборудование (2)"
+        )
+
+        assert index.parse(gtd) == ["КО(1)", "КО(2)", "КО(3)", "ОХНВП(4)", "ПТОП(1)", "ПТО(2)"]
+        assert index.parse("Неизвестное оборудование (2)") == []
+
+
+    def test_load_reads_gtd_data_file(self, tmp_path: Path) -> None:
+        data_path = tmp_path / "gtd_data.json"
+        data_path.write_text(dumps(GTD_DATA, ensure_ascii=False), encoding="utf-8")
+
+        assert load_gtd_index(data_path).descriptions == GtdIndex.from_gtd_data(GTD_DATA).descriptions
@@ -0,0 +1,19 @@
+from src.utils.parse_utils import get_before_value_or_none, get_normalization_cache_stats, parse_list_data, parse_materials
+
+
+class TestNormalizationCache:
+
+    def test_cached_results_are_not_shared(self) -> None:
+        first = parse_materials("M01, М03+M11 [не применяется]")
+        first.append("М07")
+
+        assert parse_materials("M01, М03+M11 [не применяется]") == ["М01", "М03+М11"]
+        assert parse_list_data("Т, У; С [примечание]") == ["Т", "У", "С"]
+
+
+    def test_repeated_values_hit_cache(self) -> None:
+        hits, misses = get_normalization_cache_stats()["before_value"]
+
+        assert get_before_value_or_none("от 3,5 до 12 мм; До 25") == 25
+        assert get_before_value_or_none("от 3,5 до 12 мм; До 25") == 25
+        assert get_normalization_cache_stats()["before_value"] == (hits + 1, misses + 1)
@@ -0,0 +1,63 @@
+from threading import Lock
+from time import sleep
+
+from src.utils.pipeline import Pipeline, Stage
+
+
+class TestPipeline:
+
+    def test_items_flow_through_bounded_stages(self) -> None:
+        collected: list[int] = []
+        lock = Lock()
+
+        def expand(item: int) -> list[int]:
+            return [item * 10 + i for i in range(3)]
+
+        def check(item: int) -> list[int]:
+            sleep(.001)
+
+            if item == 42:
+                raise ValueError(item)
+
+            return [item]
+
+        def collect(item: int) -> list[int]:
+            with lock:
+                collected.append(item)
+
+            return []
+
+        pipeline = Pipeline([
+            Stage("expand", expand, workers=2, queue_size=2),
+            Stage("check", check, workers=4, queue_size=3),
+            Stage("collect", collect)
+        ])
+        pipeline.run(range(10))
+
+        assert sorted(collected) == [i for i in range(100) if i % 10 < 3 and i != 42]
+        assert [(stats.received, stats.emitted, stats.failed) for stats in pipeline.stats] == [(10, 30, 0), (30, 29, 1), (29, 0, 0)]
+        assert all(stats.max_depth <= stats.queue_size for stats in pipeline.stats)
+        assert [(stage, item) for stage, item, _ in pipeline.get_failures()] == [("check", 42)]
+
+
+    def test_backpressure_is_counted_as_blocked_not_busy(self) -> None:
+        def produce(item: int) -> list[int]:
+            return list(range(20))
+
+        def consume(item: int) -> list[int]:
+            sleep(.005)
+
+            return []
+
+        pipeline = Pipeline([
+            Stage("produce", produce, queue_size=1),
+            Stage("consume", consume, queue_size=1)
+        ])
+        pipeline.run([0])
+
+        produce_stats, consume_stats = pipeline.stats
+
+        assert produce_stats.blocked > .05
+        assert produce_stats.busy < produce_stats.blocked / 5
+        assert consume_stats.busy > .09
+        assert consume_stats.blocked == 0
@@ -0,0 +1,55 @@
+import pytest
+
+from src.utils.rate_limiter import TokenBucketRateLimiter, parse_retry_after
+
+
+class TestTokenBucketRateLimiter:
+
+    def test_burst_is_free(self) -> None:
+        limiter = TokenBucketRateLimiter(rate=2, burst=3)
+
+        delays = [limiter._reserve() for _ in range(3)]
+
+        assert all(delay == 0 for delay in delays)
+
+
+    def test_requests_above_burst_are_spaced_by_rate(self) -> None:
+        limiter = TokenBucketRateLimiter(rate=2, burst=1)
+
+        limiter._reserve()
+
+        assert limiter._reserve() == pytest.approx(0.5, abs=0.01)
+        assert limiter._reserve() == pytest.approx(1, abs=0.01)
+
+
+    def test_throttle_halves_rate_and_honours_retry_after(self) -> None:
+        limiter = TokenBucketRateLimiter(rate=4, burst=4)
+
+        limiter.throttle(retry_after=10)
+
+        assert limiter.rate == 2
+        assert limiter._reserve() == pytest.approx(10.5, abs=0.01)
+
+
+    def test_recover_does_not_exceed_max_rate(self) -> None:
+        limiter = TokenBucketRateLimiter(rate=4, burst=1)
+
+        limiter.throttle()
+
+        for _ in range(100):
+            limiter.recover()
+
+        assert limiter.rate == 4
+
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("120", 120),
+            (None, None),
+            ("not a date", None),
+            ("Wed, 21 Oct 2015 07:28:00 GMT", 0)
+        ]
+    )
+    def test_parse_retry_after(self, value: str | None, expected: float | None) -> None:
+        assert parse_retry_after(value) == expected
@@ -0,0 +1,108 @@
+from threading import Lock
+from asyncio import run, sleep
+from typing import Callable
+
+from src.utils.scheduler import AsyncWorkScheduler, WorkScheduler
+
+
+class TestWorkScheduler:
+
+    def test_workers_survive_failures(self) -> None:
+        handled: list[int] = []
+        attempts: dict[int, int] = {}
+        completed: list[int] = []
+        lock = Lock()
+
+        def handle(item: int) -> None:
+            with lock:
+                attempts[item] = attempts.get(item, 0) + 1
+
+            if item % 10 == 0 or (item == 5 and attempts[item] == 1):
+                raise ValueError(item)
+
+            with lock:
+                handled.append(item)
+
+        scheduler: WorkScheduler[int] = WorkScheduler(4, on_completed=completed.append)
+        scheduler.run(range(100), lambda: handle)
+
+        assert sorted(handled) == [i for i in range(100) if i % 10]
+        assert sorted(failure.item for failure in scheduler.failures) == list(range(0, 100, 10))
+        assert scheduler.completed == 90
+        assert sorted(completed) == list(range(100))
+        assert scheduler.active == 0
+
+
+    def test_results_are_saved_once_after_retried_handler(self) -> None:
+        attempts: dict[int, int] = {}
+        saved: list[tuple[int, int]] = []
+
+        def handle(item: int) -> int:
+            attempts[item] = attempts.get(item, 0) + 1
+
+            if attempts[item] == 1:
+                raise ValueError(item)
+
+            return item * 10
+
+        def save(item: int, result: int) -> None:
+            if item == 2:
+                raise OSError(item)
+
+            saved.append((item, result))
+
+        scheduler: WorkScheduler[int] = WorkScheduler(1, on_result=save)
+        scheduler.run(range(3), lambda: handle)
+
+        assert saved == [(0, 0), (1, 10)]
+        assert attempts == {0: 2, 1: 2, 2: 2}
+        assert [(failure.item, type(failure.error)) for failure in scheduler.failures] == [(2, OSError)]
+
+
+    def test_handler_init_errors_are_recorded(self) -> None:
+        calls: list[int] = []
+        lock = Lock()
+
+        def make_handler(fail_first: bool) -> Callable[[int], None]:
+            with lock:
+                calls.append(len(calls))
+
+                if not fail_first or len(calls) == 1:
+                    raise RuntimeError("no session")
+
+            return lambda item: None
+
+        scheduler: WorkScheduler[int] = WorkScheduler(3, attempts=1)
+        scheduler.run(range(10), lambda: make_handler(fail_first=True))
+
+        assert scheduler.completed == 10
+        assert [str(error) for error in scheduler.worker_errors] == ["no session"]
+
+        scheduler = WorkScheduler(3, attempts=1)
+        scheduler.run(range(10), lambda: make_handler(fail_first=False))
+
+        assert scheduler.completed == 0
+        assert sorted(failure.item for failure in scheduler.failures) == list(range(10))
+        assert len(scheduler.worker_errors) == 3
+        assert scheduler.active == 0
+
+
+class TestAsyncWorkScheduler:
+
+    def test_workers_survive_failures(self) -> None:
+        handled: list[int] = []
+
+        async def handle(item: int) -> None:
+            await sleep(0)
+
+            if item == 3:
+                raise ValueError(item)
+
+            handled.append(item)
+
+        scheduler: AsyncWorkScheduler[int] = AsyncWorkScheduler(3, attempts=1)
+        run(scheduler.run(range(10), handle))
+
+        assert sorted(handled) == [0, 1, 2, 4, 5, 6, 7, 8, 9]
+        assert [failure.item for failure in scheduler.failures] == [3]
+        assert scheduler.completed == 9
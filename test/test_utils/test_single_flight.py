@@ -0,0 +1,74 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+from asyncio import gather, run, sleep
+import time
+
+import pytest
+
+from src.utils.single_flight import AsyncSingleFlight, SingleFlight
+
+
+class TestSingleFlight:
+
+    def test_concurrent_calls_share_one_execution(self) -> None:
+        flights: SingleFlight[str, int] = SingleFlight()
+        release = Event()
+        calls = []
+
+        def fetch() -> int:
+            calls.append(1)
+            release.wait(1)
+            return 42
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(flights.do, "1", fetch) for _ in range(4)]
+
+            while flights.coalesced < 3:
+                time.sleep(.001)
+
+            release.set()
+
+        assert [future.result() for future in futures] == [42] * 4
+        assert len(calls) == 1
+
+
+    def test_finished_call_is_not_reused(self) -> None:
+        flights: SingleFlight[str, int] = SingleFlight()
+        calls = []
+
+        flights.do("1", lambda: calls.append(1))
+        flights.do("1", lambda: calls.append(1))
+
+        assert len(calls) == 2
+        assert flights.coalesced == 0
+
+
+    def test_error_is_shared_and_forgotten(self) -> None:
+        flights: SingleFlight[str, int] = SingleFlight()
+
+        def fail() -> int:
+            raise ValueError
+
+        with pytest.raises(ValueError):
+            flights.do("1", fail)
+
+        assert flights.do("1", lambda: 1) == 1
+
+
+class TestAsyncSingleFlight:
+
+    def test_concurrent_calls_share_one_execution(self) -> None:
+        flights: AsyncSingleFlight[str, int] = AsyncSingleFlight()
+        calls = []
+
+        async def fetch() -> int:
+            calls.append(1)
+            await sleep(.01)
+            return 42
+
+        async def main() -> list[int]:
+            return await gather(*(flights.do("1", fetch) for _ in range(4)))
+
+        assert run(main()) == [42] * 4
+        assert len(calls) == 1
+        assert flights.coalesced == 3